@@ -25,82 +25,112 @@ Environment variables:
 """
 
 import json
+import mmap
 import os
 import re
 import subprocess
 import sys
-from pathlib import Path
-
-
-def read_transcript(transcript_path: str) -> str:
-    """Read the conversation transcript."""
+import threading
+
+# Compiled once at import; each hook invocation is a fresh process, so the
+# ``re`` module cache would otherwise recompile these on every run. Test
+# evidence is a single alternation so the transcript is scanned only once.
+# Transcript patterns are bytes patterns because the transcript is mmapped.
+_TEST_RE = re.compile(
+    rb"pytest|TESTS PASSED|TESTS FAILED|test.*(?:passed|failed)|running tests"
+    rb"|npm test|cargo test|go test",
+    re.IGNORECASE,
+)
+_COMPLETION_RE = re.compile(
+    rb"IMPLEMENTATION COMPLETE|REVIEW PASSED|TESTS PASSED|QA PASSED|task completed|task is done",
+    re.IGNORECASE,
+)
+_WORKTREE_RE = re.compile(r"\.worktrees/([A-Z]+-\d+)/")
+_SPEC_ID_RE = re.compile(rb"spec[_-]id[:\s]+([a-zA-Z0-9_-]+)", re.IGNORECASE)
+
+# Spec ID lookups already done in this process, keyed by transcript path and
+# mtime so a transcript that has been appended to is searched again
+_SPEC_ID_CACHE_SIZE = 256
+_spec_id_cache: dict[tuple[str, int], str | None] = {}
+
+
+def read_transcript(transcript_path: str) -> mmap.mmap | bytes:
+    """Map the conversation transcript into memory.
+
+    The transcript is mapped read-only rather than read into a str, so a
+    search that matches early only pages in the start of the file. Missing,
+    unreadable or empty transcripts yield b"".
+    """
     try:
-        with open(transcript_path, 'r') as f:
-            return f.read()
-    except (FileNotFoundError, PermissionError):
-        return ""
+        with open(transcript_path, "rb") as f:
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (FileNotFoundError, PermissionError, ValueError):
+        # ValueError: empty files cannot be mapped
+        return b""
 
 
 def check_uncommitted_changes(project_root: str) -> tuple[bool, str]:
-    """Check if there are uncommitted changes."""
+    """Check if there are uncommitted changes.
+
+    Stops git as soon as it reports the first changed path instead of
+    waiting for the full status listing. --no-optional-locks keeps the
+    check from contending with concurrent git operations in the repo.
+    """
     try:
-        result = subprocess.run(
-            ["git", "status", "--porcelain"],
+        proc = subprocess.Popen(
+            ["git", "--no-optional-locks", "status", "--porcelain", "-z"],
             cwd=project_root,
-            capture_output=True,
-            text=True,
-            timeout=10
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
         )
-        if result.stdout.strip():
-            return True, "There are uncommitted changes. Please commit before finishing."
-        return False, ""
     except Exception:
         return False, ""
 
+    stdout = proc.stdout
+    assert stdout is not None
+
+    timer = threading.Timer(10, proc.kill)
+    timer.start()
+    try:
+        dirty = bool(stdout.read(1))
+    except Exception:
+        dirty = False
+    finally:
+        timer.cancel()
+        if proc.poll() is None:
+            proc.kill()
+        proc.wait()
+        stdout.close()
+
+    if dirty:
+        return True, "There are uncommitted changes. Please commit before finishing."
+    return False, ""
 
-def check_tests_run(transcript: str) -> tuple[bool, str]:
+
+def check_tests_run(transcript: mmap.mmap | bytes) -> tuple[bool, str]:
     """Check if tests were mentioned/run in the transcript."""
-    test_patterns = [
-        r"pytest",
-        r"TESTS PASSED",
-        r"TESTS FAILED",
-        r"test.*passed",
-        r"test.*failed",
-        r"running tests",
-        r"npm test",
-        r"cargo test",
-        r"go test",
-    ]
-
-    for pattern in test_patterns:
-        if re.search(pattern, transcript, re.IGNORECASE):
-            return True, ""
+    if _TEST_RE.search(transcript):
+        return True, ""
 
     return False, "No evidence of tests being run. Please run tests before finishing."
 
 
-def check_task_completion(transcript: str) -> tuple[bool, str]:
+def check_task_completion(transcript: mmap.mmap | bytes) -> tuple[bool, str]:
     """Check for task completion indicators."""
-    completion_patterns = [
-        "IMPLEMENTATION COMPLETE",
-        "REVIEW PASSED",
-        "TESTS PASSED",
-        "QA PASSED",
-        "task completed",
-        "task is done",
-    ]
-
-    for pattern in completion_patterns:
-        if pattern.lower() in transcript.lower():
-            return True, ""
+    if _COMPLETION_RE.search(transcript):
+        return True, ""
 
     return False, "No task completion indicator found. Please ensure the task is complete."
 
 
-def trigger_docs_generation(project_root: str, transcript_path: str) -> None:
+def trigger_docs_generation(
+    project_root: str,
+    transcript_path: str,
+    transcript: mmap.mmap | bytes | None = None,
+) -> None:
     """Trigger documentation generation in the background."""
     # Find the spec ID from the transcript if possible
-    spec_id = extract_spec_id(transcript_path)
+    spec_id = extract_spec_id(transcript_path, transcript)
 
     if spec_id:
         # Log that we're triggering docs
@@ -118,30 +148,47 @@ def trigger_docs_generation(project_root: str, transcript_path: str) -> None:
             print(f"[ClaudeCraft] Warning: Could not trigger docs generation: {e}", file=sys.stderr)
 
 
-def extract_spec_id(transcript_path: str) -> str | None:
-    """Try to extract the spec ID from the transcript path or content."""
+def extract_spec_id(
+    transcript_path: str, transcript: mmap.mmap | bytes | None = None
+) -> str | None:
+    """Try to extract the spec ID from the transcript path or content.
+
+    Cheap checks run first: the path itself, then the per-process cache
+    keyed on the transcript's path and mtime. The transcript is only
+    searched if neither resolves it, and if the caller already has the
+    transcript loaded it is searched directly instead of opening the file
+    again.
+    """
     # The transcript path might contain task/worktree info
     path_str = str(transcript_path)
 
     # Look for worktree pattern: .worktrees/TASK-xxx/
-    match = re.search(r'\.worktrees/([A-Z]+-\d+)/', path_str)
-    if match:
-        task_id = match.group(1)
+    if _WORKTREE_RE.search(path_str):
         # We'd need to look up the spec_id from the task, but for now return None
         return None
 
+    try:
+        cache_key = (path_str, os.stat(path_str).st_mtime_ns)
+    except OSError:
+        return None
+    if cache_key in _spec_id_cache:
+        return _spec_id_cache[cache_key]
+
     # Try to read transcript and find spec ID
+    spec_id = None
     try:
-        with open(transcript_path, 'r') as f:
-            content = f.read()
-            # Look for spec ID patterns
-            match = re.search(r'spec[_-]id[:\s]+([a-zA-Z0-9_-]+)', content, re.IGNORECASE)
-            if match:
-                return match.group(1)
+        content = transcript if transcript is not None else read_transcript(transcript_path)
+        # Look for spec ID patterns
+        match = _SPEC_ID_RE.search(content)
+        if match:
+            spec_id = match.group(1).decode()
     except Exception:
         pass
 
-    return None
+    if len(_spec_id_cache) >= _SPEC_ID_CACHE_SIZE:
+        _spec_id_cache.clear()
+    _spec_id_cache[cache_key] = spec_id
+    return spec_id
 
 
 def main():
@@ -161,13 +208,22 @@ def main():
         return
 
     # Get configuration from environment
-    project_root = os.environ.get("CLAUDECRAFT_PROJECT_ROOT", os.getcwd())
     require_commit = os.environ.get("CLAUDECRAFT_STOP_REQUIRE_COMMIT", "false").lower() == "true"
     require_tests = os.environ.get("CLAUDECRAFT_STOP_REQUIRE_TESTS", "false").lower() == "true"
     generate_docs = os.environ.get("CLAUDECRAFT_STOP_GENERATE_DOCS", "false").lower() == "true"
 
-    # Read the transcript
-    transcript = read_transcript(transcript_path) if transcript_path else ""
+    # Nothing configured: allow stopping without touching git or the transcript
+    if not (require_commit or require_tests or generate_docs):
+        print("{}")
+        return
+
+    project_root = os.environ.get("CLAUDECRAFT_PROJECT_ROOT", os.getcwd())
+
+    # Read the transcript, only if a check needs it
+    if transcript_path and (require_tests or generate_docs):
+        transcript = read_transcript(transcript_path)
+    else:
+        transcript = b""
 
     # Check conditions
     if require_commit:
@@ -186,7 +242,7 @@ def main():
 
     # If all checks pass and docs generation is enabled, trigger it
     if generate_docs and transcript_path:
-        trigger_docs_generation(project_root, transcript_path)
+        trigger_docs_generation(project_root, transcript_path, transcript)
 
     # Allow Claude to stop
     print("{}")
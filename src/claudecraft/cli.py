@@ -4,11 +4,11 @@ import argparse
 import json
 import re
 import sys
+from collections.abc import Callable
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
-from claudecraft.core.config import Config
 from claudecraft.core.models import (
     CompletionCriteria,
     ExecutionLog,
@@ -19,32 +19,43 @@ from claudecraft.core.models import (
     TaskStatus,
     VerificationMethod,
 )
-from claudecraft.core.project import Project
+
+try:
+    import orjson
+except ImportError:  # optional: pip install claudecraft[fast]
+    orjson = None  # type: ignore[assignment]
 
 # Derive CLI choices from enums so they stay in sync
-_SPEC_STATUS_CHOICES = [s.value for s in SpecStatus]
-_TASK_STATUS_CHOICES = [s.value for s in TaskStatus]
+_SPEC_STATUS_CHOICES = tuple(s.value for s in SpecStatus)
+_TASK_STATUS_CHOICES = tuple(s.value for s in TaskStatus)
 
 
-def main(argv: list[str] | None = None) -> int:
-    """Main entry point for ClaudeCraft CLI."""
-    parser = argparse.ArgumentParser(
-        prog="claudecraft",
-        description="TUI-based spec-driven development orchestrator",
-    )
-    parser.add_argument(
-        "--version",
-        action="version",
-        version=f"%(prog)s {__import__('claudecraft').__version__}",
-    )
-    parser.add_argument(
-        "--json",
-        action="store_true",
-        help="Output results in JSON format",
-    )
-    subparsers = parser.add_subparsers(dest="command", help="Available commands")
+def _json_default(obj: Any) -> Any:
+    """Encode model objects (Spec, Task, ...) through their ``to_dict``."""
+    to_dict = getattr(obj, "to_dict", None)
+    if to_dict is None:
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+    return to_dict()
+
+
+def _print_json(data: Any) -> None:
+    """Print ``data`` as indented JSON, encoding with orjson when it is installed.
 
-    # init command
+    Model objects may be passed as-is; each is converted with ``to_dict`` only
+    when the encoder reaches it. Without orjson the output is streamed chunk by
+    chunk rather than joined into one string first.
+    """
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 | orjson.OPT_PASSTHROUGH_DATACLASS
+        print(orjson.dumps(data, default=_json_default, option=option).decode())
+    else:
+        encoder = json.JSONEncoder(indent=2, default=_json_default)
+        sys.stdout.writelines(encoder.iterencode(data))
+        sys.stdout.write("\n")
+
+
+def _add_init_parser(subparsers: Any) -> None:
+    """Add the ``init`` subcommand."""
     init_parser = subparsers.add_parser("init", help="Initialize a new ClaudeCraft project")
     init_parser.add_argument(
         "--path",
@@ -57,19 +68,28 @@ def main(argv: list[str] | None = None) -> int:
         action="store_true",
         help="Update existing Claude templates (skills, hooks, commands, agents)",
     )
+    init_parser.set_defaults(func=lambda args: cmd_init(args.path, args.update, args.json))
+
+
+def _add_status_parser(subparsers: Any) -> None:
+    """Add the ``status`` subcommand."""
+    status_parser = subparsers.add_parser("status", help="Show project status")
+    status_parser.set_defaults(func=lambda args: cmd_status(args.json))
 
-    # status command
-    subparsers.add_parser("status", help="Show project status")
 
-    # list-specs command
+def _add_list_specs_parser(subparsers: Any) -> None:
+    """Add the ``list-specs`` subcommand."""
     list_specs_parser = subparsers.add_parser("list-specs", help="List all specifications")
     list_specs_parser.add_argument(
         "--status",
         choices=_SPEC_STATUS_CHOICES,
         help="Filter by status",
     )
+    list_specs_parser.set_defaults(func=lambda args: cmd_list_specs(args.status, args.json))
 
-    # list-tasks command
+
+def _add_list_tasks_parser(subparsers: Any) -> None:
+    """Add the ``list-tasks`` subcommand."""
     list_tasks_parser = subparsers.add_parser("list-tasks", help="List tasks")
     list_tasks_parser.add_argument(
         "--spec",
@@ -77,11 +97,17 @@ def main(argv: list[str] | None = None) -> int:
     )
     list_tasks_parser.add_argument(
         "--status",
+        type=TaskStatus,
         choices=_TASK_STATUS_CHOICES,
         help="Filter by status",
     )
+    list_tasks_parser.set_defaults(
+        func=lambda args: cmd_list_tasks(args.spec, args.status, args.json)
+    )
 
-    # task-update command
+
+def _add_task_update_parser(subparsers: Any) -> None:
+    """Add the ``task-update`` subcommand."""
     task_update_parser = subparsers.add_parser(
         "task-update", help="Update a task's status"
     )
@@ -91,8 +117,13 @@ def main(argv: list[str] | None = None) -> int:
         choices=_TASK_STATUS_CHOICES,
         help="New status",
     )
+    task_update_parser.set_defaults(
+        func=lambda args: cmd_task_update(args.task_id, args.status, args.json)
+    )
 
-    # execute command
+
+def _add_execute_parser(subparsers: Any) -> None:
+    """Add the ``execute`` subcommand."""
     execute_parser = subparsers.add_parser("execute", help="Execute tasks (headless mode)")
     execute_parser.add_argument(
         "--spec",
@@ -108,8 +139,20 @@ def main(argv: list[str] | None = None) -> int:
         default=6,
         help="Maximum parallel agents (default: 6)",
     )
+    execute_parser.add_argument(
+        "--persistent-sessions",
+        action="store_true",
+        help="Reuse Claude processes across stage iterations and merge conflict resolutions",
+    )
+    execute_parser.set_defaults(
+        func=lambda args: cmd_execute(
+            args.spec, args.task, args.max_parallel, args.json, args.persistent_sessions
+        )
+    )
+
 
-    # tui command
+def _add_tui_parser(subparsers: Any) -> None:
+    """Add the ``tui`` subcommand."""
     tui_parser = subparsers.add_parser("tui", help="Launch TUI interface")
     tui_parser.add_argument(
         "--path",
@@ -117,8 +160,11 @@ def main(argv: list[str] | None = None) -> int:
         default=Path.cwd(),
         help="Project directory (default: current directory)",
     )
+    tui_parser.set_defaults(func=lambda args: cmd_tui(args.path))
 
-    # agent-start command
+
+def _add_agent_start_parser(subparsers: Any) -> None:
+    """Add the ``agent-start`` subcommand."""
     agent_start_parser = subparsers.add_parser(
         "agent-start", help="Register an active agent (for Claude Code integration)"
     )
@@ -133,8 +179,13 @@ def main(argv: list[str] | None = None) -> int:
         "--worktree",
         help="Path to the worktree",
     )
+    agent_start_parser.set_defaults(
+        func=lambda args: cmd_agent_start(args.task_id, args.type, args.worktree, args.json)
+    )
 
-    # agent-stop command
+
+def _add_agent_stop_parser(subparsers: Any) -> None:
+    """Add the ``agent-stop`` subcommand."""
     agent_stop_parser = subparsers.add_parser(
         "agent-stop", help="Deregister an active agent"
     )
@@ -144,11 +195,19 @@ def main(argv: list[str] | None = None) -> int:
     agent_stop_parser.add_argument(
         "--slot", type=int, help="Slot number to deregister"
     )
+    agent_stop_parser.set_defaults(
+        func=lambda args: cmd_agent_stop(args.task_id, args.slot, args.json)
+    )
+
+
+def _add_list_agents_parser(subparsers: Any) -> None:
+    """Add the ``list-agents`` subcommand."""
+    list_agents_parser = subparsers.add_parser("list-agents", help="List active agents")
+    list_agents_parser.set_defaults(func=lambda args: cmd_list_agents(args.json))
 
-    # list-agents command
-    subparsers.add_parser("list-agents", help="List active agents")
 
-    # ralph-status command
+def _add_ralph_status_parser(subparsers: Any) -> None:
+    """Add the ``ralph-status`` subcommand."""
     ralph_status_parser = subparsers.add_parser(
         "ralph-status", help="Show active Ralph verification loops"
     )
@@ -160,7 +219,17 @@ def main(argv: list[str] | None = None) -> int:
         choices=["running", "completed", "cancelled", "failed"],
         help="Filter by loop status",
     )
-    # ralph-cancel command
+    ralph_status_parser.set_defaults(
+        func=lambda args: cmd_ralph_status(
+            task_id=getattr(args, "task_id", None),
+            status=getattr(args, "status", None),
+            json_output=args.json,
+        )
+    )
+
+
+def _add_ralph_cancel_parser(subparsers: Any) -> None:
+    """Add the ``ralph-cancel`` subcommand."""
     ralph_cancel_parser = subparsers.add_parser(
         "ralph-cancel", help="Cancel an active Ralph verification loop"
     )
@@ -170,8 +239,17 @@ def main(argv: list[str] | None = None) -> int:
         choices=["coder", "reviewer", "tester", "qa"],
         help="Cancel only specific agent type (default: all)",
     )
+    ralph_cancel_parser.set_defaults(
+        func=lambda args: cmd_ralph_cancel(
+            task_id=args.task_id,
+            agent_type=getattr(args, "agent_type", None),
+            json_output=args.json,
+        )
+    )
 
-    # spec-create command
+
+def _add_spec_create_parser(subparsers: Any) -> None:
+    """Add the ``spec-create`` subcommand."""
     spec_create_parser = subparsers.add_parser(
         "spec-create", help="Create a new specification"
     )
@@ -189,8 +267,19 @@ def main(argv: list[str] | None = None) -> int:
         default="draft",
         help="Initial status (default: draft)",
     )
+    spec_create_parser.set_defaults(
+        func=lambda args: cmd_spec_create(
+            args.spec_id,
+            args.title,
+            args.source_type,
+            args.status,
+            args.json,
+        )
+    )
 
-    # spec-update command
+
+def _add_spec_update_parser(subparsers: Any) -> None:
+    """Add the ``spec-update`` subcommand."""
     spec_update_parser = subparsers.add_parser(
         "spec-update", help="Update a specification"
     )
@@ -205,19 +294,34 @@ def main(argv: list[str] | None = None) -> int:
         "--metadata",
         help="JSON string of metadata to merge (e.g. '{\"review\": true}')",
     )
+    spec_update_parser.set_defaults(
+        func=lambda args: cmd_spec_update(
+            args.spec_id, args.status, args.title, args.metadata, args.json
+        )
+    )
+
 
-    # spec-get command
+def _add_spec_get_parser(subparsers: Any) -> None:
+    """Add the ``spec-get`` subcommand."""
     spec_get_parser = subparsers.add_parser("spec-get", help="Get specification details")
     spec_get_parser.add_argument("spec_id", help="Spec ID to get")
+    spec_get_parser.set_defaults(func=lambda args: cmd_spec_get(args.spec_id, args.json))
 
-    # quick-create command
+
+def _add_quick_create_parser(subparsers: Any) -> None:
+    """Add the ``quick-create`` subcommand."""
     quick_create_parser = subparsers.add_parser(
         "quick-create", help="Create a lightweight quick-task spec"
     )
     quick_create_parser.add_argument("description", help="Task description")
     quick_create_parser.add_argument("--id", dest="spec_id", help="Custom spec ID (auto-generated if omitted)")
+    quick_create_parser.set_defaults(
+        func=lambda args: cmd_quick_create(args.description, args.spec_id, args.json)
+    )
+
 
-    # task-create command
+def _add_task_create_parser(subparsers: Any) -> None:
+    """Add the ``task-create`` subcommand."""
     task_create_parser = subparsers.add_parser("task-create", help="Create a new task")
     task_create_parser.add_argument("task_id", help="Unique task ID (e.g., TASK-001)")
     task_create_parser.add_argument("spec_id", help="Spec ID this task belongs to")
@@ -279,8 +383,36 @@ def main(argv: list[str] | None = None) -> int:
         "--qa-verification", choices=["string_match", "semantic", "external", "multi_stage"],
         help="Verification method for QA (default: multi_stage)"
     )
+    task_create_parser.set_defaults(
+        func=lambda args: cmd_task_create(
+            args.task_id,
+            args.spec_id,
+            args.title,
+            args.description,
+            args.priority,
+            args.dependencies,
+            args.assignee,
+            args.json,
+            # Completion options
+            outcome=args.outcome,
+            acceptance_criteria=args.acceptance_criteria,
+            completion_file=args.completion_file,
+            coder_promise=args.coder_promise,
+            coder_verification=args.coder_verification,
+            coder_command=args.coder_command,
+            reviewer_promise=args.reviewer_promise,
+            reviewer_verification=args.reviewer_verification,
+            tester_promise=args.tester_promise,
+            tester_verification=args.tester_verification,
+            tester_command=args.tester_command,
+            qa_promise=args.qa_promise,
+            qa_verification=args.qa_verification,
+        )
+    )
+
 
-    # task-followup command (for agents to create follow-up tasks)
+def _add_task_followup_parser(subparsers: Any) -> None:
+    """Add the ``task-followup`` subcommand."""
     task_followup_parser = subparsers.add_parser(
         "task-followup",
         help="Create a follow-up task (used by agents during implementation)"
@@ -321,11 +453,34 @@ def main(argv: list[str] | None = None) -> int:
     task_followup_parser.add_argument(
         "--coder-command", help="External command for coder verification"
     )
+    task_followup_parser.set_defaults(
+        func=lambda args: cmd_task_followup(
+            args.task_id,
+            args.spec_id,
+            args.title,
+            args.description,
+            args.priority,
+            args.parent,
+            args.category,
+            args.json,
+            # Completion options
+            outcome=args.outcome,
+            acceptance_criteria=args.acceptance_criteria,
+            coder_promise=args.coder_promise,
+            coder_verification=args.coder_verification,
+            coder_command=args.coder_command,
+        )
+    )
+
 
-    # memory-stats command
-    subparsers.add_parser("memory-stats", help="Show memory store statistics")
+def _add_memory_stats_parser(subparsers: Any) -> None:
+    """Add the ``memory-stats`` subcommand."""
+    memory_stats_parser = subparsers.add_parser("memory-stats", help="Show memory store statistics")
+    memory_stats_parser.set_defaults(func=lambda args: cmd_memory_stats(args.json))
 
-    # memory-list command
+
+def _add_memory_list_parser(subparsers: Any) -> None:
+    """Add the ``memory-list`` subcommand."""
     memory_list_parser = subparsers.add_parser("memory-list", help="List memory entities")
     memory_list_parser.add_argument(
         "--type",
@@ -336,8 +491,13 @@ def main(argv: list[str] | None = None) -> int:
     memory_list_parser.add_argument(
         "--limit", type=int, default=20, help="Maximum number of results (default: 20)"
     )
+    memory_list_parser.set_defaults(
+        func=lambda args: cmd_memory_list(args.type, args.spec, args.limit, args.json)
+    )
 
-    # memory-search command
+
+def _add_memory_search_parser(subparsers: Any) -> None:
+    """Add the ``memory-search`` subcommand."""
     memory_search_parser = subparsers.add_parser("memory-search", help="Search memory")
     memory_search_parser.add_argument("keyword", help="Keyword to search for")
     memory_search_parser.add_argument(
@@ -348,8 +508,13 @@ def main(argv: list[str] | None = None) -> int:
     memory_search_parser.add_argument(
         "--limit", type=int, default=10, help="Maximum results (default: 10)"
     )
+    memory_search_parser.set_defaults(
+        func=lambda args: cmd_memory_search(args.keyword, args.type, args.limit, args.json)
+    )
 
-    # memory-add command
+
+def _add_memory_add_parser(subparsers: Any) -> None:
+    """Add the ``memory-add`` subcommand."""
     memory_add_parser = subparsers.add_parser("memory-add", help="Add a memory entry")
     memory_add_parser.add_argument(
         "type",
@@ -362,28 +527,54 @@ def main(argv: list[str] | None = None) -> int:
     memory_add_parser.add_argument(
         "--relevance", type=float, default=1.0, help="Relevance score 0-1 (default: 1.0)"
     )
+    memory_add_parser.set_defaults(
+        func=lambda args: cmd_memory_add(
+            args.type, args.name, args.description, args.spec, args.relevance, args.json
+        )
+    )
+
 
-    # memory-cleanup command
+def _add_memory_cleanup_parser(subparsers: Any) -> None:
+    """Add the ``memory-cleanup`` subcommand."""
     memory_cleanup_parser = subparsers.add_parser(
         "memory-cleanup", help="Clean up old memory entries"
     )
     memory_cleanup_parser.add_argument(
         "--days", type=int, default=90, help="Remove entries older than N days (default: 90)"
     )
+    memory_cleanup_parser.set_defaults(func=lambda args: cmd_memory_cleanup(args.days, args.json))
+
+
+def _add_sync_export_parser(subparsers: Any) -> None:
+    """Add the ``sync-export`` subcommand."""
+    sync_export_parser = subparsers.add_parser("sync-export", help="Export database to JSONL file")
+    sync_export_parser.set_defaults(func=lambda args: cmd_sync_export(args.json))
+
+
+def _add_sync_import_parser(subparsers: Any) -> None:
+    """Add the ``sync-import`` subcommand."""
+    sync_import_parser = subparsers.add_parser(
+        "sync-import", help="Import from JSONL file to database"
+    )
+    sync_import_parser.set_defaults(func=lambda args: cmd_sync_import(args.json))
+
 
-    # sync-export command
-    subparsers.add_parser("sync-export", help="Export database to JSONL file")
+def _add_sync_compact_parser(subparsers: Any) -> None:
+    """Add the ``sync-compact`` subcommand."""
+    sync_compact_parser = subparsers.add_parser(
+        "sync-compact", help="Compact JSONL file (remove superseded changes)"
+    )
+    sync_compact_parser.set_defaults(func=lambda args: cmd_sync_compact(args.json))
 
-    # sync-import command
-    subparsers.add_parser("sync-import", help="Import from JSONL file to database")
 
-    # sync-compact command
-    subparsers.add_parser("sync-compact", help="Compact JSONL file (remove superseded changes)")
+def _add_sync_status_parser(subparsers: Any) -> None:
+    """Add the ``sync-status`` subcommand."""
+    sync_status_parser = subparsers.add_parser("sync-status", help="Show JSONL sync status")
+    sync_status_parser.set_defaults(func=lambda args: cmd_sync_status(args.json))
 
-    # sync-status command
-    subparsers.add_parser("sync-status", help="Show JSONL sync status")
 
-    # worktree-create command
+def _add_worktree_create_parser(subparsers: Any) -> None:
+    """Add the ``worktree-create`` subcommand."""
     worktree_create_parser = subparsers.add_parser(
         "worktree-create", help="Create a git worktree for a task"
     )
@@ -399,8 +590,16 @@ def main(argv: list[str] | None = None) -> int:
         action="store_true",
         help="Skip running bootstrap commands after creating worktree",
     )
+    worktree_create_parser.set_defaults(
+        func=lambda args: cmd_worktree_create(
+            args.task_id, args.base, args.json,
+            spec=args.spec, no_bootstrap=args.no_bootstrap,
+        )
+    )
+
 
-    # worktree-remove command
+def _add_worktree_remove_parser(subparsers: Any) -> None:
+    """Add the ``worktree-remove`` subcommand."""
     worktree_remove_parser = subparsers.add_parser(
         "worktree-remove", help="Remove a git worktree"
     )
@@ -408,11 +607,19 @@ def main(argv: list[str] | None = None) -> int:
     worktree_remove_parser.add_argument(
         "--force", action="store_true", help="Force removal even with uncommitted changes"
     )
+    worktree_remove_parser.set_defaults(
+        func=lambda args: cmd_worktree_remove(args.task_id, args.force, args.json)
+    )
+
 
-    # worktree-list command
-    subparsers.add_parser("worktree-list", help="List all worktrees")
+def _add_worktree_list_parser(subparsers: Any) -> None:
+    """Add the ``worktree-list`` subcommand."""
+    worktree_list_parser = subparsers.add_parser("worktree-list", help="List all worktrees")
+    worktree_list_parser.set_defaults(func=lambda args: cmd_worktree_list(args.json))
 
-    # worktree-bootstrap command
+
+def _add_worktree_bootstrap_parser(subparsers: Any) -> None:
+    """Add the ``worktree-bootstrap`` subcommand."""
     worktree_bootstrap_parser = subparsers.add_parser(
         "worktree-bootstrap", help="Run bootstrap commands in an existing worktree"
     )
@@ -422,15 +629,25 @@ def main(argv: list[str] | None = None) -> int:
         action="store_true",
         help="Stop on first command failure",
     )
+    worktree_bootstrap_parser.set_defaults(
+        func=lambda args: cmd_worktree_bootstrap(args.task_id, args.fail_fast, args.json)
+    )
+
 
-    # worktree-commit command
+def _add_worktree_commit_parser(subparsers: Any) -> None:
+    """Add the ``worktree-commit`` subcommand."""
     worktree_commit_parser = subparsers.add_parser(
         "worktree-commit", help="Commit changes in a worktree"
     )
     worktree_commit_parser.add_argument("task_id", help="Task ID of the worktree")
     worktree_commit_parser.add_argument("message", help="Commit message")
+    worktree_commit_parser.set_defaults(
+        func=lambda args: cmd_worktree_commit(args.task_id, args.message, args.json)
+    )
+
 
-    # merge-task command
+def _add_merge_task_parser(subparsers: Any) -> None:
+    """Add the ``merge-task`` subcommand."""
     merge_task_parser = subparsers.add_parser(
         "merge-task", help="Merge a task branch into main"
     )
@@ -441,11 +658,21 @@ def main(argv: list[str] | None = None) -> int:
     merge_task_parser.add_argument(
         "--cleanup", action="store_true", help="Remove worktree and branch after merge"
     )
+    merge_task_parser.set_defaults(
+        func=lambda args: cmd_merge_task(args.task_id, args.target, args.cleanup, args.json)
+    )
+
+
+def _add_migrate_parser(subparsers: Any) -> None:
+    """Add the ``migrate`` subcommand."""
+    migrate_parser = subparsers.add_parser(
+        "migrate", help="Migrate from SQLite to flat-file storage"
+    )
+    migrate_parser.set_defaults(func=lambda args: cmd_migrate(args.json))
 
-    # migrate command
-    subparsers.add_parser("migrate", help="Migrate from SQLite to flat-file storage")
 
-    # generate-docs command
+def _add_generate_docs_parser(subparsers: Any) -> None:
+    """Add the ``generate-docs`` subcommand."""
     generate_docs_parser = subparsers.add_parser(
         "generate-docs", help="Generate developer documentation for the codebase"
     )
@@ -460,141 +687,99 @@ def main(argv: list[str] | None = None) -> int:
         choices=["opus", "sonnet", "haiku"],
         help="Model to use for generation (default: from config)",
     )
+    generate_docs_parser.set_defaults(
+        func=lambda args: cmd_generate_docs(args.spec, args.output, args.model, args.json)
+    )
+
+
+# Subcommand name -> parser builder. main() builds only the parser for the
+# command being run and falls back to all of them for help and errors.
+_SUBPARSER_BUILDERS: dict[str, Callable[[Any], None]] = {
+    "init": _add_init_parser,
+    "status": _add_status_parser,
+    "list-specs": _add_list_specs_parser,
+    "list-tasks": _add_list_tasks_parser,
+    "task-update": _add_task_update_parser,
+    "execute": _add_execute_parser,
+    "tui": _add_tui_parser,
+    "agent-start": _add_agent_start_parser,
+    "agent-stop": _add_agent_stop_parser,
+    "list-agents": _add_list_agents_parser,
+    "ralph-status": _add_ralph_status_parser,
+    "ralph-cancel": _add_ralph_cancel_parser,
+    "spec-create": _add_spec_create_parser,
+    "spec-update": _add_spec_update_parser,
+    "spec-get": _add_spec_get_parser,
+    "quick-create": _add_quick_create_parser,
+    "task-create": _add_task_create_parser,
+    "task-followup": _add_task_followup_parser,
+    "memory-stats": _add_memory_stats_parser,
+    "memory-list": _add_memory_list_parser,
+    "memory-search": _add_memory_search_parser,
+    "memory-add": _add_memory_add_parser,
+    "memory-cleanup": _add_memory_cleanup_parser,
+    "sync-export": _add_sync_export_parser,
+    "sync-import": _add_sync_import_parser,
+    "sync-compact": _add_sync_compact_parser,
+    "sync-status": _add_sync_status_parser,
+    "worktree-create": _add_worktree_create_parser,
+    "worktree-remove": _add_worktree_remove_parser,
+    "worktree-list": _add_worktree_list_parser,
+    "worktree-bootstrap": _add_worktree_bootstrap_parser,
+    "worktree-commit": _add_worktree_commit_parser,
+    "merge-task": _add_merge_task_parser,
+    "migrate": _add_migrate_parser,
+    "generate-docs": _add_generate_docs_parser,
+}
+
+
+def _sniff_subcommand(argv: list[str]) -> str | None:
+    """Return the first positional argument, which names the subcommand."""
+    for arg in argv:
+        if not arg.startswith("-"):
+            return arg
+    return None
 
-    args = parser.parse_args(argv)
 
-    if args.command == "init":
-        return cmd_init(args.path, args.update, args.json)
-    elif args.command == "status":
-        return cmd_status(args.json)
-    elif args.command == "list-specs":
-        return cmd_list_specs(args.status, args.json)
-    elif args.command == "list-tasks":
-        return cmd_list_tasks(args.spec, args.status, args.json)
-    elif args.command == "task-update":
-        return cmd_task_update(args.task_id, args.status, args.json)
-    elif args.command == "execute":
-        return cmd_execute(args.spec, args.task, args.max_parallel, args.json)
-    elif args.command == "tui":
-        return cmd_tui(args.path)
-    elif args.command == "agent-start":
-        return cmd_agent_start(args.task_id, args.type, args.worktree, args.json)
-    elif args.command == "agent-stop":
-        return cmd_agent_stop(args.task_id, args.slot, args.json)
-    elif args.command == "list-agents":
-        return cmd_list_agents(args.json)
-    elif args.command == "ralph-status":
-        return cmd_ralph_status(
-            task_id=getattr(args, "task_id", None),
-            status=getattr(args, "status", None),
-            json_output=args.json,
-        )
-    elif args.command == "ralph-cancel":
-        return cmd_ralph_cancel(
-            task_id=args.task_id,
-            agent_type=getattr(args, "agent_type", None),
-            json_output=args.json,
-        )
-    elif args.command == "spec-create":
-        return cmd_spec_create(
-            args.spec_id,
-            args.title,
-            args.source_type,
-            args.status,
-            args.json,
-        )
-    elif args.command == "spec-update":
-        return cmd_spec_update(args.spec_id, args.status, args.title, args.metadata, args.json)
-    elif args.command == "quick-create":
-        return cmd_quick_create(args.description, args.spec_id, args.json)
-    elif args.command == "spec-get":
-        return cmd_spec_get(args.spec_id, args.json)
-    elif args.command == "task-create":
-        return cmd_task_create(
-            args.task_id,
-            args.spec_id,
-            args.title,
-            args.description,
-            args.priority,
-            args.dependencies,
-            args.assignee,
-            args.json,
-            # Completion options
-            outcome=args.outcome,
-            acceptance_criteria=args.acceptance_criteria,
-            completion_file=args.completion_file,
-            coder_promise=args.coder_promise,
-            coder_verification=args.coder_verification,
-            coder_command=args.coder_command,
-            reviewer_promise=args.reviewer_promise,
-            reviewer_verification=args.reviewer_verification,
-            tester_promise=args.tester_promise,
-            tester_verification=args.tester_verification,
-            tester_command=args.tester_command,
-            qa_promise=args.qa_promise,
-            qa_verification=args.qa_verification,
-        )
-    elif args.command == "task-followup":
-        return cmd_task_followup(
-            args.task_id,
-            args.spec_id,
-            args.title,
-            args.description,
-            args.priority,
-            args.parent,
-            args.category,
-            args.json,
-            # Completion options
-            outcome=args.outcome,
-            acceptance_criteria=args.acceptance_criteria,
-            coder_promise=args.coder_promise,
-            coder_verification=args.coder_verification,
-            coder_command=args.coder_command,
-        )
-    elif args.command == "memory-stats":
-        return cmd_memory_stats(args.json)
-    elif args.command == "memory-list":
-        return cmd_memory_list(args.type, args.spec, args.limit, args.json)
-    elif args.command == "memory-search":
-        return cmd_memory_search(args.keyword, args.type, args.limit, args.json)
-    elif args.command == "memory-add":
-        return cmd_memory_add(args.type, args.name, args.description, args.spec, args.relevance, args.json)
-    elif args.command == "memory-cleanup":
-        return cmd_memory_cleanup(args.days, args.json)
-    elif args.command == "sync-export":
-        return cmd_sync_export(args.json)
-    elif args.command == "sync-import":
-        return cmd_sync_import(args.json)
-    elif args.command == "sync-compact":
-        return cmd_sync_compact(args.json)
-    elif args.command == "sync-status":
-        return cmd_sync_status(args.json)
-    elif args.command == "worktree-create":
-        return cmd_worktree_create(
-            args.task_id, args.base, args.json,
-            spec=args.spec, no_bootstrap=args.no_bootstrap,
-        )
-    elif args.command == "worktree-remove":
-        return cmd_worktree_remove(args.task_id, args.force, args.json)
-    elif args.command == "worktree-list":
-        return cmd_worktree_list(args.json)
-    elif args.command == "worktree-bootstrap":
-        return cmd_worktree_bootstrap(args.task_id, args.fail_fast, args.json)
-    elif args.command == "worktree-commit":
-        return cmd_worktree_commit(args.task_id, args.message, args.json)
-    elif args.command == "merge-task":
-        return cmd_merge_task(args.task_id, args.target, args.cleanup, args.json)
-    elif args.command == "generate-docs":
-        return cmd_generate_docs(args.spec, args.output, args.model, args.json)
-    elif args.command == "migrate":
-        return cmd_migrate(args.json)
+def main(argv: list[str] | None = None) -> int:
+    """Main entry point for ClaudeCraft CLI."""
+    parser = argparse.ArgumentParser(
+        prog="claudecraft",
+        description="TUI-based spec-driven development orchestrator",
+    )
+    parser.add_argument(
+        "--version",
+        action="version",
+        version=f"%(prog)s {__import__('claudecraft').__version__}",
+    )
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Output results in JSON format",
+    )
+    subparsers = parser.add_subparsers(dest="command", help="Available commands")
+    if argv is None:
+        argv = sys.argv[1:]
+    command = _sniff_subcommand(argv)
+    if command in _SUBPARSER_BUILDERS:
+        _SUBPARSER_BUILDERS[command](subparsers)
     else:
+        for build in _SUBPARSER_BUILDERS.values():
+            build(subparsers)
+
+    args = parser.parse_args(argv)
+
+    func: Callable[[argparse.Namespace], int] | None = getattr(args, "func", None)
+    if func is None:
         # Default to TUI if no command specified
         return cmd_tui(Path.cwd())
+    return func(args)
 
 
 def cmd_init(path: Path, update: bool = False, json_output: bool = False) -> int:
     """Initialize a new ClaudeCraft project."""
+    from claudecraft.core.project import Project
+
     try:
         project = Project.init(path, update_templates=update)
         constitution_path = project.root / ".claudecraft" / "constitution.md"
@@ -607,7 +792,7 @@ def cmd_init(path: Path, update: bool = False, json_output: bool = False) -> int
                 "constitution_path": str(constitution_path),
                 "templates_updated": update,
             }
-            print(json.dumps(result, indent=2))
+            _print_json(result)
         else:
             if update:
                 print(f"Updated ClaudeCraft templates at {project.root}")
@@ -634,7 +819,7 @@ def cmd_init(path: Path, update: bool = False, json_output: bool = False) -> int
     except Exception as e:
         if json_output:
             result = {"success": False, "error": str(e)}
-            print(json.dumps(result, indent=2))
+            _print_json(result)
         else:
             print(f"Error initializing project: {e}", file=sys.stderr)
         return 1
@@ -642,13 +827,16 @@ def cmd_init(path: Path, update: bool = False, json_output: bool = False) -> int
 
 def cmd_status(json_output: bool = False) -> int:
     """Show project status."""
+    from claudecraft.core.project import Project
+
     try:
-        config = Config.load()
         project = Project.load()
+        config = project.config
 
         # Get stats
-        specs = project.db.list_specs()
-        tasks = [t for spec in specs for t in project.db.list_tasks(spec.id)]
+        total_specs = len(project.db.list_spec_ids())
+        by_status = project.db.count_tasks_by_status()
+        total_tasks = sum(by_status.values())
 
         if json_output:
             result = {
@@ -656,31 +844,20 @@ def cmd_status(json_output: bool = False) -> int:
                 "project_name": config.project_name,
                 "config_path": str(config.config_path),
                 "stats": {
-                    "total_specs": len(specs),
-                    "total_tasks": len(tasks),
-                    "tasks_by_status": {},
+                    "total_specs": total_specs,
+                    "total_tasks": total_tasks,
+                    "tasks_by_status": by_status,
                 },
             }
-
-            for task in tasks:
-                status = task.status.value
-                result["stats"]["tasks_by_status"][status] = (
-                    result["stats"]["tasks_by_status"].get(status, 0) + 1
-                )
-
-            print(json.dumps(result, indent=2))
+            _print_json(result)
         else:
             print(f"Project: {config.project_name}")
             print(f"Config: {config.config_path}")
-            print(f"\nSpecs: {len(specs)}")
-            print(f"Tasks: {len(tasks)}")
+            print(f"\nSpecs: {total_specs}")
+            print(f"Tasks: {total_tasks}")
 
-            if tasks:
+            if total_tasks:
                 print("\nTasks by status:")
-                by_status: dict[str, int] = {}
-                for task in tasks:
-                    status = task.status.value
-                    by_status[status] = by_status.get(status, 0) + 1
                 for status, count in sorted(by_status.items()):
                     print(f"  {status}: {count}")
 
@@ -688,14 +865,14 @@ def cmd_status(json_output: bool = False) -> int:
     except FileNotFoundError:
         if json_output:
             result = {"success": False, "error": "Not a ClaudeCraft project"}
-            print(json.dumps(result, indent=2))
+            _print_json(result)
         else:
             print("Not a ClaudeCraft project (no .claudecraft directory found)", file=sys.stderr)
         return 1
     except Exception as e:
         if json_output:
             result = {"success": False, "error": str(e)}
-            print(json.dumps(result, indent=2))
+            _print_json(result)
         else:
             print(f"Error: {e}", file=sys.stderr)
         return 1
@@ -703,21 +880,21 @@ def cmd_status(json_output: bool = False) -> int:
 
 def cmd_list_specs(status_filter: str | None = None, json_output: bool = False) -> int:
     """List all specifications."""
+    from claudecraft.core.project import Project
+
     try:
         project = Project.load()
-        specs = project.db.list_specs()
-
-        # Filter by status if provided
-        if status_filter:
-            specs = [s for s in specs if s.status == status_filter]
+        specs = project.db.list_specs(
+            status=SpecStatus(status_filter) if status_filter else None
+        )
 
         if json_output:
             result = {
                 "success": True,
                 "count": len(specs),
-                "specs": [s.to_dict() for s in specs],
+                "specs": specs,
             }
-            print(json.dumps(result, indent=2))
+            _print_json(result)
         else:
             if not specs:
                 print("No specs found")
@@ -734,35 +911,39 @@ def cmd_list_specs(status_filter: str | None = None, json_output: bool = False)
     except FileNotFoundError:
         if json_output:
             result = {"success": False, "error": "Not a ClaudeCraft project"}
-            print(json.dumps(result, indent=2))
+            _print_json(result)
         else:
             print("Not a ClaudeCraft project (no .claudecraft directory found)", file=sys.stderr)
         return 1
     except Exception as e:
         if json_output:
             result = {"success": False, "error": str(e)}
-            print(json.dumps(result, indent=2))
+            _print_json(result)
         else:
             print(f"Error: {e}", file=sys.stderr)
         return 1
 
 
 def cmd_list_tasks(
-    spec_id: str | None = None, status_filter: str | None = None, json_output: bool = False
+    spec_id: str | None = None,
+    status_filter: TaskStatus | str | None = None,
+    json_output: bool = False,
 ) -> int:
     """List tasks."""
+    from claudecraft.core.project import Project
+
     try:
         project = Project.load()
 
-        # Convert status string to TaskStatus enum
-        status_enum = None
-        if status_filter:
+        # argparse already hands us a TaskStatus; only plain strings need converting
+        status_enum = status_filter if isinstance(status_filter, TaskStatus) else None
+        if status_filter and status_enum is None:
             try:
                 status_enum = TaskStatus(status_filter)
             except ValueError:
                 if json_output:
                     result = {"success": False, "error": f"Invalid status: {status_filter}"}
-                    print(json.dumps(result, indent=2))
+                    _print_json(result)
                 else:
                     print(f"Error: Invalid status '{status_filter}'", file=sys.stderr)
                 return 1
@@ -777,9 +958,9 @@ def cmd_list_tasks(
             result = {
                 "success": True,
                 "count": len(tasks),
-                "tasks": [t.to_dict() for t in tasks],
+                "tasks": tasks,
             }
-            print(json.dumps(result, indent=2))
+            _print_json(result)
         else:
             if not tasks:
                 print("No tasks found")
@@ -798,14 +979,14 @@ def cmd_list_tasks(
     except FileNotFoundError:
         if json_output:
             result = {"success": False, "error": "Not a ClaudeCraft project"}
-            print(json.dumps(result, indent=2))
+            _print_json(result)
         else:
             print("Not a ClaudeCraft project (no .claudecraft directory found)", file=sys.stderr)
         return 1
     except Exception as e:
         if json_output:
             result = {"success": False, "error": str(e)}
-            print(json.dumps(result, indent=2))
+            _print_json(result)
         else:
             print(f"Error: {e}", file=sys.stderr)
         return 1
@@ -813,6 +994,8 @@ def cmd_list_tasks(
 
 def cmd_task_update(task_id: str, status: str, json_output: bool = False) -> int:
     """Update a task's status."""
+    from claudecraft.core.project import Project
+
     try:
         project = Project.load()
 
@@ -824,7 +1007,7 @@ def cmd_task_update(task_id: str, status: str, json_output: bool = False) -> int
         if not existing:
             if json_output:
                 result = {"success": False, "error": f"Task not found: {task_id}"}
-                print(json.dumps(result, indent=2))
+                _print_json(result)
             else:
                 print(f"Error: Task not found: {task_id}", file=sys.stderr)
             return 1
@@ -839,21 +1022,21 @@ def cmd_task_update(task_id: str, status: str, json_output: bool = False) -> int
                 "status": status,
                 "task": task.to_dict(),
             }
-            print(json.dumps(result, indent=2))
+            _print_json(result)
         else:
             print(f"Task {task_id} updated to {status}")
         return 0
     except FileNotFoundError:
         if json_output:
             result = {"success": False, "error": "Not a ClaudeCraft project"}
-            print(json.dumps(result, indent=2))
+            _print_json(result)
         else:
             print("Not a ClaudeCraft project (no .claudecraft directory found)", file=sys.stderr)
         return 1
     except Exception as e:
         if json_output:
             result = {"success": False, "error": str(e)}
-            print(json.dumps(result, indent=2))
+            _print_json(result)
         else:
             print(f"Error: {e}", file=sys.stderr)
         return 1
@@ -864,11 +1047,14 @@ def cmd_execute(
     task_id: str | None = None,
     max_parallel: int = 6,
     json_output: bool = False,
+    persistent_sessions: bool = False,
 ) -> int:
     """Execute tasks in headless mode with parallel execution."""
     import threading
     from concurrent.futures import ThreadPoolExecutor, as_completed
 
+    from claudecraft.core.project import Project
+
     try:
         project = Project.load()
 
@@ -880,11 +1066,18 @@ def cmd_execute(
 
         # Initialize components
         worktree_mgr = WorktreeManager(project.root)
-        merge_orchestrator = MergeOrchestrator(project.root)
+        merge_orchestrator = MergeOrchestrator(
+            project.root, persistent_sessions=persistent_sessions
+        )
         agent_pool = AgentPool(max_agents=max_parallel)
         # Use timeout from config (converted from minutes to seconds)
         timeout_seconds = project.config.timeout_minutes * 60
-        pipeline = ExecutionPipeline(project, agent_pool, timeout=timeout_seconds)
+        pipeline = ExecutionPipeline(
+            project,
+            agent_pool,
+            timeout=timeout_seconds,
+            persistent_sessions=persistent_sessions,
+        )
 
         # Thread-safe results collection
         results = []
@@ -892,6 +1085,14 @@ def cmd_execute(
         print_lock = threading.Lock()
         merge_lock = threading.Lock()  # Serialize merge operations to avoid conflicts
 
+        def log(*lines: str) -> None:
+            """Write progress lines with a single stdout write (no-op in JSON mode)."""
+            if json_output:
+                return
+            text = "\n".join(lines) + "\n"
+            with print_lock:
+                sys.stdout.write(text)
+
         def execute_single_task(task):
             """Execute a single task (runs in thread)."""
             task_result = {
@@ -902,9 +1103,7 @@ def cmd_execute(
             }
 
             try:
-                if not json_output:
-                    with print_lock:
-                        print(f"[START] Task {task.id}: {task.title}")
+                log(f"[START] Task {task.id}: {task.title}")
 
                 # Create worktree
                 worktree_path = worktree_mgr.create_worktree(task.id)
@@ -916,10 +1115,13 @@ def cmd_execute(
                     failed = [r for r in bootstrap_results if r["returncode"] != 0]
                     if failed:
                         for r in failed:
-                            with print_lock:
-                                print(f"[WARN] Task {task.id}: bootstrap command failed: {r['command']} (exit {r['returncode']})")
-                                if r["stderr"]:
-                                    print(f"  stderr: {str(r['stderr'])[:200]}")
+                            lines = [
+                                f"[WARN] Task {task.id}: bootstrap command failed: "
+                                f"{r['command']} (exit {r['returncode']})"
+                            ]
+                            if r["stderr"]:
+                                lines.append(f"  stderr: {str(r['stderr'])[:200]}")
+                            log(*lines)
 
                 # Execute through pipeline
                 success = pipeline.execute_task(task, worktree_path)
@@ -947,30 +1149,20 @@ def cmd_execute(
                                 merge_orchestrator.cleanup_branch(task.id)
                                 task_result["cleaned_up"] = True
 
-                                if not json_output:
-                                    with print_lock:
-                                        print(f"[MERGE] Task {task.id}: Merged and cleaned up")
+                                log(f"[MERGE] Task {task.id}: Merged and cleaned up")
                             else:
                                 task_result["cleaned_up"] = False
-                                if not json_output:
-                                    with print_lock:
-                                        print(f"[WARN] Task {task.id}: Merge failed - {merge_msg}")
+                                log(f"[WARN] Task {task.id}: Merge failed - {merge_msg}")
                         except Exception as merge_err:
                             task_result["merge_error"] = str(merge_err)
-                            if not json_output:
-                                with print_lock:
-                                    print(f"[WARN] Task {task.id}: Merge/cleanup error - {merge_err}")
+                            log(f"[WARN] Task {task.id}: Merge/cleanup error - {merge_err}")
 
-                if not json_output:
-                    with print_lock:
-                        status_str = "✓" if success else "✗"
-                        print(f"[{status_str}] Task {task.id}: {final_status}")
+                status_str = "✓" if success else "✗"
+                log(f"[{status_str}] Task {task.id}: {final_status}")
 
             except Exception as e:
                 task_result["error"] = str(e)
-                if not json_output:
-                    with print_lock:
-                        print(f"[✗] Task {task.id}: Error - {e}")
+                log(f"[✗] Task {task.id}: Error - {e}")
 
             with results_lock:
                 results.append(task_result)
@@ -983,7 +1175,7 @@ def cmd_execute(
             if not task:
                 if json_output:
                     result = {"success": False, "error": f"Task not found: {task_id}"}
-                    print(json.dumps(result, indent=2))
+                    _print_json(result)
                 else:
                     print(f"Error: Task not found: {task_id}", file=sys.stderr)
                 return 1
@@ -996,7 +1188,7 @@ def cmd_execute(
         if not initial_tasks:
             if json_output:
                 result = {"success": True, "message": "No tasks ready to execute", "executed": []}
-                print(json.dumps(result, indent=2))
+                _print_json(result)
             else:
                 print("No tasks ready to execute")
             return 0
@@ -1042,9 +1234,7 @@ def cmd_execute(
                             and new_task.id not in futures.values()
                         ):
                             pending_tasks.append(new_task)
-                            if not json_output:
-                                with print_lock:
-                                    print(f"[+] New task ready: {new_task.id}")
+                            log(f"[+] New task ready: {new_task.id}")
 
                     # Re-sort by priority after adding new tasks
                     pending_tasks.sort(key=lambda t: t.priority)
@@ -1066,7 +1256,7 @@ def cmd_execute(
             }
             if project.config.docs_generate_on_complete:
                 result["docs_generation"] = pipeline.docs_trigger_status or "skipped_incomplete"
-            print(json.dumps(result, indent=2))
+            _print_json(result)
         else:
             successful = sum(1 for r in results if r["success"])
             print(f"\nCompleted: {successful}/{len(results)} tasks successful")
@@ -1079,14 +1269,14 @@ def cmd_execute(
     except FileNotFoundError:
         if json_output:
             result = {"success": False, "error": "Not a ClaudeCraft project"}
-            print(json.dumps(result, indent=2))
+            _print_json(result)
         else:
             print("Not a ClaudeCraft project (no .claudecraft directory found)", file=sys.stderr)
         return 1
     except Exception as e:
         if json_output:
             result = {"success": False, "error": str(e)}
-            print(json.dumps(result, indent=2))
+            _print_json(result)
         else:
             print(f"Error: {e}", file=sys.stderr)
         return 1
@@ -1114,6 +1304,8 @@ def cmd_agent_start(
     json_output: bool = False,
 ) -> int:
     """Register an active agent."""
+    from claudecraft.core.project import Project
+
     try:
         project = Project.load()
         # Don't register PID - CLI process exits immediately
@@ -1132,21 +1324,21 @@ def cmd_agent_start(
                 "task_id": task_id,
                 "agent_type": agent_type,
             }
-            print(json.dumps(result, indent=2))
+            _print_json(result)
         else:
             print(f"Agent registered: slot {slot}, task {task_id}, type {agent_type}")
         return 0
     except FileNotFoundError:
         if json_output:
             result = {"success": False, "error": "Not a ClaudeCraft project"}
-            print(json.dumps(result, indent=2))
+            _print_json(result)
         else:
             print("Not a ClaudeCraft project (no .claudecraft directory found)", file=sys.stderr)
         return 1
     except Exception as e:
         if json_output:
             result = {"success": False, "error": str(e)}
-            print(json.dumps(result, indent=2))
+            _print_json(result)
         else:
             print(f"Error: {e}", file=sys.stderr)
         return 1
@@ -1158,13 +1350,15 @@ def cmd_agent_stop(
     json_output: bool = False,
 ) -> int:
     """Deregister an active agent."""
+    from claudecraft.core.project import Project
+
     try:
         project = Project.load()
 
         if not task_id and not slot:
             if json_output:
                 result = {"success": False, "error": "Must specify --task or --slot"}
-                print(json.dumps(result, indent=2))
+                _print_json(result)
             else:
                 print("Error: Must specify --task or --slot", file=sys.stderr)
             return 1
@@ -1180,7 +1374,7 @@ def cmd_agent_stop(
 
         if json_output:
             result = {"success": success, "task_id": task_id, "slot": slot}
-            print(json.dumps(result, indent=2))
+            _print_json(result)
         else:
             if success:
                 print(f"Agent deregistered: task={task_id}, slot={slot}")
@@ -1190,14 +1384,14 @@ def cmd_agent_stop(
     except FileNotFoundError:
         if json_output:
             result = {"success": False, "error": "Not a ClaudeCraft project"}
-            print(json.dumps(result, indent=2))
+            _print_json(result)
         else:
             print("Not a ClaudeCraft project (no .claudecraft directory found)", file=sys.stderr)
         return 1
     except Exception as e:
         if json_output:
             result = {"success": False, "error": str(e)}
-            print(json.dumps(result, indent=2))
+            _print_json(result)
         else:
             print(f"Error: {e}", file=sys.stderr)
         return 1
@@ -1205,6 +1399,8 @@ def cmd_agent_stop(
 
 def cmd_list_agents(json_output: bool = False) -> int:
     """List active agents."""
+    from claudecraft.core.project import Project
+
     try:
         project = Project.load()
 
@@ -1220,7 +1416,7 @@ def cmd_list_agents(json_output: bool = False) -> int:
                 "cleaned_stale": cleaned,
                 "agents": [a.to_dict() for a in agents],
             }
-            print(json.dumps(result, indent=2))
+            _print_json(result)
         else:
             if cleaned:
                 print(f"Cleaned {cleaned} stale agent(s)\n")
@@ -1247,14 +1443,14 @@ def cmd_list_agents(json_output: bool = False) -> int:
     except FileNotFoundError:
         if json_output:
             result = {"success": False, "error": "Not a ClaudeCraft project"}
-            print(json.dumps(result, indent=2))
+            _print_json(result)
         else:
             print("Not a ClaudeCraft project (no .claudecraft directory found)", file=sys.stderr)
         return 1
     except Exception as e:
         if json_output:
             result = {"success": False, "error": str(e)}
-            print(json.dumps(result, indent=2))
+            _print_json(result)
         else:
             print(f"Error: {e}", file=sys.stderr)
         return 1
@@ -1266,6 +1462,8 @@ def cmd_ralph_status(
     json_output: bool = False,
 ) -> int:
     """Show active Ralph verification loops."""
+    from claudecraft.core.project import Project
+
     try:
         project = Project.load()
 
@@ -1286,7 +1484,7 @@ def cmd_ralph_status(
                 "count": len(loops),
                 "loops": [l.to_dict() for l in loops],
             }
-            print(json.dumps(result, indent=2))
+            _print_json(result)
         else:
             if not loops:
                 print("No active Ralph loops")
@@ -1321,14 +1519,14 @@ def cmd_ralph_status(
     except FileNotFoundError:
         if json_output:
             result = {"success": False, "error": "Not a ClaudeCraft project"}
-            print(json.dumps(result, indent=2))
+            _print_json(result)
         else:
             print("Not a ClaudeCraft project (no .claudecraft directory found)", file=sys.stderr)
         return 1
     except Exception as e:
         if json_output:
             result = {"success": False, "error": str(e)}
-            print(json.dumps(result, indent=2))
+            _print_json(result)
         else:
             print(f"Error: {e}", file=sys.stderr)
         return 1
@@ -1340,6 +1538,8 @@ def cmd_ralph_cancel(
     json_output: bool = False,
 ) -> int:
     """Cancel an active Ralph verification loop."""
+    from claudecraft.core.project import Project
+
     try:
         project = Project.load()
 
@@ -1357,7 +1557,7 @@ def cmd_ralph_cancel(
                     "error": f"No Ralph loop found for task {task_id}"
                     + (f" agent {agent_type}" if agent_type else ""),
                 }
-                print(json.dumps(result, indent=2))
+                _print_json(result)
             else:
                 msg = f"No Ralph loop found for task {task_id}"
                 if agent_type:
@@ -1371,7 +1571,7 @@ def cmd_ralph_cancel(
                     "success": False,
                     "error": f"Loop is not running (status: {loop.status})",
                 }
-                print(json.dumps(result, indent=2))
+                _print_json(result)
             else:
                 print(f"Loop is not running (status: {loop.status})", file=sys.stderr)
             return 1
@@ -1386,7 +1586,7 @@ def cmd_ralph_cancel(
                 "agent_type": agent_type or "all",
                 "message": "Loop cancelled" if cancelled else "Failed to cancel",
             }
-            print(json.dumps(result, indent=2))
+            _print_json(result)
         else:
             if cancelled:
                 msg = f"Cancelled Ralph loop for task {task_id}"
@@ -1401,14 +1601,14 @@ def cmd_ralph_cancel(
     except FileNotFoundError:
         if json_output:
             result = {"success": False, "error": "Not a ClaudeCraft project"}
-            print(json.dumps(result, indent=2))
+            _print_json(result)
         else:
             print("Not a ClaudeCraft project (no .claudecraft directory found)", file=sys.stderr)
         return 1
     except Exception as e:
         if json_output:
             result = {"success": False, "error": str(e)}
-            print(json.dumps(result, indent=2))
+            _print_json(result)
         else:
             print(f"Error: {e}", file=sys.stderr)
         return 1
@@ -1422,6 +1622,8 @@ def cmd_spec_create(
     json_output: bool = False,
 ) -> int:
     """Create a new specification."""
+    from claudecraft.core.project import Project
+
     try:
         project = Project.load()
 
@@ -1430,7 +1632,7 @@ def cmd_spec_create(
         if existing:
             if json_output:
                 result = {"success": False, "error": f"Spec already exists: {spec_id}"}
-                print(json.dumps(result, indent=2))
+                _print_json(result)
             else:
                 print(f"Error: Spec already exists: {spec_id}", file=sys.stderr)
             return 1
@@ -1457,7 +1659,7 @@ def cmd_spec_create(
                 "spec_dir": str(spec_dir),
                 "spec": spec.to_dict(),
             }
-            print(json.dumps(result, indent=2))
+            _print_json(result)
         else:
             print(f"Created spec: {spec_id}")
             print(f"  Directory: {spec_dir}")
@@ -1465,14 +1667,14 @@ def cmd_spec_create(
     except FileNotFoundError:
         if json_output:
             result = {"success": False, "error": "Not a ClaudeCraft project"}
-            print(json.dumps(result, indent=2))
+            _print_json(result)
         else:
             print("Not a ClaudeCraft project (no .claudecraft directory found)", file=sys.stderr)
         return 1
     except Exception as e:
         if json_output:
             result = {"success": False, "error": str(e)}
-            print(json.dumps(result, indent=2))
+            _print_json(result)
         else:
             print(f"Error: {e}", file=sys.stderr)
         return 1
@@ -1484,6 +1686,8 @@ def cmd_quick_create(
     json_output: bool = False,
 ) -> int:
     """Create a lightweight quick-task spec."""
+    from claudecraft.core.project import Project
+
     try:
         project = Project.load()
         now = datetime.now()
@@ -1499,7 +1703,7 @@ def cmd_quick_create(
         if existing:
             if json_output:
                 result = {"success": False, "error": f"Spec already exists: {spec_id}"}
-                print(json.dumps(result, indent=2))
+                _print_json(result)
             else:
                 print(f"Error: Spec already exists: {spec_id}", file=sys.stderr)
             return 1
@@ -1536,7 +1740,7 @@ def cmd_quick_create(
                 "task_md": str(task_md),
                 "spec": spec.to_dict(),
             }
-            print(json.dumps(result, indent=2))
+            _print_json(result)
         else:
             print(f"Created quick spec: {spec_id}")
             print(f"  Directory: {spec_dir}")
@@ -1545,14 +1749,14 @@ def cmd_quick_create(
     except FileNotFoundError:
         if json_output:
             result = {"success": False, "error": "Not a ClaudeCraft project"}
-            print(json.dumps(result, indent=2))
+            _print_json(result)
         else:
             print("Not a ClaudeCraft project (no .claudecraft directory found)", file=sys.stderr)
         return 1
     except Exception as e:
         if json_output:
             result = {"success": False, "error": str(e)}
-            print(json.dumps(result, indent=2))
+            _print_json(result)
         else:
             print(f"Error: {e}", file=sys.stderr)
         return 1
@@ -1566,6 +1770,8 @@ def cmd_spec_update(
     json_output: bool = False,
 ) -> int:
     """Update a specification."""
+    from claudecraft.core.project import Project
+
     try:
         project = Project.load()
 
@@ -1573,7 +1779,7 @@ def cmd_spec_update(
         if not spec:
             if json_output:
                 result = {"success": False, "error": f"Spec not found: {spec_id}"}
-                print(json.dumps(result, indent=2))
+                _print_json(result)
             else:
                 print(f"Error: Spec not found: {spec_id}", file=sys.stderr)
             return 1
@@ -1596,7 +1802,7 @@ def cmd_spec_update(
                 "spec_id": spec_id,
                 "spec": spec.to_dict(),
             }
-            print(json.dumps(result, indent=2))
+            _print_json(result)
         else:
             print(f"Updated spec: {spec_id}")
             if status:
@@ -1607,14 +1813,14 @@ def cmd_spec_update(
     except FileNotFoundError:
         if json_output:
             result = {"success": False, "error": "Not a ClaudeCraft project"}
-            print(json.dumps(result, indent=2))
+            _print_json(result)
         else:
             print("Not a ClaudeCraft project (no .claudecraft directory found)", file=sys.stderr)
         return 1
     except Exception as e:
         if json_output:
             result = {"success": False, "error": str(e)}
-            print(json.dumps(result, indent=2))
+            _print_json(result)
         else:
             print(f"Error: {e}", file=sys.stderr)
         return 1
@@ -1622,6 +1828,8 @@ def cmd_spec_update(
 
 def cmd_spec_get(spec_id: str, json_output: bool = False) -> int:
     """Get specification details."""
+    from claudecraft.core.project import Project
+
     try:
         project = Project.load()
 
@@ -1629,7 +1837,7 @@ def cmd_spec_get(spec_id: str, json_output: bool = False) -> int:
         if not spec:
             if json_output:
                 result = {"success": False, "error": f"Spec not found: {spec_id}"}
-                print(json.dumps(result, indent=2))
+                _print_json(result)
             else:
                 print(f"Error: Spec not found: {spec_id}", file=sys.stderr)
             return 1
@@ -1643,7 +1851,7 @@ def cmd_spec_get(spec_id: str, json_output: bool = False) -> int:
                 "spec_dir": str(spec_dir),
                 "spec": spec.to_dict(),
             }
-            print(json.dumps(result, indent=2))
+            _print_json(result)
         else:
             print(f"Spec: {spec.id}")
             print(f"  Title: {spec.title}")
@@ -1656,14 +1864,14 @@ def cmd_spec_get(spec_id: str, json_output: bool = False) -> int:
     except FileNotFoundError:
         if json_output:
             result = {"success": False, "error": "Not a ClaudeCraft project"}
-            print(json.dumps(result, indent=2))
+            _print_json(result)
         else:
             print("Not a ClaudeCraft project (no .claudecraft directory found)", file=sys.stderr)
         return 1
     except Exception as e:
         if json_output:
             result = {"success": False, "error": str(e)}
-            print(json.dumps(result, indent=2))
+            _print_json(result)
         else:
             print(f"Error: {e}", file=sys.stderr)
         return 1
@@ -1897,6 +2105,8 @@ def cmd_task_create(
     qa_verification: str | None = None,
 ) -> int:
     """Create a new task with optional completion criteria."""
+    from claudecraft.core.project import Project
+
     try:
         project = Project.load()
 
@@ -1904,7 +2114,7 @@ def cmd_task_create(
         if not project.db.get_spec(spec_id):
             if json_output:
                 result = {"success": False, "error": f"Spec not found: {spec_id}"}
-                print(json.dumps(result, indent=2))
+                _print_json(result)
             else:
                 print(f"Error: Spec not found: {spec_id}", file=sys.stderr)
             return 1
@@ -1963,7 +2173,7 @@ def cmd_task_create(
             }
             if validation_warnings:
                 result["validation_warnings"] = validation_warnings
-            print(json.dumps(result, indent=2))
+            _print_json(result)
         else:
             print(f"Created task: {task_id}")
             print(f"  Title: {title}")
@@ -1984,14 +2194,14 @@ def cmd_task_create(
     except FileNotFoundError:
         if json_output:
             result = {"success": False, "error": "Not a ClaudeCraft project"}
-            print(json.dumps(result, indent=2))
+            _print_json(result)
         else:
             print("Not a ClaudeCraft project (no .claudecraft directory found)", file=sys.stderr)
         return 1
     except Exception as e:
         if json_output:
             result = {"success": False, "error": str(e)}
-            print(json.dumps(result, indent=2))
+            _print_json(result)
         else:
             print(f"Error: {e}", file=sys.stderr)
         return 1
@@ -2014,6 +2224,8 @@ def cmd_task_followup(
     coder_command: str | None = None,
 ) -> int:
     """Create a follow-up task with optional completion criteria."""
+    from claudecraft.core.project import Project
+
     try:
         project = Project.load()
 
@@ -2026,7 +2238,7 @@ def cmd_task_followup(
                     "error": f"Task already exists: {task_id}",
                     "existing_task": existing.to_dict(),
                 }
-                print(json.dumps(result, indent=2))
+                _print_json(result)
             else:
                 print(f"Task already exists: {task_id}", file=sys.stderr)
             return 1
@@ -2100,7 +2312,7 @@ def cmd_task_followup(
                 "task": task.to_dict(),
                 "has_completion_spec": completion_spec is not None,
             }
-            print(json.dumps(result, indent=2))
+            _print_json(result)
         else:
             print(f"Created follow-up task: {task_id}")
             print(f"  Category: {category}")
@@ -2115,14 +2327,14 @@ def cmd_task_followup(
     except FileNotFoundError:
         if json_output:
             result = {"success": False, "error": "Not a ClaudeCraft project"}
-            print(json.dumps(result, indent=2))
+            _print_json(result)
         else:
             print("Not a ClaudeCraft project (no .claudecraft directory found)", file=sys.stderr)
         return 1
     except Exception as e:
         if json_output:
             result = {"success": False, "error": str(e)}
-            print(json.dumps(result, indent=2))
+            _print_json(result)
         else:
             print(f"Error: {e}", file=sys.stderr)
         return 1
@@ -2130,13 +2342,15 @@ def cmd_task_followup(
 
 def cmd_memory_stats(json_output: bool = False) -> int:
     """Show memory store statistics."""
+    from claudecraft.core.project import Project
+
     try:
         project = Project.load()
         stats = project.memory.get_stats()
 
         if json_output:
             result = {"success": True, **stats}
-            print(json.dumps(result, indent=2))
+            _print_json(result)
         else:
             print("Memory Store Statistics")
             print(f"  Total entities: {stats['total_entities']}")
@@ -2151,14 +2365,14 @@ def cmd_memory_stats(json_output: bool = False) -> int:
     except FileNotFoundError:
         if json_output:
             result = {"success": False, "error": "Not a ClaudeCraft project"}
-            print(json.dumps(result, indent=2))
+            _print_json(result)
         else:
             print("Not a ClaudeCraft project (no .claudecraft directory found)", file=sys.stderr)
         return 1
     except Exception as e:
         if json_output:
             result = {"success": False, "error": str(e)}
-            print(json.dumps(result, indent=2))
+            _print_json(result)
         else:
             print(f"Error: {e}", file=sys.stderr)
         return 1
@@ -2171,6 +2385,8 @@ def cmd_memory_list(
     json_output: bool = False,
 ) -> int:
     """List memory entities."""
+    from claudecraft.core.project import Project
+
     try:
         project = Project.load()
 
@@ -2189,7 +2405,7 @@ def cmd_memory_list(
                 "count": len(entities),
                 "entities": [e.to_dict() for e in entities],
             }
-            print(json.dumps(result, indent=2))
+            _print_json(result)
         else:
             if not entities:
                 print("No memory entries found")
@@ -2205,14 +2421,14 @@ def cmd_memory_list(
     except FileNotFoundError:
         if json_output:
             result = {"success": False, "error": "Not a ClaudeCraft project"}
-            print(json.dumps(result, indent=2))
+            _print_json(result)
         else:
             print("Not a ClaudeCraft project (no .claudecraft directory found)", file=sys.stderr)
         return 1
     except Exception as e:
         if json_output:
             result = {"success": False, "error": str(e)}
-            print(json.dumps(result, indent=2))
+            _print_json(result)
         else:
             print(f"Error: {e}", file=sys.stderr)
         return 1
@@ -2225,6 +2441,8 @@ def cmd_memory_search(
     json_output: bool = False,
 ) -> int:
     """Search memory entries."""
+    from claudecraft.core.project import Project
+
     try:
         project = Project.load()
         entities = project.memory.search_entities(
@@ -2240,7 +2458,7 @@ def cmd_memory_search(
                 "count": len(entities),
                 "entities": [e.to_dict() for e in entities],
             }
-            print(json.dumps(result, indent=2))
+            _print_json(result)
         else:
             if not entities:
                 print(f"No matches for '{keyword}'")
@@ -2256,14 +2474,14 @@ def cmd_memory_search(
     except FileNotFoundError:
         if json_output:
             result = {"success": False, "error": "Not a ClaudeCraft project"}
-            print(json.dumps(result, indent=2))
+            _print_json(result)
         else:
             print("Not a ClaudeCraft project (no .claudecraft directory found)", file=sys.stderr)
         return 1
     except Exception as e:
         if json_output:
             result = {"success": False, "error": str(e)}
-            print(json.dumps(result, indent=2))
+            _print_json(result)
         else:
             print(f"Error: {e}", file=sys.stderr)
         return 1
@@ -2278,6 +2496,8 @@ def cmd_memory_add(
     json_output: bool = False,
 ) -> int:
     """Add a memory entry."""
+    from claudecraft.core.project import Project
+
     try:
         project = Project.load()
 
@@ -2294,7 +2514,7 @@ def cmd_memory_add(
                 "success": True,
                 "entity": entity.to_dict(),
             }
-            print(json.dumps(result, indent=2))
+            _print_json(result)
         else:
             print(f"Added memory entry: {entity.id}")
             print(f"  Type: {entity_type}")
@@ -2305,14 +2525,14 @@ def cmd_memory_add(
     except FileNotFoundError:
         if json_output:
             result = {"success": False, "error": "Not a ClaudeCraft project"}
-            print(json.dumps(result, indent=2))
+            _print_json(result)
         else:
             print("Not a ClaudeCraft project (no .claudecraft directory found)", file=sys.stderr)
         return 1
     except Exception as e:
         if json_output:
             result = {"success": False, "error": str(e)}
-            print(json.dumps(result, indent=2))
+            _print_json(result)
         else:
             print(f"Error: {e}", file=sys.stderr)
         return 1
@@ -2320,6 +2540,8 @@ def cmd_memory_add(
 
 def cmd_memory_cleanup(days: int = 90, json_output: bool = False) -> int:
     """Clean up old memory entries."""
+    from claudecraft.core.project import Project
+
     try:
         project = Project.load()
         removed = project.memory.cleanup_old_entities(days=days)
@@ -2330,7 +2552,7 @@ def cmd_memory_cleanup(days: int = 90, json_output: bool = False) -> int:
                 "removed": removed,
                 "days": days,
             }
-            print(json.dumps(result, indent=2))
+            _print_json(result)
         else:
             if removed > 0:
                 print(f"Removed {removed} memory entries older than {days} days")
@@ -2340,14 +2562,14 @@ def cmd_memory_cleanup(days: int = 90, json_output: bool = False) -> int:
     except FileNotFoundError:
         if json_output:
             result = {"success": False, "error": "Not a ClaudeCraft project"}
-            print(json.dumps(result, indent=2))
+            _print_json(result)
         else:
             print("Not a ClaudeCraft project (no .claudecraft directory found)", file=sys.stderr)
         return 1
     except Exception as e:
         if json_output:
             result = {"success": False, "error": str(e)}
-            print(json.dumps(result, indent=2))
+            _print_json(result)
         else:
             print(f"Error: {e}", file=sys.stderr)
         return 1
@@ -2357,7 +2579,7 @@ def cmd_sync_export(json_output: bool = False) -> int:
     """Export database to JSONL file (deprecated)."""
     msg = "Not available: JSONL sync has been removed"
     if json_output:
-        print(json.dumps({"success": False, "error": msg}, indent=2))
+        _print_json({"success": False, "error": msg})
     else:
         print(msg, file=sys.stderr)
     return 1
@@ -2367,7 +2589,7 @@ def cmd_sync_import(json_output: bool = False) -> int:
     """Import from JSONL file to database (deprecated)."""
     msg = "Not available: JSONL sync has been removed"
     if json_output:
-        print(json.dumps({"success": False, "error": msg}, indent=2))
+        _print_json({"success": False, "error": msg})
     else:
         print(msg, file=sys.stderr)
     return 1
@@ -2377,7 +2599,7 @@ def cmd_sync_compact(json_output: bool = False) -> int:
     """Compact JSONL file by removing superseded changes (deprecated)."""
     msg = "Not available: JSONL sync has been removed"
     if json_output:
-        print(json.dumps({"success": False, "error": msg}, indent=2))
+        _print_json({"success": False, "error": msg})
     else:
         print(msg, file=sys.stderr)
     return 1
@@ -2385,26 +2607,30 @@ def cmd_sync_compact(json_output: bool = False) -> int:
 
 def cmd_sync_status(json_output: bool = False) -> int:
     """Show JSONL sync status (deprecated)."""
+    from claudecraft.core.config import find_project_root
+
     try:
-        # Attempt to load project to verify it exists (for "outside project" test)
-        Project.load()
+        # Only the project's existence matters here; a full Project.load would
+        # also parse the config and replay the whole memory log
+        if find_project_root() is None:
+            raise FileNotFoundError
         msg = "Not available: JSONL sync has been removed"
         if json_output:
-            print(json.dumps({"success": False, "error": msg}, indent=2))
+            _print_json({"success": False, "error": msg})
         else:
             print(msg, file=sys.stderr)
         return 1
     except FileNotFoundError:
         if json_output:
             result = {"success": False, "error": "Not a ClaudeCraft project"}
-            print(json.dumps(result, indent=2))
+            _print_json(result)
         else:
             print("Not a ClaudeCraft project (no .claudecraft directory found)", file=sys.stderr)
         return 1
     except Exception as e:
         if json_output:
             result = {"success": False, "error": str(e)}
-            print(json.dumps(result, indent=2))
+            _print_json(result)
         else:
             print(f"Error: {e}", file=sys.stderr)
         return 1
@@ -2418,6 +2644,8 @@ def cmd_worktree_create(
     no_bootstrap: bool = False,
 ) -> int:
     """Create a git worktree for a task."""
+    from claudecraft.core.project import Project
+
     try:
         from claudecraft.orchestration.worktree import WorktreeManager
 
@@ -2445,7 +2673,7 @@ def cmd_worktree_create(
                 result["spec"] = spec
             if bootstrap_results:
                 result["bootstrap"] = bootstrap_results
-            print(json.dumps(result, indent=2))
+            _print_json(result)
         else:
             print(f"Created worktree: {worktree_path}")
             print(f"  Branch: task/{task_id}")
@@ -2457,14 +2685,14 @@ def cmd_worktree_create(
     except FileNotFoundError:
         if json_output:
             result = {"success": False, "error": "Not a ClaudeCraft project"}
-            print(json.dumps(result, indent=2))
+            _print_json(result)
         else:
             print("Not a ClaudeCraft project (no .claudecraft directory found)", file=sys.stderr)
         return 1
     except Exception as e:
         if json_output:
             result = {"success": False, "error": str(e)}
-            print(json.dumps(result, indent=2))
+            _print_json(result)
         else:
             print(f"Error: {e}", file=sys.stderr)
         return 1
@@ -2474,6 +2702,8 @@ def cmd_worktree_bootstrap(
     task_id: str, fail_fast: bool = False, json_output: bool = False
 ) -> int:
     """Run bootstrap commands in an existing worktree."""
+    from claudecraft.core.project import Project
+
     try:
         from claudecraft.orchestration.worktree import WorktreeManager
 
@@ -2488,7 +2718,7 @@ def cmd_worktree_bootstrap(
                     "message": "No bootstrap commands configured",
                     "results": [],
                 }
-                print(json.dumps(result, indent=2))
+                _print_json(result)
             else:
                 print("No bootstrap commands configured in config.yaml")
             return 0
@@ -2503,7 +2733,7 @@ def cmd_worktree_bootstrap(
                 "task_id": task_id,
                 "results": results,
             }
-            print(json.dumps(result, indent=2))
+            _print_json(result)
         else:
             for br in results:
                 status = "ok" if br["returncode"] == 0 else "FAILED"
@@ -2516,14 +2746,14 @@ def cmd_worktree_bootstrap(
     except FileNotFoundError:
         if json_output:
             result = {"success": False, "error": "Not a ClaudeCraft project"}
-            print(json.dumps(result, indent=2))
+            _print_json(result)
         else:
             print("Not a ClaudeCraft project (no .claudecraft directory found)", file=sys.stderr)
         return 1
     except Exception as e:
         if json_output:
             result = {"success": False, "error": str(e)}
-            print(json.dumps(result, indent=2))
+            _print_json(result)
         else:
             print(f"Error: {e}", file=sys.stderr)
         return 1
@@ -2533,6 +2763,8 @@ def cmd_worktree_remove(
     task_id: str, force: bool = False, json_output: bool = False
 ) -> int:
     """Remove a git worktree."""
+    from claudecraft.core.project import Project
+
     try:
         from claudecraft.orchestration.worktree import WorktreeManager
 
@@ -2542,21 +2774,21 @@ def cmd_worktree_remove(
 
         if json_output:
             result = {"success": True, "task_id": task_id}
-            print(json.dumps(result, indent=2))
+            _print_json(result)
         else:
             print(f"Removed worktree: {task_id}")
         return 0
     except FileNotFoundError:
         if json_output:
             result = {"success": False, "error": "Not a ClaudeCraft project"}
-            print(json.dumps(result, indent=2))
+            _print_json(result)
         else:
             print("Not a ClaudeCraft project (no .claudecraft directory found)", file=sys.stderr)
         return 1
     except Exception as e:
         if json_output:
             result = {"success": False, "error": str(e)}
-            print(json.dumps(result, indent=2))
+            _print_json(result)
         else:
             print(f"Error: {e}", file=sys.stderr)
         return 1
@@ -2564,6 +2796,8 @@ def cmd_worktree_remove(
 
 def cmd_worktree_list(json_output: bool = False) -> int:
     """List all worktrees."""
+    from claudecraft.core.project import Project
+
     try:
         from claudecraft.orchestration.worktree import WorktreeManager
 
@@ -2577,7 +2811,7 @@ def cmd_worktree_list(json_output: bool = False) -> int:
                 "count": len(worktrees),
                 "worktrees": worktrees,
             }
-            print(json.dumps(result, indent=2))
+            _print_json(result)
         else:
             if not worktrees:
                 print("No worktrees found")
@@ -2592,14 +2826,14 @@ def cmd_worktree_list(json_output: bool = False) -> int:
     except FileNotFoundError:
         if json_output:
             result = {"success": False, "error": "Not a ClaudeCraft project"}
-            print(json.dumps(result, indent=2))
+            _print_json(result)
         else:
             print("Not a ClaudeCraft project (no .claudecraft directory found)", file=sys.stderr)
         return 1
     except Exception as e:
         if json_output:
             result = {"success": False, "error": str(e)}
-            print(json.dumps(result, indent=2))
+            _print_json(result)
         else:
             print(f"Error: {e}", file=sys.stderr)
         return 1
@@ -2609,6 +2843,8 @@ def cmd_worktree_commit(
     task_id: str, message: str, json_output: bool = False
 ) -> int:
     """Commit changes in a worktree."""
+    from claudecraft.core.project import Project
+
     try:
         from claudecraft.orchestration.worktree import WorktreeManager
 
@@ -2622,7 +2858,7 @@ def cmd_worktree_commit(
                 "task_id": task_id,
                 "commit": commit_hash,
             }
-            print(json.dumps(result, indent=2))
+            _print_json(result)
         else:
             print(f"Committed changes in {task_id}")
             print(f"  Commit: {commit_hash[:8]}")
@@ -2630,14 +2866,14 @@ def cmd_worktree_commit(
     except FileNotFoundError:
         if json_output:
             result = {"success": False, "error": "Not a ClaudeCraft project"}
-            print(json.dumps(result, indent=2))
+            _print_json(result)
         else:
             print("Not a ClaudeCraft project (no .claudecraft directory found)", file=sys.stderr)
         return 1
     except Exception as e:
         if json_output:
             result = {"success": False, "error": str(e)}
-            print(json.dumps(result, indent=2))
+            _print_json(result)
         else:
             print(f"Error: {e}", file=sys.stderr)
         return 1
@@ -2650,6 +2886,8 @@ def cmd_merge_task(
     json_output: bool = False,
 ) -> int:
     """Merge a task branch into target branch."""
+    from claudecraft.core.project import Project
+
     try:
         from claudecraft.orchestration.merge import MergeOrchestrator
         from claudecraft.orchestration.worktree import WorktreeManager
@@ -2673,7 +2911,7 @@ def cmd_merge_task(
                 "message": message,
                 "cleaned_up": cleanup and success,
             }
-            print(json.dumps(result, indent=2))
+            _print_json(result)
         else:
             print(message)
             if success and cleanup:
@@ -2682,14 +2920,14 @@ def cmd_merge_task(
     except FileNotFoundError:
         if json_output:
             result = {"success": False, "error": "Not a ClaudeCraft project"}
-            print(json.dumps(result, indent=2))
+            _print_json(result)
         else:
             print("Not a ClaudeCraft project (no .claudecraft directory found)", file=sys.stderr)
         return 1
     except Exception as e:
         if json_output:
             result = {"success": False, "error": str(e)}
-            print(json.dumps(result, indent=2))
+            _print_json(result)
         else:
             print(f"Error: {e}", file=sys.stderr)
         return 1
@@ -2712,6 +2950,8 @@ def cmd_generate_docs(
     import os
     import subprocess
 
+    from claudecraft.core.project import Project
+
     try:
         project = Project.load()
 
@@ -2813,7 +3053,7 @@ If there are issues, output: DOCUMENTATION FAILED: [reason]
                     "spec_id": spec_id,
                     "output": output[:2000] if len(output) > 2000 else output,
                 }
-                print(json.dumps(result_dict, indent=2))
+                _print_json(result_dict)
             else:
                 if success:
                     print(f"\nDocumentation generated successfully in {docs_path}")
@@ -2827,7 +3067,7 @@ If there are issues, output: DOCUMENTATION FAILED: [reason]
         except subprocess.TimeoutExpired:
             error_msg = f"Timeout: Documentation generation exceeded {project.config.timeout_minutes} minutes"
             if json_output:
-                print(json.dumps({"success": False, "error": error_msg}, indent=2))
+                _print_json({"success": False, "error": error_msg})
             else:
                 print(error_msg, file=sys.stderr)
             return 1
@@ -2835,7 +3075,7 @@ If there are issues, output: DOCUMENTATION FAILED: [reason]
         except FileNotFoundError:
             error_msg = "Claude CLI not found. Please ensure Claude Code is installed."
             if json_output:
-                print(json.dumps({"success": False, "error": error_msg}, indent=2))
+                _print_json({"success": False, "error": error_msg})
             else:
                 print(error_msg, file=sys.stderr)
             return 1
@@ -2843,14 +3083,14 @@ If there are issues, output: DOCUMENTATION FAILED: [reason]
     except FileNotFoundError:
         if json_output:
             result = {"success": False, "error": "Not a ClaudeCraft project"}
-            print(json.dumps(result, indent=2))
+            _print_json(result)
         else:
             print("Not a ClaudeCraft project (no .claudecraft directory found)", file=sys.stderr)
         return 1
     except Exception as e:
         if json_output:
             result = {"success": False, "error": str(e)}
-            print(json.dumps(result, indent=2))
+            _print_json(result)
         else:
             print(f"Error: {e}", file=sys.stderr)
         return 1
@@ -2860,6 +3100,8 @@ def cmd_migrate(json_output: bool = False) -> int:
     """Migrate from SQLite database to flat-file storage."""
     import sqlite3
 
+    from claudecraft.core.project import Project
+
     try:
         project = Project.load()
     except FileNotFoundError:
@@ -2947,19 +3189,22 @@ def cmd_migrate(json_output: bool = False) -> int:
 
         # Migrate execution logs
         cursor = conn.execute("SELECT * FROM execution_logs ORDER BY id")
+        logs: list[ExecutionLog] = []
         for row in cursor:
-            log = ExecutionLog(
-                id=row["id"],
-                task_id=row["task_id"],
-                agent_type=row["agent_type"],
-                action=row["action"],
-                output=row["output"],
-                success=bool(row["success"]),
-                duration_ms=row["duration_ms"],
-                created_at=datetime.fromisoformat(row["created_at"]),
+            logs.append(
+                ExecutionLog(
+                    id=row["id"],
+                    task_id=row["task_id"],
+                    agent_type=row["agent_type"],
+                    action=row["action"],
+                    output=row["output"],
+                    success=bool(row["success"]),
+                    duration_ms=row["duration_ms"],
+                    created_at=datetime.fromisoformat(row["created_at"]),
+                )
             )
-            project.db.append_execution_log(log)
-            stats["logs"] += 1
+        project.db.append_execution_logs(logs)
+        stats["logs"] += len(logs)
 
     finally:
         conn.close()
@@ -1,21 +1,44 @@
 """Core modules for ClaudeCraft."""
 
-from claudecraft.core.config import Config
-from claudecraft.core.models import (
-    TASK_STATUS_MIGRATION,
-    ActiveAgent,
-    ActiveRalphLoop,
-    CompletionCriteria,
-    ExecutionLog,
-    Spec,
-    SpecStatus,
-    Task,
-    TaskCompletionSpec,
-    TaskStatus,
-    VerificationMethod,
-)
-from claudecraft.core.project import Project
-from claudecraft.core.store import FileStore
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from claudecraft.core.config import Config
+    from claudecraft.core.models import (
+        TASK_STATUS_MIGRATION,
+        ActiveAgent,
+        ActiveRalphLoop,
+        CompletionCriteria,
+        ExecutionLog,
+        Spec,
+        SpecStatus,
+        Task,
+        TaskCompletionSpec,
+        TaskStatus,
+        VerificationMethod,
+    )
+    from claudecraft.core.project import Project
+    from claudecraft.core.store import FileStore
+
+# Re-exports are resolved on first access, so importing one submodule (e.g.
+# models from the CLI) does not pull in yaml, the store and the memory layer.
+_EXPORTS = {
+    "Config": "claudecraft.core.config",
+    "FileStore": "claudecraft.core.store",
+    "Project": "claudecraft.core.project",
+    "Spec": "claudecraft.core.models",
+    "SpecStatus": "claudecraft.core.models",
+    "Task": "claudecraft.core.models",
+    "TaskStatus": "claudecraft.core.models",
+    "TaskCompletionSpec": "claudecraft.core.models",
+    "CompletionCriteria": "claudecraft.core.models",
+    "ExecutionLog": "claudecraft.core.models",
+    "ActiveAgent": "claudecraft.core.models",
+    "ActiveRalphLoop": "claudecraft.core.models",
+    "VerificationMethod": "claudecraft.core.models",
+    "TASK_STATUS_MIGRATION": "claudecraft.core.models",
+}
 
 __all__ = [
     "Config",
@@ -33,3 +56,12 @@ __all__ = [
     "VerificationMethod",
     "TASK_STATUS_MIGRATION",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
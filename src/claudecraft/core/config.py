@@ -1,12 +1,27 @@
 """Configuration management for ClaudeCraft."""
 
+import copy
+import functools
+import hashlib
+import json
+import os
+import re
+import stat
+from contextlib import suppress
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
 import yaml
 
-DEFAULT_CONFIG = {
+try:
+    from yaml import CSafeDumper as _SafeDumper
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # libyaml not available
+    from yaml import SafeDumper as _SafeDumper  # type: ignore[assignment]
+    from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment]
+
+DEFAULT_CONFIG: dict[str, Any] = {
     "version": "1.0",
     "project": {
         "name": "unnamed-project",
@@ -86,14 +101,80 @@ DEFAULT_CONFIG = {
 
 def find_project_root(start: Path | None = None) -> Path | None:
     """Find the project root by looking for .claudecraft directory."""
-    current = start or Path.cwd()
-    while current != current.parent:
-        if (current / ".claudecraft").is_dir():
-            return current
-        current = current.parent
-    if (current / ".claudecraft").is_dir():
-        return current
-    return None
+    current = os.fspath(start or Path.cwd())
+    while True:
+        try:
+            if stat.S_ISDIR(os.stat(os.path.join(current, ".claudecraft")).st_mode):
+                return Path(current)
+        except OSError:
+            pass
+        parent = os.path.dirname(current)
+        if parent == current:
+            return None
+        current = parent
+
+
+def _yaml_cache_path(path: Path) -> Path:
+    """Return the JSON cache path for a YAML config file.
+
+    The cache lives in the git-ignored ``state/`` directory next to the file
+    (``.claudecraft/state/config.cache.json``), so it never shows up as a
+    change in the checkout or in task worktrees.
+    """
+    return path.parent / "state" / f"{path.stem}.cache.json"
+
+
+def _yaml_cache_key(content: bytes) -> str:
+    """Key a cache entry on the YAML source itself, not on its timestamps."""
+    return hashlib.blake2b(content, digest_size=16).hexdigest()
+
+
+def _write_yaml_cache(path: Path, content: bytes, raw: dict[str, Any]) -> None:
+    """Record ``raw`` as the parsed form of ``content``, the text of ``path``."""
+    cache_path = _yaml_cache_path(path)
+    # Unwritable directory or values JSON can't hold (e.g. dates)
+    with suppress(OSError, TypeError, ValueError):
+        cache_path.parent.mkdir(exist_ok=True)
+        cache_path.write_text(json.dumps({"key": _yaml_cache_key(content), "data": raw}))
+
+
+def _load_yaml_cached(path: Path) -> dict[str, Any]:
+    """Parse a YAML config file, reusing a JSON cache when it matches.
+
+    The cache is keyed on a hash of the file's contents, so any edit or save
+    invalidates it, however quickly it follows the last one.
+    """
+    content = path.read_bytes()
+    try:
+        cached = json.loads(_yaml_cache_path(path).read_bytes())
+        if cached.get("key") == _yaml_cache_key(content):
+            data: dict[str, Any] = cached["data"]
+            return data
+    except (OSError, ValueError, AttributeError, KeyError):
+        pass
+
+    raw = yaml.load(content, Loader=_SafeLoader) or {}
+
+    _write_yaml_cache(path, content, raw)
+    return raw
+
+
+# Project names the dumper emits unquoted; anything else takes the slow path
+_PLAIN_NAME_RE = re.compile(r"[A-Za-z][A-Za-z0-9_.-]*")
+_YAML_KEYWORDS = frozenset({"yes", "no", "true", "false", "on", "off", "null"})
+
+
+@functools.cache
+def _default_yaml() -> bytes:
+    """Render DEFAULT_CONFIG as YAML once per process."""
+    content: bytes = yaml.dump(
+        DEFAULT_CONFIG,
+        Dumper=_SafeDumper,
+        encoding="utf-8",
+        default_flow_style=False,
+        sort_keys=False,
+    )
+    return content
 
 
 @dataclass
@@ -180,11 +261,10 @@ class Config:
         if not path.exists():
             raise FileNotFoundError(f"Config file not found: {path}")
 
-        with open(path) as f:
-            raw = yaml.safe_load(f) or {}
+        raw = _load_yaml_cached(path)
 
         # Merge with defaults
-        merged = _deep_merge(DEFAULT_CONFIG.copy(), raw)
+        merged = _deep_merge(copy.deepcopy(DEFAULT_CONFIG), raw)
 
         # Extract hooks config
         hooks_config = merged.get("hooks", {})
@@ -232,20 +312,44 @@ class Config:
     @classmethod
     def create_default(cls, path: Path, project_name: str | None = None) -> "Config":
         """Create a default configuration file."""
-        config_data = DEFAULT_CONFIG.copy()
+        config_data = copy.deepcopy(DEFAULT_CONFIG)
         if project_name:
             config_data["project"]["name"] = project_name
 
+        default_name = DEFAULT_CONFIG["project"]["name"]
+        if not project_name:
+            content = _default_yaml()
+        elif _PLAIN_NAME_RE.fullmatch(project_name) and project_name.lower() not in _YAML_KEYWORDS:
+            content = _default_yaml().replace(
+                f"name: {default_name}\n".encode(), f"name: {project_name}\n".encode(), 1
+            )
+        else:
+            content = yaml.dump(
+                config_data,
+                Dumper=_SafeDumper,
+                encoding="utf-8",
+                default_flow_style=False,
+                sort_keys=False,
+            )
+
         path.parent.mkdir(parents=True, exist_ok=True)
-        with open(path, "w") as f:
-            yaml.dump(config_data, f, default_flow_style=False, sort_keys=False)
+        path.write_bytes(content)
+        # We already know the parsed contents; spare load() the YAML parse
+        _write_yaml_cache(path, content, config_data)
 
         return cls.load(path)
 
     def save(self) -> None:
         """Save current configuration to file."""
-        with open(self.config_path, "w") as f:
-            yaml.dump(self._raw, f, default_flow_style=False, sort_keys=False)
+        with open(self.config_path, "wb") as f:
+            yaml.dump(
+                self._raw,
+                f,
+                Dumper=_SafeDumper,
+                encoding="utf-8",
+                default_flow_style=False,
+                sort_keys=False,
+            )
 
     def get(self, key: str, default: Any = None) -> Any:
         """Get a configuration value by dot-notation key."""
@@ -260,11 +364,21 @@ class Config:
 
 
 def _deep_merge(base: dict[str, Any], override: dict[str, Any]) -> dict[str, Any]:
-    """Deep merge two dictionaries."""
+    """Deep merge two dictionaries.
+
+    Iterative rather than recursive; only the levels ``override`` touches are
+    copied, so ``base`` is never modified.
+    """
     result = base.copy()
-    for key, value in override.items():
-        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-            result[key] = _deep_merge(result[key], value)
-        else:
-            result[key] = value
+    stack = [(result, override)]
+    while stack:
+        target, source = stack.pop()
+        for key, value in source.items():
+            current = target.get(key)
+            if isinstance(current, dict) and isinstance(value, dict):
+                merged = current.copy()
+                target[key] = merged
+                stack.append((merged, value))
+            else:
+                target[key] = value
     return result
@@ -1,8 +1,13 @@
 """Project management for ClaudeCraft."""
 
+import errno
+import os
 import re
 import shutil
+import stat
 import sys
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
@@ -11,6 +16,164 @@ from claudecraft.core.models import Spec, SpecStatus, Task, TaskStatus
 from claudecraft.core.store import FileStore
 from claudecraft.memory.store import MemoryStore
 
+_FICLONE: int | None
+try:
+    from fcntl import FICLONE as _FICLONE
+    from fcntl import ioctl as _ioctl
+except ImportError:  # not Linux, or no FICLONE in this build
+    _FICLONE = None
+
+# Cleared on the first clone the filesystem refuses, so filesystems without
+# copy-on-write (ext4, tmpfs, overlayfs) pay for at most one failed attempt
+_reflink_supported = _FICLONE is not None
+_NO_REFLINK_ERRNOS = frozenset({errno.EOPNOTSUPP, errno.EXDEV, errno.EINVAL})
+
+# tasks.md parsing patterns
+# Format: ### Task: TASK-XXX, then one line per field:
+#   - **Title**: ...\n- **Description**: ...\n- **Priority**: ...\n- **Dependencies**: [...]
+# Splitting on the task header yields [preamble, id1, body1, id2, body2, ...]
+# in one linear pass, with no lazy DOTALL scan for the end of each block.
+_TASK_HEADER_RE = re.compile(r"###\s+Task:\s+([A-Z]+-\d+)")
+# One alternation picks up every field of a task block in a single pass
+_TASK_FIELD_RE = re.compile(
+    r"\*\*Title\*\*:\s*(?P<title>.+?)(?:\n|$)"
+    r"|\*\*Description\*\*:\s*(?P<description>.+?)(?:\n|$)"
+    r"|\*\*Priority\*\*:\s*(?P<priority>\d+)"
+    r"|\*\*Dependencies\*\*:\s*\[(?P<dependencies>.*?)\]"
+    r"|\*\*Assignee\*\*:\s*(?P<assignee>\w+)"
+)
+
+# First markdown H1 in spec.md, used as the spec title
+_H1_RE = re.compile(r"^#\s+(.+?)$", re.MULTILINE)
+
+
+# Claude templates bundled in the package (src/claudecraft/templates)
+_TEMPLATE_DIR = Path(__file__).resolve().parent.parent / "templates"
+
+# Worker threads used to copy Claude templates
+_COPY_WORKERS = 8
+
+# .worktrees/.gitignore: ignore every worktree but keep the ignore file itself
+_WORKTREES_GITIGNORE = b"*\n!.gitignore\n"
+
+
+def _walk_files(root: str | os.PathLike[str]) -> Iterator[os.DirEntry[str]]:
+    """Yield a DirEntry for every file below root.
+
+    Uses os.scandir directly so each entry's type and stat come from the
+    directory listing rather than extra stat calls. Symlinked directories
+    are not followed, matching Path.rglob.
+    """
+    stack = [os.fspath(root)]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file():
+                    yield entry
+
+
+def _template_category(rel_path: str) -> str | None:
+    """Classify a file under the template directory by its relative path.
+
+    Returns "agents", "commands", "hooks", "skills" or "scripts" for files
+    that belong in .claude/, or None for anything else. Matching is plain
+    string work on the path segments, so no Path objects or glob patterns
+    are involved.
+    """
+    parts = rel_path.split(os.sep)
+    top, name = parts[0], parts[-1]
+    if top == "skills":
+        return "skills" if len(parts) > 2 and parts[1] == "claudecraft" else None
+    if name.startswith("."):
+        return None
+    if len(parts) == 2:
+        if top in ("agents", "commands") and name.endswith(".md"):
+            return top
+        if top == "hooks" and name.startswith("hooks."):
+            return "hooks"
+    elif len(parts) == 3 and top == "hooks" and parts[1] == "scripts":
+        if name.endswith((".sh", ".py")):
+            return "scripts"
+    return None
+
+
+def _make_dirs(dirs: list[Path]) -> None:
+    """Create directories and their parents.
+
+    Deepest paths are created first; since os.makedirs creates every missing
+    parent, any listed directory that is an ancestor of one already created
+    is skipped rather than walked again.
+    """
+    covered: set[Path] = set()
+    for d in sorted(dirs, key=lambda p: len(p.parts), reverse=True):
+        if d in covered:
+            continue
+        os.makedirs(d, exist_ok=True)
+        covered.update(d.parents)
+
+
+def _clone_or_copy(src: str | os.PathLike[str], dst: str | os.PathLike[str]) -> None:
+    """Copy src to dst with its metadata, as a reflink where possible.
+
+    On copy-on-write filesystems (Btrfs, XFS) FICLONE shares the source's
+    extents instead of moving any data, and the clone still becomes an
+    independent file on its first write. Hard links are deliberately not
+    used: editing a project template in place would then also rewrite the
+    packaged one. Anywhere cloning is unsupported this is shutil.copy2.
+    """
+    global _reflink_supported
+    if _FICLONE is None or not _reflink_supported:
+        shutil.copy2(src, dst)
+        return
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        try:
+            _ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+        except OSError as e:
+            if e.errno in _NO_REFLINK_ERRNOS:
+                _reflink_supported = False
+            # Fill the file already created rather than open it again
+            shutil.copyfileobj(fsrc, fdst)
+    shutil.copystat(src, dst)
+
+
+def _copy_template_file(
+    src: str | os.PathLike[str],
+    dst: str | os.PathLike[str],
+    src_stat: os.stat_result | None = None,
+    dst_exists: bool = True,
+    mode: int | None = None,
+) -> None:
+    """Copy a template file, skipping it when dst is already up to date.
+
+    The copy (a reflink or shutil.copy2, see _clone_or_copy) preserves
+    mtime, so a destination with the same size and mtime as the source is
+    an earlier copy of it and does not need to be rewritten. Callers that
+    already know dst is missing pass dst_exists=False to skip its stat.
+
+    If mode is given, dst ends up with those permission bits. The copy
+    preserves the source's mode, so chmod only runs when the mode already
+    known from the source (or the skipped destination) differs.
+    """
+    if src_stat is None:
+        src_stat = os.stat(src)
+    if dst_exists:
+        try:
+            dst_stat = os.stat(dst)
+        except FileNotFoundError:
+            pass
+        else:
+            if dst_stat.st_size == src_stat.st_size and int(dst_stat.st_mtime) == int(
+                src_stat.st_mtime
+            ):
+                if mode is not None and stat.S_IMODE(dst_stat.st_mode) != mode:
+                    os.chmod(dst, mode)
+                return
+    _clone_or_copy(src, dst)
+    if mode is not None and stat.S_IMODE(src_stat.st_mode) != mode:
+        os.chmod(dst, mode)
+
 
 class Project:
     """A ClaudeCraft project."""
@@ -43,13 +206,12 @@ class Project:
             path / ".worktrees",
         ]
 
-        for d in dirs:
-            d.mkdir(parents=True, exist_ok=True)
+        _make_dirs(dirs)
 
         # Create .gitignore for worktrees
         gitignore = path / ".worktrees" / ".gitignore"
         if not gitignore.exists():
-            gitignore.write_text("*\n!.gitignore\n")
+            gitignore.write_bytes(_WORKTREES_GITIGNORE)
 
         # Create config
         config_path = path / ".claudecraft" / "config.yaml"
@@ -62,7 +224,9 @@ class Project:
         # Create constitution template
         constitution_path = path / ".claudecraft" / "constitution.md"
         if not constitution_path.exists():
-            constitution_path.write_text(_CONSTITUTION_TEMPLATE.format(project_name=project_name))
+            constitution_path.write_bytes(
+                _CONSTITUTION_PREFIX + project_name.encode() + _CONSTITUTION_SUFFIX
+            )
 
         # Copy Claude templates (agents, skills, commands, hooks)
         cls._copy_claude_templates(path, update=update_templates)
@@ -77,67 +241,50 @@ class Project:
             target_path: Project root directory
             update: If True, overwrite existing files
         """
-        # Find the template directory (bundled in the package)
-        package_dir = Path(__file__).parent.parent  # src/claudecraft
-        template_dir = package_dir / "templates"
-
+        template_dir = _TEMPLATE_DIR
         if not template_dir.exists():
             # No templates available
             return
 
         target_claude = target_path / ".claude"
 
-        def should_copy(target_file: Path) -> bool:
-            """Check if we should copy to target file."""
-            return update or not target_file.exists()
-
-        # Copy agents
-        agents_src = template_dir / "agents"
-        if agents_src.exists():
-            for agent_file in agents_src.glob("*.md"):
-                target_file = target_claude / "agents" / agent_file.name
-                if should_copy(target_file):
-                    shutil.copy2(agent_file, target_file)
-
-        # Copy skills
-        skills_src = template_dir / "skills" / "claudecraft"
-        if skills_src.exists():
-            target_skills = target_claude / "skills" / "claudecraft"
-            for skill_file in skills_src.rglob("*"):
-                if skill_file.is_file():
-                    rel_path = skill_file.relative_to(skills_src)
-                    target_file = target_skills / rel_path
-                    target_file.parent.mkdir(parents=True, exist_ok=True)
-                    if should_copy(target_file):
-                        shutil.copy2(skill_file, target_file)
-
-        # Copy commands
-        commands_src = template_dir / "commands"
-        if commands_src.exists():
-            for cmd_file in commands_src.glob("*.md"):
-                target_file = target_claude / "commands" / cmd_file.name
-                if should_copy(target_file):
-                    shutil.copy2(cmd_file, target_file)
-
-        # Copy hooks
-        hooks_src = template_dir / "hooks"
-        if hooks_src.exists():
-            # Copy hooks.json or hooks.yaml
-            for hooks_file in hooks_src.glob("hooks.*"):
-                target_file = target_claude / "hooks" / hooks_file.name
-                if should_copy(target_file):
-                    shutil.copy2(hooks_file, target_file)
-
-            # Copy hook scripts (shell and Python)
-            scripts_src = hooks_src / "scripts"
-            if scripts_src.exists():
-                for pattern in ("*.sh", "*.py"):
-                    for script in scripts_src.glob(pattern):
-                        target_file = target_claude / "hooks" / "scripts" / script.name
-                        if should_copy(target_file):
-                            shutil.copy2(script, target_file)
-                            # Make scripts executable
-                            target_file.chmod(0o755)
+        # Relative paths of files already under .claude/, from one walk of the
+        # target tree instead of an exists() call per template file
+        target_root = os.fspath(target_claude)
+        try:
+            existing = {
+                entry.path[len(target_root) + 1 :] for entry in _walk_files(target_root)
+            }
+        except FileNotFoundError:
+            existing = set()
+
+        # (source, target, source stat, target exists, target mode), copied
+        # together below; hook scripts must end up executable.
+        # Paths stay plain strings; no Path object is built per template file.
+        copies: list[tuple[str, str, os.stat_result, bool, int | None]] = []
+        parents: set[str] = set()
+
+        # One walk over the template tree; every file keeps its relative path
+        # under .claude/ (agents, skills, commands, hooks and hook scripts)
+        template_root = os.fspath(template_dir)
+        for entry in _walk_files(template_root):
+            rel_path = entry.path[len(template_root) + 1 :]
+            category = _template_category(rel_path)
+            if category is None:
+                continue
+            target_file = os.path.join(target_root, rel_path)
+            parent = os.path.dirname(target_file)
+            if parent not in parents:
+                os.makedirs(parent, exist_ok=True)
+                parents.add(parent)
+            exists = rel_path in existing
+            if update or not exists:
+                mode = 0o755 if category == "scripts" else None
+                copies.append((entry.path, target_file, entry.stat(), exists, mode))
+
+        # Each copy is independent, syscall-bound I/O, so overlap them on threads
+        with ThreadPoolExecutor(max_workers=_COPY_WORKERS) as executor:
+            list(executor.map(lambda job: _copy_template_file(*job), copies))
 
     @classmethod
     def load(cls, path: Path | None = None) -> "Project":
@@ -180,39 +327,41 @@ class Project:
 
         content = tasks_file.read_text()
 
-        # Parse tasks from markdown
-        # Format: ### Task: TASK-XXX\n- **Title**: ...\n- **Description**: ...\n- **Priority**: ...\n- **Dependencies**: [...]
-        task_pattern = r'###\s+Task:\s+([A-Z]+-\d+)(.*?)(?=###\s+Task:|$)'
-        matches = re.findall(task_pattern, content, re.DOTALL)
+        # Existing task IDs across all specs, fetched once up front
+        existing_ids = self.db.list_task_ids()
 
-        imported = 0
-        for task_id, task_block in matches:
+        # Tasks imported in one batch share a timestamp
+        now = datetime.now()
+
+        # Parse tasks from markdown
+        new_tasks: list[Task] = []
+        parts = _TASK_HEADER_RE.split(content)
+        for task_id, task_block in zip(parts[1::2], parts[2::2], strict=True):
             task_id = task_id.strip()
 
-            # Extract fields
-            title_match = re.search(r'\*\*Title\*\*:\s*(.+?)(?:\n|$)', task_block)
-            desc_match = re.search(r'\*\*Description\*\*:\s*(.+?)(?:\n|$)', task_block)
-            priority_match = re.search(r'\*\*Priority\*\*:\s*(\d+)', task_block)
-            deps_match = re.search(r'\*\*Dependencies\*\*:\s*\[(.*?)\]', task_block)
-            assignee_match = re.search(r'\*\*Assignee\*\*:\s*(\w+)', task_block)
+            # Extract fields, keeping the first occurrence of each
+            fields: dict[str, str] = {}
+            for field_match in _TASK_FIELD_RE.finditer(task_block):
+                for name, value in field_match.groupdict().items():
+                    if value is not None:
+                        fields.setdefault(name, value)
 
-            title = title_match.group(1).strip() if title_match else task_id
-            description = desc_match.group(1).strip() if desc_match else ""
-            priority = int(priority_match.group(1)) if priority_match else 5
+            title = fields["title"].strip() if "title" in fields else task_id
+            description = fields.get("description", "").strip()
+            priority = int(fields["priority"]) if "priority" in fields else 5
 
             # Parse dependencies
             dependencies = []
-            if deps_match:
-                deps_str = deps_match.group(1).strip()
-                if deps_str:
-                    dependencies = [d.strip() for d in deps_str.split(',') if d.strip()]
+            deps_str = fields.get("dependencies", "").strip()
+            if deps_str:
+                dependencies = [d.strip() for d in deps_str.split(',') if d.strip()]
 
-            assignee = assignee_match.group(1) if assignee_match else None
+            assignee = fields.get("assignee")
 
             # Check if task already exists
-            existing = self.db.get_task(task_id)
-            if existing:
+            if task_id in existing_ids:
                 continue  # Skip existing tasks
+            existing_ids.add(task_id)
 
             # Create task with new TODO status
             task = Task(
@@ -226,15 +375,15 @@ class Project:
                 assignee=assignee,
                 worktree=None,
                 iteration=0,
-                created_at=datetime.now(),
-                updated_at=datetime.now(),
+                created_at=now,
+                updated_at=now,
                 metadata={}
             )
 
-            self.db.create_task(task)
-            imported += 1
+            new_tasks.append(task)
 
-        return imported
+        self.db.create_tasks(new_tasks)
+        return len(new_tasks)
 
     def migrate_legacy_tasks(self, spec_id: str) -> int:
         """Migrate tasks from legacy tasks.md file to database.
@@ -267,6 +416,10 @@ class Project:
         if not specs_dir.exists():
             return 0
 
+        # Registered spec IDs, fetched once up front
+        existing_ids = self.db.list_spec_ids()
+
+        now = datetime.now()
         registered = 0
         for spec_dir in specs_dir.iterdir():
             if not spec_dir.is_dir():
@@ -275,7 +428,7 @@ class Project:
             spec_id = spec_dir.name
 
             # Check if already registered
-            if self.db.get_spec(spec_id):
+            if spec_id in existing_ids:
                 continue
 
             # Check if spec.md exists
@@ -285,7 +438,7 @@ class Project:
 
             # Extract title from spec.md
             content = spec_file.read_text()
-            title_match = re.search(r'^#\s+(.+?)$', content, re.MULTILINE)
+            title_match = _H1_RE.search(content)
             title = title_match.group(1).strip() if title_match else spec_id
 
             # Determine source type
@@ -301,8 +454,8 @@ class Project:
                 title=title,
                 status=SpecStatus.SPECIFIED,  # Assume specified since spec.md exists
                 source_type=source_type,
-                created_at=datetime.now(),
-                updated_at=datetime.now(),
+                created_at=now,
+                updated_at=now,
                 metadata={}
             )
 
@@ -439,3 +592,9 @@ _CONSTITUTION_TEMPLATE = """# Project Constitution
 - [Approaches that should NOT be taken]
 - [Technologies that should NOT be used]
 """
+
+# Pre-encoded halves around the template's single {project_name} slot, so
+# init concatenates bytes instead of formatting and encoding the template.
+_CONSTITUTION_PREFIX, _CONSTITUTION_SUFFIX = (
+    part.encode() for part in _CONSTITUTION_TEMPLATE.split("{project_name}")
+)
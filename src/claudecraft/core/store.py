@@ -192,13 +192,24 @@ class FileStore:
             data = self._read_json(meta_file)
             if data is None:
                 continue
-            spec = Spec.from_dict(data)
-            if status is None or spec.status == status:
-                specs.append(spec)
+            # Compare the raw value so non-matching specs are never hydrated
+            if status is not None and data.get("status") != status.value:
+                continue
+            specs.append(Spec.from_dict(data))
 
         specs.sort(key=lambda s: s.updated_at, reverse=True)
         return specs
 
+    def list_spec_ids(self) -> set[str]:
+        """Return the IDs of specs that have a meta.json, without parsing them.
+
+        Returns:
+            Set of spec identifiers.
+        """
+        if not self.specs_dir.exists():
+            return set()
+        return {meta_file.parent.name for meta_file in self.specs_dir.glob("*/meta.json")}
+
     # -------------------------------------------------------------------------
     # Task Runtime State (T008) — internal helpers
     # -------------------------------------------------------------------------
@@ -304,6 +315,20 @@ class FileStore:
             task_id: The task identifier.
             **fields: Key/value pairs to update in the task's runtime entry.
         """
+        self._update_tasks_runtime(spec_id, {task_id: fields})
+
+    def _update_tasks_runtime(
+        self, spec_id: str, updates: dict[str, dict[str, Any]]
+    ) -> None:
+        """Update several tasks' runtime entries in one read-modify-write.
+
+        Same optimistic concurrency as _update_task_runtime, but the state
+        file is read and rewritten once for the whole batch.
+
+        Args:
+            spec_id: The spec identifier.
+            updates: Mapping of task_id to the fields to update for that task.
+        """
         path = self.state_dir / f"{spec_id}.json"
         self._ensure_dir(self.state_dir)
 
@@ -317,13 +342,14 @@ class FileStore:
             state = self._read_runtime_state(spec_id)
             tasks: dict[str, Any] = state.get("tasks", {})
 
-            if task_id in tasks:
-                tasks[task_id].update(fields)
-            else:
-                # Initialize with defaults then apply updates
-                default = self._get_task_runtime(spec_id, task_id)
-                default.update(fields)
-                tasks[task_id] = default
+            for task_id, fields in updates.items():
+                if task_id in tasks:
+                    tasks[task_id].update(fields)
+                else:
+                    # Initialize with defaults then apply updates
+                    default = self._get_task_runtime(spec_id, task_id)
+                    default.update(fields)
+                    tasks[task_id] = default
 
             state["tasks"] = tasks
 
@@ -393,14 +419,14 @@ class FileStore:
         merged["updated_at"] = runtime.get("updated_at", definition.get("created_at"))
         return Task.from_dict(merged)
 
-    def create_task(self, task: Task) -> None:
-        """Write task definition to specs/{task.spec_id}/tasks/{task.id}.json.
-
-        Also initializes the runtime state entry for the task with the task's
-        current status, priority, assignee, worktree, iteration, and updated_at.
+    def _write_new_task_definition(self, task: Task) -> None:
+        """Write the definition file for a task that must not exist yet.
 
         Args:
             task: The Task instance to persist.
+
+        Raises:
+            ValueError: If a definition for the task already exists.
         """
         # Write definition (immutable fields only)
         definition: dict[str, Any] = {
@@ -422,18 +448,81 @@ class FileStore:
             )
         self._atomic_write(def_path, definition)
 
+    @staticmethod
+    def _task_runtime_fields(task: Task) -> dict[str, Any]:
+        """Return the runtime-state fields for a task.
+
+        Args:
+            task: The Task instance.
+
+        Returns:
+            Dict of status, priority, assignee, worktree, iteration, updated_at.
+        """
+        return {
+            "status": task.status.value,
+            "priority": task.priority,
+            "assignee": task.assignee,
+            "worktree": task.worktree,
+            "iteration": task.iteration,
+            "updated_at": task.updated_at.isoformat(),
+        }
+
+    def create_task(self, task: Task) -> None:
+        """Write task definition to specs/{task.spec_id}/tasks/{task.id}.json.
+
+        Also initializes the runtime state entry for the task with the task's
+        current status, priority, assignee, worktree, iteration, and updated_at.
+
+        Args:
+            task: The Task instance to persist.
+        """
+        self._write_new_task_definition(task)
+
         # Initialize runtime state
         self._update_task_runtime(
-            task.spec_id,
-            task.id,
-            status=task.status.value,
-            priority=task.priority,
-            assignee=task.assignee,
-            worktree=task.worktree,
-            iteration=task.iteration,
-            updated_at=task.updated_at.isoformat(),
+            task.spec_id, task.id, **self._task_runtime_fields(task)
         )
 
+    def create_tasks(self, tasks: list[Task]) -> None:
+        """Create several tasks, writing each spec's runtime state once.
+
+        Definitions are written one file per task as in create_task, but the
+        runtime entries are applied in a single read-modify-write per spec
+        instead of one per task.
+
+        Args:
+            tasks: The Task instances to persist.
+
+        Raises:
+            ValueError: If any task definition already exists. Tasks before it
+                have their definitions written, and all written tasks get
+                runtime entries before the error propagates.
+        """
+        by_spec: dict[str, dict[str, dict[str, Any]]] = {}
+        try:
+            for task in tasks:
+                self._write_new_task_definition(task)
+                by_spec.setdefault(task.spec_id, {})[task.id] = (
+                    self._task_runtime_fields(task)
+                )
+        finally:
+            for spec_id, updates in by_spec.items():
+                self._update_tasks_runtime(spec_id, updates)
+
+    def list_task_ids(self, spec_id: str | None = None) -> set[str]:
+        """Return the IDs of existing task definitions without parsing them.
+
+        Args:
+            spec_id: If given, only that spec's tasks. Otherwise all specs.
+
+        Returns:
+            Set of task identifiers.
+        """
+        pattern = f"{spec_id}/tasks/*.json" if spec_id is not None else "*/tasks/*.json"
+        if not self.specs_dir.exists():
+            return set()
+        return {task_file.stem for task_file in self.specs_dir.glob(pattern)}
+
     def get_task(self, task_id: str, spec_id: str | None = None) -> Task | None:
         """Find and reconstitute task by merging definition and runtime state.
 
@@ -515,6 +604,27 @@ class FileStore:
         tasks.sort(key=lambda t: (-t.priority, t.created_at))
         return tasks
 
+    def count_tasks_by_status(self) -> dict[str, int]:
+        """Count tasks per status across all specs without loading them.
+
+        Reads one runtime state file per spec and lists task definition
+        files; definitions themselves are not parsed. Tasks with no runtime
+        entry count as todo, matching list_tasks.
+
+        Returns:
+            Mapping of status value to task count.
+        """
+        counts: dict[str, int] = {}
+        for spec_id in self.list_spec_ids():
+            tasks_dir = self.specs_dir / spec_id / "tasks"
+            if not tasks_dir.exists():
+                continue
+            runtime_tasks = self._read_runtime_state(spec_id).get("tasks", {})
+            for task_file in tasks_dir.glob("*.json"):
+                status = runtime_tasks.get(task_file.stem, {}).get("status", "todo")
+                counts[status] = counts.get(status, 0) + 1
+        return counts
+
     def get_ready_tasks(self, spec_id: str | None = None) -> list[Task]:
         """Return tasks where status=todo AND all dependencies have status=done.
 
@@ -704,6 +814,34 @@ class FileStore:
         finally:
             os.close(fd)
 
+    def append_execution_logs(self, logs: list[ExecutionLog]) -> None:
+        """Append several log entries, opening each task's log file once.
+
+        Entries keep their list order within each task's file. Each entry is
+        still written with its own os.write so the per-line atomicity of
+        append_execution_log is preserved.
+
+        Args:
+            logs: The ExecutionLog entries to append.
+        """
+        if not logs:
+            return
+        by_task: dict[str, list[bytes]] = {}
+        for log in logs:
+            by_task.setdefault(log.task_id, []).append(
+                (json.dumps(log.to_dict()) + "\n").encode()
+            )
+
+        self._ensure_dir(self.logs_dir)
+        for task_id, lines in by_task.items():
+            path = self.logs_dir / f"{task_id}.jsonl"
+            fd = os.open(str(path), os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+            try:
+                for data in lines:
+                    os.write(fd, data)
+            finally:
+                os.close(fd)
+
     def get_execution_logs(self, task_id: str) -> list[ExecutionLog]:
         """Read all log entries for a task from .claudecraft/logs/{task_id}.jsonl.
 
@@ -731,7 +869,7 @@ class FileStore:
         return logs
 
     def delete_execution_logs(self, task_id: str) -> None:
-        """Remove .claudecraft/logs/{task_id}.jsonl if it exists.
+        """Remove .claudecraft/logs/{task_id}.jsonl and the task's Ralph output logs.
 
         Args:
             task_id: The task identifier.
@@ -739,6 +877,22 @@ class FileStore:
         path = self.logs_dir / f"{task_id}.jsonl"
         with suppress(FileNotFoundError):
             path.unlink()
+        for ralph_log in self.logs_dir.glob(f"{task_id}.*.ralph.log"):
+            with suppress(FileNotFoundError):
+                ralph_log.unlink()
+
+    def ralph_output_path(self, task_id: str, agent_type: str) -> Path:
+        """Path of the full per-iteration output log for a task's Ralph loop.
+
+        Args:
+            task_id: The task identifier.
+            agent_type: The agent type running the loop.
+
+        Returns:
+            Path to .claudecraft/logs/{task_id}.{agent_type}.ralph.log.
+        """
+        self._ensure_dir(self.logs_dir)
+        return self.logs_dir / f"{task_id}.{agent_type}.ralph.log"
 
     # -------------------------------------------------------------------------
     # Agent Slots (T011)
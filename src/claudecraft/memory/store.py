@@ -1,13 +1,87 @@
 """Memory store for cross-session context."""
 
+import hashlib
+import heapq
 import json
+import mmap
+import os
+import re
+import tempfile
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import suppress
 from dataclasses import asdict, dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO
+
+_json_loads: Callable[[bytes | str], Any]
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # optional: pip install claudecraft[fast]
+    from json import loads as _json_loads
+
+# Logs larger than this are read through mmap rather than buffered reads
+_MMAP_THRESHOLD = 64 * 1024
+
+# Entity extraction patterns, compiled once for every extract_from_text call
+_FILE_RE = re.compile(
+    r"(?:^|\s)([\w\/\-\.]+\.(?:py|js|ts|tsx|md|json|yaml|yml|toml|sh))(?:\s|$|:|\))",
+    re.IGNORECASE,
+)
+_DECISION_RE = re.compile(
+    r"(?:Decision|We decided|Chosen approach|Using|Implementing with):\s*(.+?)(?:\n|$)",
+    re.IGNORECASE,
+)
+_PATTERN_RES = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r"(?:pattern|approach|architecture):\s*(.+?)(?:\n|$)",
+        r"(?:using|implemented)\s+"
+        r"(singleton|factory|observer|decorator|adapter|facade|repository)\s+pattern",
+        r"(?:following|using)\s+"
+        r"(mvc|mvvm|clean architecture|hexagonal|layered)\s+(?:pattern|architecture)",
+    )
+)
+_DEPENDENCY_RES = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r"(?:install|pip install|npm install|using)\s+([\w\-]+)",
+        r"(?:import|from)\s+([\w\.]+)",
+        r"(?:depends on|requires)\s+([\w\-\.]+)",
+    )
+)
+_NOTE_RE = re.compile(r"(?:TODO|FIXME|NOTE|IMPORTANT|WARNING):\s*(.+?)(?:\n|$)", re.IGNORECASE)
+
+
+def _read_lines(f: BinaryIO) -> Iterator[bytes]:
+    """Yield the lines of a binary file, through mmap once it is large.
+
+    A mapped log is read straight from the page cache, without read() calls
+    copying it through the file object's buffer first. Files that cannot be
+    mapped fall back to ordinary buffered iteration.
+    """
+    if os.fstat(f.fileno()).st_size > _MMAP_THRESHOLD:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except OSError:
+            pass
+        else:
+            with mm:
+                yield from iter(mm.readline, b"")
+            return
+    yield from f
+
+
+def _text_key(text: str) -> str:
+    """Return a short digest of text that is stable across interpreter runs.
 
+    Unlike hash(), which is salted per process, the same text always maps to
+    the same key, so entity ids derived from it dedupe across sessions.
+    """
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=8).hexdigest()
 
-@dataclass
+
+@dataclass(slots=True)
 class Entity:
     """An extracted entity from a session."""
 
@@ -36,70 +110,179 @@ class Entity:
 
 
 class MemoryStore:
-    """Store for persistent memory across sessions."""
+    """Store for persistent memory across sessions.
+
+    Entities are kept in an append-only JSONL log: every add appends one line
+    per entity and the last line for an id wins. The log is rewritten with
+    one line per live entity on cleanup, via compact(), and on load once
+    superseded lines outnumber live ones.
+    """
 
     def __init__(self, memory_dir: Path):
         """Initialize memory store."""
         self.memory_dir = memory_dir
         self.memory_dir.mkdir(parents=True, exist_ok=True)
-        self.entities_file = memory_dir / "entities.json"
+        self.entities_file = memory_dir / "entities.jsonl"
+        # Pre-JSONL format: a single JSON array, migrated on first load
+        self.legacy_entities_file = memory_dir / "entities.json"
         self.entities: dict[str, Entity] = {}
+        # Bumped on every write so callers can cache derived views
+        self.revision = 0
+        # Search index: entities by type and by spec id (None for general
+        # entities), lowered (name, description) per id and the oldest/newest
+        # entity, rebuilt lazily when the store has changed since it was built
+        self._index_key: tuple[int, int] | None = None
+        self._by_type: dict[str, list[Entity]] = {}
+        self._by_spec: dict[str | None, list[Entity]] = {}
+        self._lowered: dict[str, tuple[str, str]] = {}
+        self._oldest: Entity | None = None
+        self._newest: Entity | None = None
         self._load()
 
     def _load(self) -> None:
         """Load entities from disk."""
         if not self.entities_file.exists():
+            self._load_legacy()
+            return
+
+        try:
+            # Parse straight from bytes, one line at a time
+            with open(self.entities_file, "rb") as f:
+                lines = self._load_lines(_read_lines(f))
+        except OSError:
+            # If loading fails, start fresh
+            self.entities = {}
+            return
+
+        if lines > 2 * len(self.entities):
+            self._save()
+
+    def _load_lines(self, lines: Iterable[bytes]) -> int:
+        """Replay log lines into entities, returning how many were non-blank."""
+        count = 0
+        for line in lines:
+            if not line.strip():
+                continue
+            count += 1
+            try:
+                entity = Entity.from_dict(_json_loads(line))
+            except (ValueError, TypeError, KeyError):
+                # Skip a torn or corrupt line rather than the whole log
+                continue
+            self.entities[entity.id] = entity
+        return count
+
+    def _load_legacy(self) -> None:
+        """Import entities.json (a JSON array) and rewrite it as JSONL."""
+        if not self.legacy_entities_file.exists():
             return
 
         try:
-            with open(self.entities_file) as f:
-                data = json.load(f)
-                for entity_data in data:
-                    entity = Entity.from_dict(entity_data)
-                    self.entities[entity.id] = entity
+            data = _json_loads(self.legacy_entities_file.read_bytes())
+            for entity_data in data:
+                entity = Entity.from_dict(entity_data)
+                self.entities[entity.id] = entity
         except Exception:
             # If loading fails, start fresh
             self.entities = {}
+            return
+
+        if self.entities:
+            self._save()
+
+    def _append(self, entities: Iterable[Entity]) -> None:
+        """Append entities to the log with a single write."""
+        payload = "".join(json.dumps(entity.to_dict()) + "\n" for entity in entities)
+        if not payload:
+            return
+        self.revision += 1
+        with open(self.entities_file, "a", encoding="utf-8") as f:
+            f.write(payload)
 
     def _save(self) -> None:
-        """Save entities to disk."""
-        data = [entity.to_dict() for entity in self.entities.values()]
-        with open(self.entities_file, "w") as f:
-            json.dump(data, f, indent=2)
+        """Rewrite the log with one line per live entity."""
+        self.revision += 1
+        payload = "".join(
+            json.dumps(entity.to_dict()) + "\n" for entity in self.entities.values()
+        )
+        fd, tmp_path = tempfile.mkstemp(dir=self.memory_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(payload)
+            os.replace(tmp_path, self.entities_file)
+        except BaseException:
+            with suppress(OSError):
+                os.unlink(tmp_path)
+            raise
+
+    def compact(self) -> None:
+        """Drop superseded lines from the log."""
+        self._save()
 
     def add_entity(self, entity: Entity) -> None:
         """Add or update an entity."""
-        entity.updated_at = datetime.now()
-        self.entities[entity.id] = entity
-        self._save()
+        self.add_entities([entity])
+
+    def add_entities(self, entities: Iterable[Entity]) -> None:
+        """Add or update several entities with a single append to the log."""
+        now = datetime.now()
+        batch = list(entities)
+        for entity in batch:
+            entity.updated_at = now
+            self.entities[entity.id] = entity
+        self._append(batch)
 
     def get_entity(self, entity_id: str) -> Entity | None:
         """Get an entity by ID."""
         return self.entities.get(entity_id)
 
+    def _refresh_search_index(self) -> None:
+        """Rebuild the type, spec and lowercase-text index if the store changed."""
+        key = (self.revision, len(self.entities))
+        if self._index_key == key:
+            return
+        by_type: dict[str, list[Entity]] = {}
+        by_spec: dict[str | None, list[Entity]] = {}
+        lowered: dict[str, tuple[str, str]] = {}
+        oldest = newest = None
+        for entity in self.entities.values():
+            by_type.setdefault(entity.type, []).append(entity)
+            by_spec.setdefault(entity.context.get("spec_id"), []).append(entity)
+            lowered[entity.id] = (entity.name.lower(), entity.description.lower())
+            if oldest is None or entity.created_at < oldest.created_at:
+                oldest = entity
+            if newest is None or entity.created_at > newest.created_at:
+                newest = entity
+        self._by_type = by_type
+        self._by_spec = by_spec
+        self._lowered = lowered
+        self._oldest = oldest
+        self._newest = newest
+        self._index_key = key
+
     def search_entities(
         self, entity_type: str | None = None, keyword: str | None = None, limit: int = 10
     ) -> list[Entity]:
         """Search entities by type and/or keyword."""
-        results = list(self.entities.values())
+        self._refresh_search_index()
 
         # Filter by type
-        if entity_type:
-            results = [e for e in results if e.type == entity_type]
+        results: Iterable[Entity] = (
+            self._by_type.get(entity_type, []) if entity_type else self.entities.values()
+        )
 
         # Filter by keyword
         if keyword:
             keyword_lower = keyword.lower()
+            lowered = self._lowered
             results = [
                 e
                 for e in results
-                if keyword_lower in e.name.lower() or keyword_lower in e.description.lower()
+                if keyword_lower in lowered[e.id][0] or keyword_lower in lowered[e.id][1]
             ]
 
-        # Sort by relevance score
-        results.sort(key=lambda e: e.relevance_score, reverse=True)
-
-        return results[:limit]
+        # Top results by relevance score (ties keep insertion order, like a stable sort)
+        return heapq.nlargest(limit, results, key=lambda e: e.relevance_score)
 
     def extract_from_text(self, text: str, source: str, spec_id: str | None = None) -> list[Entity]:
         """
@@ -112,143 +295,91 @@ class MemoryStore:
         - Technical notes
         - Dependencies
         """
-        entities = []
-        import re
-
-        base_context = {"source": source}
-        if spec_id:
-            base_context["spec_id"] = spec_id
+        # Candidate entities by id as (type, name, description, relevance); the
+        # first match for an id wins. Known ids are dropped in one pass at the end.
+        candidates: dict[str, tuple[str, str, str, float]] = {}
 
         # Extract file references
-        file_pattern = r"(?:^|\s)([\w\/\-\.]+\.(py|js|ts|tsx|md|json|yaml|yml|toml|sh))(?:\s|$|:|\))"
-        for match in re.finditer(file_pattern, text, re.IGNORECASE):
+        for match in _FILE_RE.finditer(text):
             file_path = match.group(1)
-            entity_id = f"file:{file_path}"
-
-            if entity_id not in self.entities:
-                entity = Entity(
-                    id=entity_id,
-                    type="file",
-                    name=file_path,
-                    description=f"File referenced in {source}",
-                    context=base_context.copy(),
-                    created_at=datetime.now(),
-                    updated_at=datetime.now(),
-                )
-                entities.append(entity)
-                self.add_entity(entity)
+            candidates.setdefault(
+                f"file:{file_path}", ("file", file_path, f"File referenced in {source}", 1.0)
+            )
 
         # Extract decisions (lines starting with "Decision:", "We decided", etc.)
-        decision_pattern = r"(?:Decision|We decided|Chosen approach|Using|Implementing with):\s*(.+?)(?:\n|$)"
-        for match in re.finditer(decision_pattern, text, re.IGNORECASE):
+        for match in _DECISION_RE.finditer(text):
             decision = match.group(1).strip()
             if len(decision) > 10:  # Skip very short matches
-                entity_id = f"decision:{abs(hash(decision)) % 100000}"
-
-                if entity_id not in self.entities:
-                    entity = Entity(
-                        id=entity_id,
-                        type="decision",
-                        name=decision[:50],
-                        description=decision,
-                        context=base_context.copy(),
-                        created_at=datetime.now(),
-                        updated_at=datetime.now(),
-                        relevance_score=0.9,
-                    )
-                    entities.append(entity)
-                    self.add_entity(entity)
+                candidates.setdefault(
+                    f"decision:{_text_key(decision)}",
+                    ("decision", decision[:50], decision, 0.9),
+                )
 
         # Extract patterns (architectural patterns, design patterns)
-        pattern_indicators = [
-            r"(?:pattern|approach|architecture):\s*(.+?)(?:\n|$)",
-            r"(?:using|implemented)\s+(singleton|factory|observer|decorator|adapter|facade|repository)\s+pattern",
-            r"(?:following|using)\s+(mvc|mvvm|clean architecture|hexagonal|layered)\s+(?:pattern|architecture)",
-        ]
-        for pattern in pattern_indicators:
-            for match in re.finditer(pattern, text, re.IGNORECASE):
+        for pattern_re in _PATTERN_RES:
+            for match in pattern_re.finditer(text):
                 pattern_desc = match.group(1).strip() if match.lastindex else match.group(0).strip()
-                entity_id = f"pattern:{abs(hash(pattern_desc)) % 100000}"
-
-                if entity_id not in self.entities and len(pattern_desc) > 5:
-                    entity = Entity(
-                        id=entity_id,
-                        type="pattern",
-                        name=pattern_desc[:50],
-                        description=pattern_desc,
-                        context=base_context.copy(),
-                        created_at=datetime.now(),
-                        updated_at=datetime.now(),
-                        relevance_score=0.8,
+                if len(pattern_desc) > 5:
+                    candidates.setdefault(
+                        f"pattern:{_text_key(pattern_desc)}",
+                        ("pattern", pattern_desc[:50], pattern_desc, 0.8),
                     )
-                    entities.append(entity)
-                    self.add_entity(entity)
 
         # Extract dependencies (package names, libraries)
-        dependency_patterns = [
-            r"(?:install|pip install|npm install|using)\s+([\w\-]+)",
-            r"(?:import|from)\s+([\w\.]+)",
-            r"(?:depends on|requires)\s+([\w\-\.]+)",
-        ]
-        for pattern in dependency_patterns:
-            for match in re.finditer(pattern, text, re.IGNORECASE):
+        for dependency_re in _DEPENDENCY_RES:
+            for match in dependency_re.finditer(text):
                 dep = match.group(1).strip()
                 # Skip common Python builtins and short names
                 if len(dep) > 2 and dep not in ["os", "re", "sys", "json", "from", "import"]:
-                    entity_id = f"dependency:{dep}"
-
-                    if entity_id not in self.entities:
-                        entity = Entity(
-                            id=entity_id,
-                            type="dependency",
-                            name=dep,
-                            description=f"Dependency: {dep}",
-                            context=base_context.copy(),
-                            created_at=datetime.now(),
-                            updated_at=datetime.now(),
-                            relevance_score=0.6,
-                        )
-                        entities.append(entity)
-                        self.add_entity(entity)
+                    candidates.setdefault(
+                        f"dependency:{dep}", ("dependency", dep, f"Dependency: {dep}", 0.6)
+                    )
 
         # Extract technical notes (TODO, FIXME, NOTE, IMPORTANT)
-        note_pattern = r"(?:TODO|FIXME|NOTE|IMPORTANT|WARNING):\s*(.+?)(?:\n|$)"
-        for match in re.finditer(note_pattern, text, re.IGNORECASE):
+        for match in _NOTE_RE.finditer(text):
             note = match.group(1).strip()
             if len(note) > 10:
-                entity_id = f"note:{abs(hash(note)) % 100000}"
-
-                if entity_id not in self.entities:
-                    entity = Entity(
-                        id=entity_id,
-                        type="note",
-                        name=note[:50],
-                        description=note,
-                        context=base_context.copy(),
-                        created_at=datetime.now(),
-                        updated_at=datetime.now(),
-                        relevance_score=0.7,
-                    )
-                    entities.append(entity)
-                    self.add_entity(entity)
+                candidates.setdefault(f"note:{_text_key(note)}", ("note", note[:50], note, 0.7))
 
+        # Only ids the store does not know yet become entities, persisted with
+        # one append
+        new_ids = candidates.keys() - self.entities.keys()
+        base_context = {"source": source}
+        if spec_id:
+            base_context["spec_id"] = spec_id
+        now = datetime.now()
+        entities = [
+            Entity(
+                id=entity_id,
+                type=entity_type,
+                name=name,
+                description=description,
+                context=base_context.copy(),
+                created_at=now,
+                updated_at=now,
+                relevance_score=relevance,
+            )
+            for entity_id, (entity_type, name, description, relevance) in candidates.items()
+            if entity_id in new_ids
+        ]
+        self.add_entities(entities)
         return entities
 
     def get_context_for_spec(self, spec_id: str) -> str:
         """Get relevant context for a specification."""
-        # Find entities related to this spec (prioritize spec-specific, then general)
-        spec_entities = [
-            e for e in self.entities.values()
-            if e.context.get("spec_id") == spec_id
-        ]
-        general_entities = [
-            e for e in self.entities.values()
-            if e.context.get("spec_id") is None
-        ]
+        self._refresh_search_index()
+        limit = 30  # Limit total entities
 
-        # Combine: spec-specific first, then general (sorted by relevance)
-        entities = sorted(spec_entities, key=lambda e: e.relevance_score, reverse=True)
-        entities += sorted(general_entities, key=lambda e: e.relevance_score, reverse=True)
+        # Spec-specific entities first, then general ones, each by relevance.
+        # Only the top `limit` are ever shown, so neither group is fully sorted.
+        def by_relevance(e: Entity) -> float:
+            return e.relevance_score
+
+        entities = heapq.nlargest(limit, self._by_spec.get(spec_id, []), key=by_relevance)
+        if len(entities) < limit and spec_id is not None:
+            entities += heapq.nlargest(
+                limit - len(entities), self._by_spec.get(None, []), key=by_relevance
+            )
 
         if not entities:
             return ""  # Return empty string if no context
@@ -257,10 +388,8 @@ class MemoryStore:
 
         # Group by type
         by_type: dict[str, list[Entity]] = {}
-        for entity in entities[:30]:  # Limit total entities
-            if entity.type not in by_type:
-                by_type[entity.type] = []
-            by_type[entity.type].append(entity)
+        for entity in entities:
+            by_type.setdefault(entity.type, []).append(entity)
 
         # Order types by importance
         type_order = ["decision", "pattern", "note", "file", "dependency"]
@@ -284,10 +413,8 @@ class MemoryStore:
 
     def get_entities_for_spec(self, spec_id: str) -> list[Entity]:
         """Get all entities associated with a specific spec."""
-        return [
-            e for e in self.entities.values()
-            if e.context.get("spec_id") == spec_id
-        ]
+        self._refresh_search_index()
+        return list(self._by_spec.get(spec_id, []))
 
     def add_memory(
         self,
@@ -298,7 +425,7 @@ class MemoryStore:
         relevance: float = 1.0,
     ) -> Entity:
         """Convenience method to add a memory entry."""
-        entity_id = f"{entity_type}:{abs(hash(name + description)) % 100000}"
+        entity_id = f"{entity_type}:{_text_key(name + description)}"
 
         context = {}
         if spec_id:
@@ -322,32 +449,24 @@ class MemoryStore:
         from datetime import timedelta
 
         cutoff = datetime.now() - timedelta(days=days)
-        before_count = len(self.entities)
+        stale = [eid for eid, entity in self.entities.items() if entity.updated_at < cutoff]
 
-        self.entities = {
-            eid: entity for eid, entity in self.entities.items() if entity.updated_at >= cutoff
-        }
+        # Nothing to prune: leave the log untouched rather than rewriting it
+        if not stale:
+            return 0
+
+        for eid in stale:
+            del self.entities[eid]
 
         self._save()
-        return before_count - len(self.entities)
+        return len(stale)
 
     def get_stats(self) -> dict[str, Any]:
         """Get memory store statistics."""
-        by_type: dict[str, int] = {}
-        for entity in self.entities.values():
-            by_type[entity.type] = by_type.get(entity.type, 0) + 1
-
+        self._refresh_search_index()
         return {
             "total_entities": len(self.entities),
-            "by_type": by_type,
-            "oldest_entity": (
-                min(self.entities.values(), key=lambda e: e.created_at).created_at.isoformat()
-                if self.entities
-                else None
-            ),
-            "newest_entity": (
-                max(self.entities.values(), key=lambda e: e.created_at).created_at.isoformat()
-                if self.entities
-                else None
-            ),
+            "by_type": {t: len(entities) for t, entities in self._by_type.items()},
+            "oldest_entity": self._oldest.created_at.isoformat() if self._oldest else None,
+            "newest_entity": self._newest.created_at.isoformat() if self._newest else None,
         }
@@ -1,17 +1,37 @@
 """Orchestration modules for ClaudeCraft."""
 
-from claudecraft.orchestration.agent_pool import AgentPool
-from claudecraft.orchestration.execution import ExecutionPipeline
-from claudecraft.orchestration.merge import MergeOrchestrator
-from claudecraft.orchestration.ralph import (
-    PromiseVerifier,
-    RalphLoop,
-    RalphLoopConfig,
-    RalphLoopState,
-    VerificationResult,
-    verify_task_completion,
-)
-from claudecraft.orchestration.worktree import WorktreeManager
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from claudecraft.orchestration.agent_pool import AgentPool
+    from claudecraft.orchestration.execution import ExecutionPipeline
+    from claudecraft.orchestration.merge import MergeOrchestrator
+    from claudecraft.orchestration.ralph import (
+        PromiseVerifier,
+        RalphLoop,
+        RalphLoopConfig,
+        RalphLoopState,
+        VerificationResult,
+        verify_task_completion,
+    )
+    from claudecraft.orchestration.worktree import WorktreeManager
+
+# Re-exports are resolved on first access, so importing one submodule (e.g.
+# worktree from the CLI) does not pull in GitPython merge support, the
+# execution pipeline and the Ralph loop.
+_EXPORTS = {
+    "AgentPool": "claudecraft.orchestration.agent_pool",
+    "ExecutionPipeline": "claudecraft.orchestration.execution",
+    "MergeOrchestrator": "claudecraft.orchestration.merge",
+    "PromiseVerifier": "claudecraft.orchestration.ralph",
+    "RalphLoop": "claudecraft.orchestration.ralph",
+    "RalphLoopConfig": "claudecraft.orchestration.ralph",
+    "RalphLoopState": "claudecraft.orchestration.ralph",
+    "VerificationResult": "claudecraft.orchestration.ralph",
+    "WorktreeManager": "claudecraft.orchestration.worktree",
+    "verify_task_completion": "claudecraft.orchestration.ralph",
+}
 
 __all__ = [
     "AgentPool",
@@ -25,3 +45,12 @@ __all__ = [
     "WorktreeManager",
     "verify_task_completion",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
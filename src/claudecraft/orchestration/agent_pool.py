@@ -1,7 +1,11 @@
 """Agent pool manager for parallel execution."""
 
+import heapq
+import itertools
+import queue
+import threading
 from collections.abc import Callable
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from typing import Any
@@ -29,6 +33,9 @@ class AgentSlot:
     status: str = "idle"  # idle, running, completed
     started_at: datetime | None = None
     worktree_path: str | None = None
+    on_change: Callable[["AgentSlot"], None] | None = field(
+        default=None, repr=False, compare=False
+    )
 
     def is_available(self) -> bool:
         """Check if slot is available."""
@@ -41,6 +48,8 @@ class AgentSlot:
         self.worktree_path = worktree_path
         self.status = "running"
         self.started_at = datetime.now()
+        if self.on_change:
+            self.on_change(self)
 
     def release(self) -> None:
         """Release this slot."""
@@ -49,6 +58,8 @@ class AgentSlot:
         self.worktree_path = None
         self.status = "idle"
         self.started_at = None
+        if self.on_change:
+            self.on_change(self)
 
 
 class AgentPool:
@@ -57,97 +68,176 @@ class AgentPool:
     def __init__(self, max_agents: int = 6):
         """Initialize agent pool."""
         self.max_agents = max_agents
-        self.slots = [AgentSlot(slot_id=i + 1) for i in range(max_agents)]
-        self.task_queue: list[Task] = []
+        self.slots = [
+            AgentSlot(slot_id=i + 1, on_change=self._on_slot_change) for i in range(max_agents)
+        ]
+        # Priority queue of (-priority, insertion order, task); FIFO within a priority
+        self._queue_heap: list[tuple[int, int, Task]] = []
+        self._queue_counter = itertools.count()
         self._status_callbacks: list[Callable[[int, str, str], None]] = []
+        # Status callbacks run on a notifier thread so a slow callback never
+        # delays dispatch; started when the first callback is registered
+        self._notify_queue: queue.Queue[tuple[int, str, str]] = queue.Queue()
+        self._notifier_thread: threading.Thread | None = None
+        # Slot snapshots for get_status, rebuilt only after a slot changes
+        self._status_dirty = True
+        self._slot_snapshots: list[dict[str, Any]] = []
+        self._active_count = 0
+        # Indexes kept in sync by _on_slot_change
+        self._idle: set[int] = {slot.slot_id for slot in self.slots}
+        self._by_task: dict[str, AgentSlot] = {}
+        self._task_by_slot: dict[int, str] = {}
+        # Guards slot assignment and the queue when tasks are dispatched from
+        # several threads (e.g. cmd_execute's worker pool)
+        self._lock = threading.Lock()
+
+    def _on_slot_change(self, slot: AgentSlot) -> None:
+        """Update slot indexes and invalidate the status snapshot.
+
+        Called by a slot whenever it is assigned or released.
+        """
+        self._status_dirty = True
+
+        previous_task = self._task_by_slot.pop(slot.slot_id, None)
+        if previous_task is not None and self._by_task.get(previous_task) is slot:
+            del self._by_task[previous_task]
+
+        if slot.is_available():
+            self._idle.add(slot.slot_id)
+        else:
+            self._idle.discard(slot.slot_id)
+        if slot.task_id is not None:
+            self._by_task[slot.task_id] = slot
+            self._task_by_slot[slot.slot_id] = slot.task_id
 
     def get_available_slot(self) -> AgentSlot | None:
-        """Get an available agent slot."""
-        for slot in self.slots:
-            if slot.is_available():
-                return slot
-        return None
+        """Get an available agent slot (lowest slot ID first)."""
+        if not self._idle:
+            return None
+        return self.slots[min(self._idle) - 1]
 
     def get_slot_by_task(self, task_id: str) -> AgentSlot | None:
         """Get slot running a specific task."""
-        for slot in self.slots:
-            if slot.task_id == task_id:
-                return slot
-        return None
+        return self._by_task.get(task_id)
 
     def assign_task(
         self, task: Task, agent_type: AgentType, worktree_path: str
     ) -> AgentSlot | None:
         """Assign a task to an available slot."""
-        slot = self.get_available_slot()
-        if slot:
-            slot.assign(task.id, agent_type, worktree_path)
-            self._notify_status(slot.slot_id, task.id, "assigned")
-            return slot
-        return None
+        with self._lock:
+            slot = self.get_available_slot()
+            if slot:
+                slot.assign(task.id, agent_type, worktree_path)
+                self._notify_status(slot.slot_id, task.id, "assigned")
+                return slot
+            return None
 
     def complete_task(self, task_id: str) -> None:
         """Mark a task as completed and release the slot."""
-        slot = self.get_slot_by_task(task_id)
-        if slot:
-            self._notify_status(slot.slot_id, task_id, "completed")
-            slot.release()
+        with self._lock:
+            slot = self.get_slot_by_task(task_id)
+            if slot:
+                self._notify_status(slot.slot_id, task_id, "completed")
+                slot.release()
 
     def fail_task(self, task_id: str) -> None:
         """Mark a task as failed and release the slot."""
-        slot = self.get_slot_by_task(task_id)
-        if slot:
-            self._notify_status(slot.slot_id, task_id, "failed")
-            slot.release()
+        with self._lock:
+            slot = self.get_slot_by_task(task_id)
+            if slot:
+                self._notify_status(slot.slot_id, task_id, "failed")
+                slot.release()
+
+    @property
+    def task_queue(self) -> list[Task]:
+        """Queued tasks in heap order; the first entry is the next to dequeue."""
+        return [task for _, _, task in self._queue_heap]
 
     def queue_task(self, task: Task) -> None:
         """Add a task to the queue."""
-        self.task_queue.append(task)
+        with self._lock:
+            heapq.heappush(self._queue_heap, (-task.priority, next(self._queue_counter), task))
 
     def get_queued_tasks(self) -> list[Task]:
-        """Get all queued tasks."""
-        return self.task_queue.copy()
+        """Get all queued tasks, highest priority first."""
+        return [task for _, _, task in sorted(self._queue_heap)]
 
     def dequeue_task(self) -> Task | None:
         """Remove and return the highest priority task from queue."""
-        if not self.task_queue:
-            return None
+        with self._lock:
+            if not self._queue_heap:
+                return None
 
-        # Sort by priority (higher = more important)
-        self.task_queue.sort(key=lambda t: t.priority, reverse=True)
-        return self.task_queue.pop(0)
+            # Higher priority = more important; ties dequeue in insertion order
+            return heapq.heappop(self._queue_heap)[2]
 
     def get_active_count(self) -> int:
         """Get count of active agents."""
-        return sum(1 for slot in self.slots if not slot.is_available())
+        return self.max_agents - len(self._idle)
 
     def get_status(self) -> dict[str, Any]:
-        """Get current pool status."""
-        return {
-            "max_agents": self.max_agents,
-            "active": self.get_active_count(),
-            "available": self.max_agents - self.get_active_count(),
-            "queued": len(self.task_queue),
-            "slots": [
-                {
-                    "slot_id": slot.slot_id,
-                    "status": slot.status,
-                    "task_id": slot.task_id,
-                    "agent_type": slot.agent_type.value if slot.agent_type else None,
-                    "worktree": slot.worktree_path,
-                }
-                for slot in self.slots
-            ],
-        }
+        """Get current pool status.
+
+        The per-slot snapshots are cached and shared between calls until a
+        slot is assigned or released; treat them as read-only. The snapshot is
+        taken under the pool lock, so it never mixes a dispatch in progress.
+        """
+        with self._lock:
+            if self._status_dirty:
+                # Cleared before rebuilding, so a slot change that lands mid-rebuild
+                # marks the snapshot dirty again rather than being lost
+                self._status_dirty = False
+                self._slot_snapshots = [
+                    {
+                        "slot_id": slot.slot_id,
+                        "status": slot.status,
+                        "task_id": slot.task_id,
+                        "agent_type": slot.agent_type.value if slot.agent_type else None,
+                        "worktree": slot.worktree_path,
+                    }
+                    for slot in self.slots
+                ]
+                self._active_count = self.get_active_count()
+
+            return {
+                "max_agents": self.max_agents,
+                "active": self._active_count,
+                "available": self.max_agents - self._active_count,
+                "queued": len(self._queue_heap),
+                "slots": self._slot_snapshots,
+            }
 
     def register_status_callback(self, callback: Callable[[int, str, str], None]) -> None:
-        """Register a callback for status updates."""
+        """Register a callback for status updates.
+
+        Callbacks are invoked in order on a background notifier thread, not
+        on the thread that assigned or released the slot.
+        """
         self._status_callbacks.append(callback)
+        if self._notifier_thread is None:
+            self._notifier_thread = threading.Thread(
+                target=self._deliver_notifications, name="agent-pool-notifier", daemon=True
+            )
+            self._notifier_thread.start()
+
+    def wait_for_notifications(self) -> None:
+        """Block until every queued status notification has been delivered."""
+        self._notify_queue.join()
 
     def _notify_status(self, slot_id: int, task_id: str, status: str) -> None:
-        """Notify all registered callbacks of status change."""
-        for callback in self._status_callbacks:
+        """Queue a status change for delivery to the registered callbacks."""
+        if self._status_callbacks:
+            self._notify_queue.put((slot_id, task_id, status))
+
+    def _deliver_notifications(self) -> None:
+        """Notifier thread loop: run callbacks for each queued status change."""
+        while True:
+            slot_id, task_id, status = self._notify_queue.get()
             try:
-                callback(slot_id, task_id, status)
-            except Exception:
-                pass  # Don't let callback errors break the pool
+                for callback in list(self._status_callbacks):
+                    try:
+                        callback(slot_id, task_id, status)
+                    except Exception:
+                        pass  # Don't let callback errors break the pool
+            finally:
+                self._notify_queue.task_done()
@@ -1,10 +1,17 @@
 """Execution pipeline for task orchestration using Claude Code headless mode."""
 
+import atexit
+import contextlib
 import json
 import logging
 import os
+import queue
+import re
 import subprocess
+import tempfile
+import threading
 import time
+from collections import deque
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
@@ -19,6 +26,7 @@ from claudecraft.core.models import (
     VerificationMethod,
 )
 from claudecraft.core.project import Project
+from claudecraft.core.store import FileStore
 from claudecraft.orchestration.agent_pool import AgentPool, AgentType
 from claudecraft.orchestration.ralph import (
     RalphLoop,
@@ -30,7 +38,7 @@ from claudecraft.orchestration.ralph import (
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class PipelineStage:
     """A stage in the execution pipeline."""
 
@@ -39,7 +47,7 @@ class PipelineStage:
     max_iterations: int = 1
 
 
-@dataclass
+@dataclass(slots=True)
 class ExecutionResult:
     """Result of executing a pipeline stage."""
 
@@ -53,6 +61,8 @@ class ExecutionResult:
     ralph_iterations: int = 0
     ralph_verified: bool = False
     verification_result: VerificationResult | None = None
+    # Full per-iteration output of a Ralph loop, when one ran
+    output_log: Path | None = None
 
 
 # Map agent types to their claudecraft agent names
@@ -74,6 +84,308 @@ AGENT_ALLOWED_TOOLS = {
     AgentType.QA: "Task,Read,Bash,Grep,Glob",
 }
 
+# Stage-specific instructions appended to every agent prompt
+_STAGE_INSTRUCTIONS: dict[AgentType, str] = {
+    AgentType.CODER: """
+Implement the task requirements. Follow the specification and plan exactly.
+
+1. Read the relevant files to understand the codebase
+2. Implement the required changes
+3. Ensure code follows project conventions
+4. Commit your changes with a descriptive message
+
+When complete, output: IMPLEMENTATION COMPLETE
+
+If you encounter blockers, output: BLOCKED: <reason>
+""",
+    AgentType.REVIEWER: """
+Review the code changes made for this task.
+
+1. Check that implementation matches the specification
+2. Look for bugs, security issues, and code quality problems
+3. Verify coding standards are followed
+4. Check for edge cases and error handling
+
+Output one of:
+- REVIEW PASSED - if code is ready for testing
+- REVIEW FAILED: <issues> - if there are problems to fix
+""",
+    AgentType.TESTER: """
+Write and run tests for this task.
+
+1. Create unit tests for new functionality
+2. Create integration tests where appropriate
+3. Run the test suite
+4. Ensure adequate coverage
+
+Output one of:
+- TESTS PASSED - if all tests pass
+- TESTS FAILED: <details> - if tests fail
+""",
+    AgentType.QA: """
+Perform final QA validation.
+
+1. Verify all acceptance criteria are met
+2. Check that the implementation matches the spec
+3. Ensure no regressions in existing functionality
+4. Validate edge cases
+
+Output one of:
+- QA PASSED - if ready for merge
+- QA FAILED: <issues> - if there are problems
+""",
+}
+
+# Task status shown while each agent type is working
+_STAGE_STATUS: dict[AgentType, TaskStatus] = {
+    AgentType.CODER: TaskStatus.IMPLEMENTING,
+    AgentType.REVIEWER: TaskStatus.REVIEWING,
+    AgentType.TESTER: TaskStatus.TESTING,
+    AgentType.QA: TaskStatus.REVIEWING,  # QA uses reviewing status
+}
+
+# Output markers checked by _check_stage_success
+SUCCESS_INDICATORS = (
+    "IMPLEMENTATION COMPLETE",
+    "REVIEW PASSED",
+    "TESTS PASSED",
+    "QA PASSED",
+    "STATUS: SUCCESS",
+    "PASS",
+)
+FAILURE_INDICATORS = (
+    "BLOCKED:",
+    "REVIEW FAILED",
+    "TESTS FAILED",
+    "QA FAILED",
+    "ERROR:",
+    "FAILED",
+    "TIMEOUT:",
+)
+# Line markers that _extract_issues reports
+ISSUE_INDICATORS = ("ERROR:", "FAIL:", "FAILED:", "BLOCKED:", "ISSUE:", "BUG:", "PROBLEM:")
+
+# Precompiled alternations so each check is a single scan of the output
+_VERDICT_RE = re.compile(
+    "(?P<success>{})|(?P<failure>{})".format(
+        "|".join(map(re.escape, SUCCESS_INDICATORS)),
+        "|".join(map(re.escape, FAILURE_INDICATORS)),
+    ),
+    re.IGNORECASE,
+)
+_ERROR_WORD_RE = re.compile("error", re.IGNORECASE)
+_ISSUE_RE = re.compile("|".join(map(re.escape, ISSUE_INDICATORS)), re.IGNORECASE)
+
+# Seconds a persistent Claude session may sit idle before it is shut down
+SESSION_IDLE_TIMEOUT = float(os.environ.get("CLAUDECRAFT_SESSION_TIMEOUT", "300"))
+
+
+class ClaudeWorker:
+    """A long-lived ``claude`` process that accepts prompts over stdin.
+
+    The process runs with ``--input-format stream-json`` so each prompt is one
+    JSON line on stdin; the ``result`` event on stdout marks the end of the
+    response. Reusing the process avoids paying CLI startup for every
+    iteration of a stage.
+    """
+
+    def __init__(self, cmd: list[str], working_dir: Path, env: dict[str, str]):
+        self._proc = subprocess.Popen(
+            cmd,
+            cwd=working_dir,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            bufsize=1,
+            env=env,
+        )
+        self.last_used = time.monotonic()
+
+    def is_alive(self) -> bool:
+        """Whether the underlying process is still running."""
+        return self._proc.poll() is None
+
+    def send(self, prompt: str, timeout: float) -> tuple[str, str | None, bool]:
+        """Send a prompt and block until its result event arrives.
+
+        Returns:
+            Tuple of (output, session_id, success)
+        """
+        message = {"type": "user", "message": {"role": "user", "content": prompt}}
+        timed_out = threading.Event()
+
+        def _expire() -> None:
+            timed_out.set()
+            self._proc.kill()
+
+        timer = threading.Timer(timeout, _expire)
+        timer.start()
+        try:
+            assert self._proc.stdin is not None and self._proc.stdout is not None
+            self._proc.stdin.write(json.dumps(message) + "\n")
+            self._proc.stdin.flush()
+            for line in self._proc.stdout:
+                try:
+                    event = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if event.get("type") == "result":
+                    self.last_used = time.monotonic()
+                    return (
+                        event.get("result", ""),
+                        event.get("session_id"),
+                        not event.get("is_error", False),
+                    )
+        except OSError as e:
+            if not timed_out.is_set():
+                return f"ERROR: Claude session terminated: {e}", None, False
+        finally:
+            timer.cancel()
+
+        if timed_out.is_set():
+            return f"TIMEOUT: Agent execution exceeded {timeout} seconds", None, False
+        return "ERROR: Claude session exited before returning a result", None, False
+
+    def close(self) -> None:
+        """Terminate the process."""
+        if self._proc.stdin:
+            with contextlib.suppress(OSError):
+                self._proc.stdin.close()
+        try:
+            self._proc.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            self._proc.kill()
+            self._proc.wait()
+
+
+class ClaudeWorkerPool:
+    """Idle persistent Claude sessions keyed by (agent type, worktree, model).
+
+    Keys include the worktree, so a session is only ever reused for the same
+    task and stage.
+    """
+
+    def __init__(self, idle_timeout: float = SESSION_IDLE_TIMEOUT):
+        self.idle_timeout = idle_timeout
+        self._idle: dict[tuple[str, str, str | None], deque[ClaudeWorker]] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, key: tuple[str, str, str | None]) -> ClaudeWorker | None:
+        """Take an idle live worker for ``key``, or None if there is none."""
+        self._reap()
+        with self._lock:
+            workers = self._idle.get(key)
+            while workers:
+                worker = workers.pop()
+                if worker.is_alive():
+                    return worker
+                worker.close()
+        return None
+
+    def release(self, key: tuple[str, str, str | None], worker: ClaudeWorker) -> None:
+        """Return a worker to the pool, discarding it if it has exited."""
+        if not worker.is_alive():
+            worker.close()
+            return
+        with self._lock:
+            self._idle.setdefault(key, deque()).append(worker)
+
+    def shutdown(self, working_dir: str | None = None) -> None:
+        """Close idle workers, optionally only those for one worktree."""
+        with self._lock:
+            keys = [k for k in self._idle if working_dir is None or k[1] == working_dir]
+            workers = [w for k in keys for w in self._idle.pop(k)]
+        for worker in workers:
+            worker.close()
+
+    def _reap(self) -> None:
+        """Close workers that have been idle longer than the idle timeout."""
+        cutoff = time.monotonic() - self.idle_timeout
+        expired: list[ClaudeWorker] = []
+        with self._lock:
+            for key, workers in list(self._idle.items()):
+                while workers and workers[0].last_used < cutoff:
+                    expired.append(workers.popleft())
+                if not workers:
+                    del self._idle[key]
+        for worker in expired:
+            worker.close()
+
+
+class _LogWriter:
+    """Writes queued execution log entries to the store on a background thread.
+
+    Entries are drained in batches of up to ``max_batch`` or whatever arrives
+    within ``max_wait`` seconds, so the stage loop never blocks on log I/O.
+    """
+
+    def __init__(
+        self,
+        store: FileStore,
+        max_batch: int = 100,
+        max_wait: float = 0.5,
+        max_queued: int = 10000,
+    ):
+        self._store = store
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        # None is a flush marker: write the current batch without waiting
+        self._queue: queue.Queue[ExecutionLog | None] = queue.Queue(maxsize=max_queued)
+        self._thread: threading.Thread | None = None
+        self._start_lock = threading.Lock()
+
+    def put(self, log: ExecutionLog) -> None:
+        """Queue an entry, dropping it with a warning if the queue is full."""
+        self._ensure_started()
+        try:
+            self._queue.put_nowait(log)
+        except queue.Full:
+            logger.warning("Execution log queue full; dropping entry for task %s", log.task_id)
+
+    def flush(self) -> None:
+        """Block until every queued entry has been written."""
+        if self._thread is None:
+            return
+        self._queue.put(None)
+        self._queue.join()
+
+    def _ensure_started(self) -> None:
+        if self._thread is not None:
+            return
+        with self._start_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="execution-log-writer", daemon=True
+                )
+                self._thread.start()
+                atexit.register(self.flush)
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            batch = [item] if item is not None else []
+            taken = 1
+            deadline = time.monotonic() + self.max_wait
+            while item is not None and len(batch) < self.max_batch:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                taken += 1
+                if item is not None:
+                    batch.append(item)
+            try:
+                self._store.append_execution_logs(batch)
+            except Exception:
+                logger.exception("Failed to write %d execution log entries", len(batch))
+            finally:
+                for _ in range(taken):
+                    self._queue.task_done()
+
 
 class ExecutionPipeline:
     """Orchestrates the execution pipeline for tasks using Claude Code headless mode."""
@@ -93,6 +405,8 @@ class ExecutionPipeline:
         claude_path: str = "claude",
         timeout: int = 600,
         ralph_config: RalphLoopConfig | None = None,
+        persistent_sessions: bool = False,
+        max_claude_processes: int | None = None,
     ):
         """Initialize execution pipeline.
 
@@ -102,6 +416,10 @@ class ExecutionPipeline:
             claude_path: Path to claude CLI (default: "claude")
             timeout: Timeout in seconds for each agent execution (default: 600)
             ralph_config: Optional Ralph loop configuration (uses project config if None)
+            persistent_sessions: Keep one Claude process alive per task stage and
+                feed it successive iterations instead of spawning a new CLI each time
+            max_claude_processes: Cap on concurrently running Claude processes
+                (default: the agent pool size, or the CPU count if that is unset)
         """
         self.project = project
         self.agent_pool = agent_pool
@@ -111,6 +429,28 @@ class ExecutionPipeline:
         self.timeout = timeout
         self.ralph_config = ralph_config or self._get_ralph_config()
         self.docs_trigger_status: str | None = None
+        # (allowed tools, model) per agent type, fixed for the pipeline's lifetime
+        self._stage_config: dict[AgentType, tuple[str, str | None]] = {
+            agent_type: (
+                AGENT_ALLOWED_TOOLS.get(agent_type, "Read,Grep,Glob"),
+                project.config.get_agent_model(agent_type.value),
+            )
+            for agent_type in AgentType
+        }
+        self._log_writer = _LogWriter(project.db)
+        # Environment for agent subprocesses, snapshotted once rather than per spawn
+        self._subprocess_env = os.environ.copy()
+        self._claude_slots = threading.BoundedSemaphore(
+            max_claude_processes or agent_pool.max_agents or os.cpu_count() or 1
+        )
+        # Context files keyed by path, reused while (mtime, size) is unchanged
+        self._file_cache: dict[Path, tuple[tuple[int, int], str]] = {}
+        # Memory context keyed by spec, reused while the memory revision is unchanged
+        self._memory_context_cache: dict[str, tuple[int, str]] = {}
+        self._worker_pool: ClaudeWorkerPool | None = None
+        if persistent_sessions:
+            self._worker_pool = ClaudeWorkerPool()
+            atexit.register(self._worker_pool.shutdown)
 
     def execute_task(
         self,
@@ -156,12 +496,12 @@ class ExecutionPipeline:
                     # Use Ralph loop execution for tasks with completion specs
                     result = self.execute_stage_with_ralph(task, stage, worktree_path)
                     total_iterations += result.ralph_iterations or 1
+                    # Persisted with the next status change at the stage boundary
                     task.iteration = total_iterations
-                    self.project.db.update_task(task)
 
                     # Log final result (individual iterations logged inside ralph method)
                     if not result.ralph_verified:
-                        self.project.db.append_execution_log(
+                        self._log_execution(
                             ExecutionLog(
                                 id=0,
                                 task_id=task.id,
@@ -186,20 +526,28 @@ class ExecutionPipeline:
                     )
                     total_iterations = result.iteration  # Update total from result
             finally:
+                self._flush_logs()
                 # Release agent slot
                 if slot is not None:
                     self.project.db.release_agent_slot(slot)
 
             if not result.success:
+                if self._worker_pool is not None:
+                    self._worker_pool.shutdown(str(worktree_path))
                 # Stage failed - reset to todo
                 task.status = TaskStatus.TODO
                 task.metadata["failure_stage"] = stage.name
                 task.metadata["failure_reason"] = result.output[:1000]
                 if result.ralph_iterations > 0:
                     task.metadata["ralph_iterations"] = result.ralph_iterations
+                if result.output_log is not None:
+                    task.metadata["ralph_output_log"] = str(result.output_log)
                 self.project.db.update_task(task)
                 return False
 
+        if self._worker_pool is not None:
+            self._worker_pool.shutdown(str(worktree_path))
+
         # All stages passed
         task.status = TaskStatus.DONE
         task.updated_at = datetime.now()
@@ -207,6 +555,14 @@ class ExecutionPipeline:
         self.docs_trigger_status = self._check_and_trigger_docs(task)
         return True
 
+    def _log_execution(self, log: ExecutionLog) -> None:
+        """Hand an execution log entry to the background writer."""
+        self._log_writer.put(log)
+
+    def _flush_logs(self) -> None:
+        """Wait for the background writer to store every queued log entry."""
+        self._log_writer.flush()
+
     def _check_and_trigger_docs(self, task: Task) -> str | None:
         """Check if documentation generation should be triggered and launch it.
 
@@ -282,16 +638,15 @@ class ExecutionPipeline:
             iteration += 1
             total_iterations += 1
 
-            # Update task iteration
+            # Update task iteration; execute_task persists it at the stage boundary
             task.iteration = total_iterations
-            self.project.db.update_task(task)
 
             # Execute stage
             result = self._execute_stage(task, stage, worktree_path, iteration)
             last_result = result
 
             # Log execution
-            self.project.db.append_execution_log(
+            self._log_execution(
                 ExecutionLog(
                     id=0,
                     task_id=task.id,
@@ -305,15 +660,9 @@ class ExecutionPipeline:
             )
 
             if result.success:
-                # Update result with final total_iterations
-                return ExecutionResult(
-                    success=True,
-                    iteration=total_iterations,
-                    output=result.output,
-                    duration_ms=result.duration_ms,
-                    issues=result.issues,
-                    session_id=result.session_id,
-                )
+                # Report the total across stages rather than this stage's count
+                result.iteration = total_iterations
+                return result
 
         # Max iterations reached - return failure
         return ExecutionResult(
@@ -334,11 +683,8 @@ class ExecutionPipeline:
         # Build the prompt for this stage
         prompt = self._build_agent_prompt(task, stage, worktree_path, iteration)
 
-        # Get allowed tools for this agent type
-        allowed_tools = AGENT_ALLOWED_TOOLS.get(stage.agent_type, "Read,Grep,Glob")
-
-        # Get the model for this agent type from config
-        model = self.project.config.get_agent_model(stage.agent_type.value)
+        # Get allowed tools and configured model for this agent type
+        allowed_tools, model = self._stage_config[stage.agent_type]
 
         # Run Claude Code in headless mode
         output, session_id, success = self._run_claude_headless(
@@ -382,9 +728,14 @@ class ExecutionPipeline:
         )
 
     def _build_agent_prompt(
-        self, task: Task, stage: PipelineStage, worktree_path: Path, iteration: int
+        self, task: Task, stage: PipelineStage, worktree_path: Path, iteration: int | None
     ) -> str:
-        """Build the prompt for a specific agent stage."""
+        """Build the prompt for a specific agent stage.
+
+        With ``iteration=None`` the iteration line is left out, for callers
+        that report progress elsewhere and want a prompt reusable across
+        iterations.
+        """
         # Load context files
         spec_dir = self.project.spec_dir(task.spec_id)
         spec_content = self._read_file(spec_dir / "spec.md")
@@ -393,7 +744,13 @@ class ExecutionPipeline:
         agent_name = AGENT_TYPE_TO_NAME.get(stage.agent_type, "claudecraft-coder")
 
         # Get memory context for this spec
-        memory_context = self.project.memory.get_context_for_spec(task.spec_id)
+        memory_context = self._get_memory_context(task.spec_id)
+
+        iteration_line = (
+            f"- **Iteration**: {iteration}/{stage.max_iterations}\n"
+            if iteration is not None
+            else ""
+        )
 
         prompt = f"""You are the {agent_name} agent working on task {task.id}.
 
@@ -402,8 +759,7 @@ class ExecutionPipeline:
 - **Title**: {task.title}
 - **Description**: {task.description}
 - **Priority**: {task.priority}
-- **Iteration**: {iteration}/{stage.max_iterations}
-- **Stage**: {stage.name}
+{iteration_line}- **Stage**: {stage.name}
 
 ## Working Directory
 You are working in: {worktree_path}
@@ -418,60 +774,7 @@ You are working in: {worktree_path}
 ## Your Task
 """
 
-        if stage.agent_type == AgentType.CODER:
-            prompt += """
-Implement the task requirements. Follow the specification and plan exactly.
-
-1. Read the relevant files to understand the codebase
-2. Implement the required changes
-3. Ensure code follows project conventions
-4. Commit your changes with a descriptive message
-
-When complete, output: IMPLEMENTATION COMPLETE
-
-If you encounter blockers, output: BLOCKED: <reason>
-"""
-        elif stage.agent_type == AgentType.REVIEWER:
-            prompt += """
-Review the code changes made for this task.
-
-1. Check that implementation matches the specification
-2. Look for bugs, security issues, and code quality problems
-3. Verify coding standards are followed
-4. Check for edge cases and error handling
-
-Output one of:
-- REVIEW PASSED - if code is ready for testing
-- REVIEW FAILED: <issues> - if there are problems to fix
-"""
-        elif stage.agent_type == AgentType.TESTER:
-            prompt += """
-Write and run tests for this task.
-
-1. Create unit tests for new functionality
-2. Create integration tests where appropriate
-3. Run the test suite
-4. Ensure adequate coverage
-
-Output one of:
-- TESTS PASSED - if all tests pass
-- TESTS FAILED: <details> - if tests fail
-"""
-        elif stage.agent_type == AgentType.QA:
-            prompt += """
-Perform final QA validation.
-
-1. Verify all acceptance criteria are met
-2. Check that the implementation matches the spec
-3. Ensure no regressions in existing functionality
-4. Validate edge cases
-
-Output one of:
-- QA PASSED - if ready for merge
-- QA FAILED: <issues> - if there are problems
-"""
-
-        return prompt
+        return prompt + _STAGE_INSTRUCTIONS.get(stage.agent_type, "")
 
     def _run_claude_headless(
         self,
@@ -493,12 +796,19 @@ Output one of:
         Returns:
             Tuple of (output, session_id, success)
         """
+        if self._worker_pool is not None:
+            with self._claude_slots:
+                return self._run_claude_session(
+                    prompt, working_dir, allowed_tools, agent_type, model
+                )
+
         cmd = [
             self.claude_path,
             "-p",
             prompt,
             "--output-format",
-            "json",
+            "stream-json",
+            "--verbose",
             "--allowedTools",
             allowed_tools,
         ]
@@ -507,122 +817,209 @@ Output one of:
         if model:
             cmd.extend(["--model", model])
 
-        env = os.environ.copy()
-
         try:
-            result = subprocess.run(
+            with self._claude_slots:
+                return self._stream_claude(cmd, working_dir)
+        except FileNotFoundError:
+            return (
+                f"ERROR: Claude CLI not found at '{self.claude_path}'. "
+                "Install Claude Code or specify correct path.",
+                None,
+                False,
+            )
+        except Exception as e:
+            return f"ERROR: Failed to execute Claude: {e}", None, False
+
+    def _stream_claude(self, cmd: list[str], working_dir: Path) -> tuple[str, str | None, bool]:
+        """Run a one-shot Claude CLI and read its events as they stream.
+
+        Only the final result event (or any non-JSON output) is kept, so memory
+        stays bounded however long the agent's turn runs. Assistant events are
+        not inspected: text and tool calls arrive as separate events, so none
+        of them shows that the turn is over.
+
+        Returns:
+            Tuple of (output, session_id, success)
+        """
+        # stderr goes to a file so a chatty CLI can never block on a full pipe
+        # while stdout is being read
+        with tempfile.TemporaryFile("w+") as stderr:
+            # stdin must be closed explicitly: an inherited open stdin leaves
+            # the CLI waiting for piped input before it starts on the prompt
+            proc = subprocess.Popen(
                 cmd,
                 cwd=working_dir,
-                capture_output=True,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=stderr,
                 text=True,
-                timeout=self.timeout,
-                env=env,
+                env=self._subprocess_env,
             )
-
-            # Try to parse JSON output
-            output = result.stdout
-            session_id = None
-
+            stdout = proc.stdout
+            assert stdout is not None
+            timed_out = threading.Event()
+
+            def _expire() -> None:
+                timed_out.set()
+                proc.kill()
+
+            timer = threading.Timer(self.timeout, _expire)
+            timer.start()
+            raw: list[str] = []
+            result: dict[str, Any] | None = None
             try:
-                json_output = json.loads(output)
-                output = json_output.get("result", output)
-                session_id = json_output.get("session_id")
-            except json.JSONDecodeError:
+                for line in stdout:
+                    try:
+                        event = json.loads(line)
+                    except json.JSONDecodeError:
+                        raw.append(line)
+                        continue
+                    if not isinstance(event, dict):
+                        raw.append(line)
+                    elif "result" in event:
+                        result = event
+            finally:
+                timer.cancel()
+                stdout.close()
+                try:
+                    proc.wait(timeout=5)
+                except subprocess.TimeoutExpired:
+                    proc.kill()
+                    proc.wait()
+
+            if timed_out.is_set():
+                return f"TIMEOUT: Agent execution exceeded {self.timeout} seconds", None, False
+
+            if result is not None:
+                output = result.get("result", "")
+                session_id = result.get("session_id")
+            else:
                 # Not JSON, use raw output
-                pass
+                output = "".join(raw)
+                session_id = None
 
             # Include stderr if there was an error
-            if result.returncode != 0 and result.stderr:
-                output += f"\n\nSTDERR:\n{result.stderr}"
+            if proc.returncode != 0:
+                stderr.seek(0)
+                errors = stderr.read()
+                if errors:
+                    output += f"\n\nSTDERR:\n{errors}"
 
-            success = result.returncode == 0
-            return output, session_id, success
+            return output, session_id, proc.returncode == 0
 
-        except subprocess.TimeoutExpired:
-            return f"TIMEOUT: Agent execution exceeded {self.timeout} seconds", None, False
-        except FileNotFoundError:
-            return (
-                f"ERROR: Claude CLI not found at '{self.claude_path}'. "
-                "Install Claude Code or specify correct path.",
-                None,
-                False,
-            )
-        except Exception as e:
-            return f"ERROR: Failed to execute Claude: {e}", None, False
+    def _run_claude_session(
+        self,
+        prompt: str,
+        working_dir: Path,
+        allowed_tools: str,
+        agent_type: AgentType,
+        model: str | None = None,
+    ) -> tuple[str, str | None, bool]:
+        """Run a prompt on a pooled persistent Claude session.
+
+        Takes the same arguments and returns the same tuple as
+        ``_run_claude_headless``.
+        """
+        assert self._worker_pool is not None
+        key = (agent_type.value, str(working_dir), model)
+        worker = self._worker_pool.acquire(key)
+        if worker is None:
+            cmd = [
+                self.claude_path,
+                "-p",
+                "--input-format",
+                "stream-json",
+                "--output-format",
+                "stream-json",
+                "--verbose",
+                "--allowedTools",
+                allowed_tools,
+            ]
+            if model:
+                cmd.extend(["--model", model])
+            try:
+                worker = ClaudeWorker(cmd, working_dir, self._subprocess_env)
+            except FileNotFoundError:
+                return (
+                    f"ERROR: Claude CLI not found at '{self.claude_path}'. "
+                    "Install Claude Code or specify correct path.",
+                    None,
+                    False,
+                )
+            except Exception as e:
+                return f"ERROR: Failed to execute Claude: {e}", None, False
+
+        try:
+            return worker.send(prompt, self.timeout)
+        finally:
+            self._worker_pool.release(key, worker)
+
+    def _get_memory_context(self, spec_id: str) -> str:
+        """Get the memory context for a spec, rebuilt only after memory changes."""
+        memory = self.project.memory
+        cached = self._memory_context_cache.get(spec_id)
+        if cached is not None and cached[0] == memory.revision:
+            return cached[1]
+        context = memory.get_context_for_spec(spec_id)
+        self._memory_context_cache[spec_id] = (memory.revision, context)
+        return context
 
     def _read_file(self, path: Path) -> str | None:
-        """Read a file and return its contents, or None if it doesn't exist."""
+        """Read a file and return its contents, or None if it doesn't exist.
+
+        Contents are cached and reused until the file's mtime or size changes.
+        """
         try:
-            return path.read_text()
+            st = path.stat()
         except FileNotFoundError:
+            self._file_cache.pop(path, None)
             return None
+        key = (st.st_mtime_ns, st.st_size)
+        cached = self._file_cache.get(path)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        try:
+            content = path.read_text()
+        except FileNotFoundError:
+            return None
+        self._file_cache[path] = (key, content)
+        return content
 
     def _check_stage_success(self, stage: PipelineStage, output: str) -> bool:
-        """Check if a stage execution was successful based on output."""
-        output_upper = output.upper()
-
-        # Check for explicit success indicators
-        success_indicators = [
-            "IMPLEMENTATION COMPLETE",
-            "REVIEW PASSED",
-            "TESTS PASSED",
-            "QA PASSED",
-            "STATUS: SUCCESS",
-            "PASS",
-        ]
+        """Check if a stage execution was successful based on output.
 
-        for indicator in success_indicators:
-            if indicator in output_upper:
-                return True
-
-        # Check for explicit failure indicators
-        failure_indicators = [
-            "BLOCKED:",
-            "REVIEW FAILED",
-            "TESTS FAILED",
-            "QA FAILED",
-            "ERROR:",
-            "FAILED",
-            "TIMEOUT:",
-        ]
-
-        for indicator in failure_indicators:
-            if indicator in output_upper:
-                return False
+        When both success and failure indicators appear, the last one wins:
+        agents state their verdict at the end, after any earlier failures.
+        """
+        last = None
+        for match in _VERDICT_RE.finditer(output):
+            last = match
+        if last is not None:
+            return last.lastgroup == "success"
 
         # If no clear indicator, assume success if there's substantial output
         # and no obvious errors
-        return len(output) > 100 and "error" not in output.lower()
+        return len(output) > 100 and _ERROR_WORD_RE.search(output) is None
 
     def _extract_issues(self, output: str) -> list[str]:
         """Extract issues from stage output."""
-        issues = []
-        for line in output.split("\n"):
-            line_upper = line.upper()
-            if any(
-                indicator in line_upper
-                for indicator in [
-                    "ERROR:",
-                    "FAIL:",
-                    "FAILED:",
-                    "BLOCKED:",
-                    "ISSUE:",
-                    "BUG:",
-                    "PROBLEM:",
-                ]
-            ):
-                issues.append(line.strip())
-        return issues[:10]  # Limit to 10 issues
+        issues: list[str] = []
+        pos = 0
+        while len(issues) < 10:  # Limit to 10 issues
+            match = _ISSUE_RE.search(output, pos)
+            if match is None:
+                break
+            start = output.rfind("\n", 0, match.start()) + 1
+            end = output.find("\n", match.end())
+            if end == -1:
+                end = len(output)
+            issues.append(output[start:end].strip())
+            pos = end
+        return issues
 
     def _get_stage_status(self, agent_type: AgentType) -> TaskStatus:
         """Get task status for a given agent type."""
-        status_map = {
-            AgentType.CODER: TaskStatus.IMPLEMENTING,
-            AgentType.REVIEWER: TaskStatus.REVIEWING,
-            AgentType.TESTER: TaskStatus.TESTING,
-            AgentType.QA: TaskStatus.REVIEWING,  # QA uses reviewing status
-        }
-        return status_map.get(agent_type, TaskStatus.IMPLEMENTING)
+        return _STAGE_STATUS.get(agent_type, TaskStatus.IMPLEMENTING)
 
     def get_pipeline_info(self) -> dict[str, Any]:
         """Get information about the pipeline configuration."""
@@ -738,6 +1135,7 @@ Output one of:
         stage: PipelineStage,
         worktree_path: Path,
         ralph: RalphLoop,
+        base_prompt: str | None = None,
     ) -> str:
         """Build prompt with Ralph loop requirements.
 
@@ -749,12 +1147,14 @@ Output one of:
             stage: Current pipeline stage
             worktree_path: Path to worktree
             ralph: Active RalphLoop instance
+            base_prompt: Prebuilt base prompt to reuse across iterations
 
         Returns:
             Complete prompt string with Ralph section
         """
-        # Get base prompt (uses ralph.current_iteration for iteration number)
-        base_prompt = self._build_agent_prompt(task, stage, worktree_path, ralph.current_iteration)
+        # The base prompt carries no iteration number; the Ralph section reports it
+        if base_prompt is None:
+            base_prompt = self._build_agent_prompt(task, stage, worktree_path, None)
 
         # Add Ralph loop section
         ralph_section = ralph.build_prompt_section(task)
@@ -817,8 +1217,12 @@ Output one of:
             logger.debug(f"Ralph loop not started: {e}")
             return self._execute_stage(task, stage, worktree_path, 1)
 
-        all_outputs: list[str] = []
+        # Each iteration's output goes to disk rather than accumulating in memory
+        output_log = self.project.db.ralph_output_path(task.id, stage.agent_type.value)
+        output_log.write_text("")
         last_session_id: str | None = None
+        allowed_tools, model = self._stage_config[stage.agent_type]
+        base_prompt = self._build_agent_prompt(task, stage, worktree_path, None)
 
         while True:
             ralph.increment()
@@ -826,6 +1230,7 @@ Output one of:
             if ralph.state:
                 persisted_loop = self.project.db.get_ralph_loop(task.id, stage.agent_type.value)
                 if persisted_loop and persisted_loop.status == "cancelled":
+                    self._flush_logs()
                     duration_ms = int((time.time() - start_time) * 1000)
                     return ExecutionResult(
                         success=False,
@@ -839,11 +1244,7 @@ Output one of:
                     )
 
             # Build prompt with Ralph requirements
-            prompt = self._build_ralph_prompt(task, stage, worktree_path, ralph)
-
-            # Get allowed tools and model
-            allowed_tools = AGENT_ALLOWED_TOOLS.get(stage.agent_type, "Read,Grep,Glob")
-            model = self.project.config.get_agent_model(stage.agent_type.value)
+            prompt = self._build_ralph_prompt(task, stage, worktree_path, ralph, base_prompt)
 
             # Run Claude Code
             output, session_id, cli_success = self._run_claude_headless(
@@ -854,7 +1255,9 @@ Output one of:
                 model=model,
             )
 
-            all_outputs.append(output)
+            with open(output_log, "a") as f:
+                f.write(output)
+                f.write("\n---\n")
             last_session_id = session_id
 
             # Log this iteration
@@ -892,15 +1295,18 @@ Output one of:
                     issues = self._extract_issues(output)
                     issues.append(f"Ralph verification: {reason}")
 
+                self._flush_logs()
+
                 return ExecutionResult(
                     success=success,
                     iteration=ralph_result["iterations"],
-                    output="\n---\n".join(all_outputs),
+                    output=output,
                     duration_ms=duration_ms,
                     issues=issues,
                     session_id=last_session_id,
                     ralph_iterations=ralph_result["iterations"],
                     ralph_verified=success,
+                    output_log=output_log,
                 )
 
     def _log_ralph_iteration(
@@ -927,7 +1333,7 @@ Output one of:
             )
 
             # Log to store
-            self.project.db.append_execution_log(
+            self._log_execution(
                 ExecutionLog(
                     id=0,
                     task_id=task.id,
@@ -1,11 +1,190 @@
 """Merge orchestrator with 3-tier conflict resolution."""
 
-import json
+import functools
 import os
+import re
+import shutil
 import subprocess
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 from git import Repo
+from git.refs.symbolic import SymbolicReference
+
+if TYPE_CHECKING:
+    from claudecraft.orchestration.execution import ClaudeWorker
+
+_json_loads: Callable[[bytes | str], Any]
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # optional: pip install claudecraft[fast]
+    from json import loads as _json_loads
+
+# Conflicted files resolved concurrently by the AI tiers. Each resolution is
+# an independent Claude subprocess, so wall time is bounded by the slowest
+# file rather than the sum over all of them.
+_AI_MERGE_WORKERS = 4
+
+# Any git conflict marker line: "<<<<<<< ours", "=======", ">>>>>>> theirs".
+# One compiled pass replaces a separate substring scan per marker.
+_CONFLICT_MARKER_RE = re.compile(r"^(?:<{7} |={7}\r?$|>{7} )", re.MULTILINE)
+
+# Output wrapped in a markdown code block: the opening fence line (with any
+# language identifier), the body, then a last line ending in the closing
+# fence. The body is captured in one pass, with no strip/split/join copies.
+_CODE_FENCE_RE = re.compile(r"\A\s*```[^\n]*\n(.*)\n[^\n]*```\s*\Z", re.DOTALL)
+
+
+def _checkout(repo: Repo, branch: str) -> None:
+    """Check out branch, skipping the git call when HEAD already points at it.
+
+    HEAD is read from .git directly, so the common case of merging into the
+    branch that is already checked out needs no git process.
+    """
+    try:
+        if repo.head.reference.name == branch:
+            return
+    except (TypeError, ValueError):
+        pass  # Detached or unborn HEAD
+    repo.git.checkout(branch)
+
+
+def _branch_exists(repo: Repo, branch: str) -> bool:
+    """Return True if refs/heads/<branch> resolves, reading refs without git."""
+    try:
+        SymbolicReference.dereference_recursive(repo, f"refs/heads/{branch}")
+    except ValueError:
+        return False
+    return True
+
+
+def _conflicted_files(repo: Repo) -> list[str]:
+    """Return the unmerged paths of an in-progress merge.
+
+    Reads the unmerged index entries only (NUL-separated, so names with
+    spaces or quotes need no unescaping). Unlike git status or git diff this
+    never compares against the working tree, so no tracked file is stat'ed.
+    Each path has one entry per conflict stage; the first one is kept.
+    """
+    output = repo.git.ls_files("--unmerged", "-z")
+    # Entries are "<mode> <object> <stage>\t<path>"
+    paths = (entry.partition("\t")[2] for entry in output.split("\0") if entry)
+    return list(dict.fromkeys(paths))
+
+
+def _predict_conflicts(repo: Repo, source_branch: str, target_branch: str) -> bool | None:
+    """Predict whether merging source into target will conflict.
+
+    git merge-tree --write-tree (git 2.38+) performs the merge in the object
+    database only, without checking anything out or touching the index.
+    Returns None when it cannot tell, e.g. on older git or unknown refs.
+    """
+    status, tree, _ = repo.git.merge_tree(
+        "--write-tree", "--name-only", "--no-messages", target_branch, source_branch,
+        with_extended_output=True, with_exceptions=False,
+    )
+    # A merge result always starts with the resulting tree id; errors (bad
+    # refs, or a git without --write-tree) print nothing on stdout
+    if not tree:
+        return None
+    # Exit status 1 means the merge has conflicts
+    return int(status) == 1
+
+
+def _strip_code_fence(text: str) -> str:
+    """Strip surrounding whitespace and a markdown code block wrapping text."""
+    match = _CODE_FENCE_RE.match(text)
+    return match.group(1) if match else text.strip()
+
+
+def _claude_result(stdout: bytes) -> str:
+    """Extract the result text from ``claude --output-format json`` stdout.
+
+    The raw bytes go straight to the JSON parser (orjson when installed).
+    Output that is not JSON is used as-is.
+    """
+    try:
+        data = _json_loads(stdout)
+    except ValueError:
+        data = None
+    if isinstance(data, dict) and "result" in data:
+        result: str = data["result"]
+        return result
+    return stdout.decode(errors="replace")
+
+
+def _write_if_changed(path: Path, content: str) -> None:
+    """Write content to path unless the file already holds exactly that.
+
+    A modify/delete conflict leaves the surviving side on disk, so keeping
+    that side often needs no write at all, and the file keeps its mtime.
+    """
+    data = content.encode()
+    try:
+        if path.read_bytes() == data:
+            return
+    except OSError:
+        pass
+    path.write_bytes(data)
+
+
+class _MergeSessions:
+    """Persistent Claude processes shared by the conflicted files of one merge.
+
+    Each worker thread keeps its own process and feeds it one file after
+    another, so CLI startup is paid once per thread instead of once per file.
+    A session keeps its conversation, so later files are resolved with the
+    earlier ones still in context.
+    """
+
+    def __init__(self, claude_path: str, working_dir: Path):
+        self.claude_path = claude_path
+        self._cmd = [
+            claude_path,
+            "-p",
+            "--input-format", "stream-json",
+            "--output-format", "stream-json",
+            "--verbose",
+            "--allowedTools", "",  # No tools needed, just text output
+        ]
+        self._working_dir = working_dir
+        self._env = os.environ.copy()
+        self._local = threading.local()
+        self._workers: list[ClaudeWorker] = []
+        self._lock = threading.Lock()
+
+    def request(self, prompt: str, timeout: float) -> tuple[str | None, str | None]:
+        """Send a prompt on this thread's session, starting it if needed.
+
+        Returns:
+            (content, error) tuple - one will be None
+        """
+        from claudecraft.orchestration.execution import ClaudeWorker
+
+        worker = getattr(self._local, "worker", None)
+        if worker is None or not worker.is_alive():
+            try:
+                worker = ClaudeWorker(self._cmd, self._working_dir, self._env)
+            except FileNotFoundError:
+                return None, f"Claude CLI not found at '{self.claude_path}'"
+            self._local.worker = worker
+            with self._lock:
+                self._workers.append(worker)
+
+        output, _, success = worker.send(prompt, timeout)
+        if not success:
+            return None, f"Claude returned error: {output}"
+        return _strip_code_fence(output), None
+
+    def close(self) -> None:
+        """Stop every process started for this merge."""
+        with self._lock:
+            workers, self._workers = self._workers, []
+        for worker in workers:
+            worker.close()
 
 
 class MergeStrategy:
@@ -28,7 +207,7 @@ class GitAutoMerge(MergeStrategy):
         """Attempt automatic git merge."""
         try:
             # Checkout target branch
-            repo.git.checkout(target_branch)
+            _checkout(repo, target_branch)
 
             # Attempt merge
             repo.git.merge(source_branch, "--no-ff", "-m", f"Merge {source_branch} into {target_branch}")
@@ -51,21 +230,30 @@ class GitAutoMerge(MergeStrategy):
 class ConflictOnlyAIMerge(MergeStrategy):
     """Tier 2: AI resolves only conflicted sections."""
 
-    def __init__(self, claude_path: str = "claude", timeout: int = 300):
+    def __init__(
+        self, claude_path: str = "claude", timeout: int = 300, persistent_sessions: bool = False
+    ):
         """Initialize with Claude Code configuration.
 
         Args:
             claude_path: Path to claude CLI (default: "claude")
             timeout: Timeout in seconds for AI resolution (default: 300)
+            persistent_sessions: Reuse one Claude process per worker thread across
+                the conflicted files of a merge instead of spawning one per file
         """
         self.claude_path = claude_path
+        # Resolved against PATH once, so each spawn execs it directly; when it
+        # is not found, the name is kept and the spawn reports the error
+        self._claude_executable = shutil.which(claude_path) or claude_path
         self.timeout = timeout
+        self.persistent_sessions = persistent_sessions
+        self._sessions: _MergeSessions | None = None
 
     def merge(self, repo: Repo, source_branch: str, target_branch: str) -> tuple[bool, str]:
         """Resolve conflicts using AI on conflicted sections only."""
         # Checkout target branch
         try:
-            repo.git.checkout(target_branch)
+            _checkout(repo, target_branch)
         except Exception as e:
             return False, f"Failed to checkout {target_branch}: {e}"
 
@@ -78,11 +266,7 @@ class ConflictOnlyAIMerge(MergeStrategy):
 
         # Get list of conflicted files
         try:
-            status = repo.git.status("--porcelain")
-            conflicted_files = []
-            for line in status.split("\n"):
-                if line.startswith("UU "):  # Both modified (conflict)
-                    conflicted_files.append(line[3:].strip())
+            conflicted_files = _conflicted_files(repo)
         except Exception as e:
             repo.git.merge("--abort")
             return False, f"Failed to get conflict status: {e}"
@@ -96,24 +280,41 @@ class ConflictOnlyAIMerge(MergeStrategy):
                 repo.git.merge("--abort")
                 return False, f"Failed to commit: {e}"
 
-        # Resolve each conflicted file using AI
+        # Resolve each conflicted file using AI, several at a time
         working_dir = Path(repo.working_dir)
-        resolved_count = 0
-        failed_files = []
-
-        for file_path in conflicted_files:
-            full_path = working_dir / file_path
-            success, error = self._resolve_file_conflicts(full_path, source_branch, target_branch)
+        workers = min(len(conflicted_files), _AI_MERGE_WORKERS)
+        if self.persistent_sessions:
+            self._sessions = _MergeSessions(self._claude_executable, working_dir)
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(
+                    executor.map(
+                        lambda file_path: self._resolve_file_conflicts(
+                            working_dir / file_path, source_branch, target_branch
+                        ),
+                        conflicted_files,
+                    )
+                )
+        finally:
+            if self._sessions is not None:
+                self._sessions.close()
+                self._sessions = None
+
+        failed_files = [
+            f"{file_path}: {error}"
+            for file_path, (success, error) in zip(conflicted_files, results, strict=True)
+            if not success
+        ]
 
-            if success:
-                # Stage the resolved file
-                try:
-                    repo.git.add(file_path)
-                    resolved_count += 1
-                except Exception as e:
-                    failed_files.append(f"{file_path}: Failed to stage - {e}")
-            else:
-                failed_files.append(f"{file_path}: {error}")
+        # Stage every resolved file with a single git add, on this thread (the
+        # index is not safe to update concurrently). Any failure aborts the
+        # merge below, so nothing is staged in that case.
+        resolved_count = len(conflicted_files)
+        if not failed_files:
+            try:
+                repo.git.add("--", *conflicted_files)
+            except Exception as e:
+                failed_files.append(f"Failed to stage resolved files - {e}")
 
         # If any files failed to resolve, abort
         if failed_files:
@@ -183,11 +384,11 @@ OUTPUT the resolved file content below (no markdown code blocks, no explanations
         # Run Claude to resolve
         resolved_content, error = self._run_claude_resolution(prompt, file_path.parent)
 
-        if error:
-            return False, error
+        if error or resolved_content is None:
+            return False, error or "Claude returned no resolved content"
 
         # Validate resolution (no conflict markers should remain)
-        if "<<<<<<< " in resolved_content or "=======" in resolved_content or ">>>>>>> " in resolved_content:
+        if _CONFLICT_MARKER_RE.search(resolved_content):
             return False, "AI output still contains conflict markers"
 
         # Write resolved content
@@ -207,44 +408,35 @@ OUTPUT the resolved file content below (no markdown code blocks, no explanations
         Returns:
             (resolved_content, error) tuple - one will be None
         """
+        if self._sessions is not None:
+            return self._sessions.request(prompt, self.timeout)
+
+        # The prompt embeds whole files, so it goes through stdin rather than
+        # argv, which would copy it into the command line and cap its size
         cmd = [
-            self.claude_path,
-            "-p", prompt,
+            self._claude_executable,
+            "-p",
             "--output-format", "json",
             "--allowedTools", "",  # No tools needed, just text output
         ]
 
         try:
+            # Output stays bytes: it is parsed without first being decoded
+            # into a str copy of the whole response
             result = subprocess.run(
                 cmd,
+                input=prompt.encode(),
                 cwd=working_dir,
                 capture_output=True,
-                text=True,
                 timeout=self.timeout,
-                env=os.environ.copy(),
             )
 
             if result.returncode != 0:
-                return None, f"Claude returned error: {result.stderr or result.stdout}"
-
-            # Parse JSON output
-            output = result.stdout
-            try:
-                json_output = json.loads(output)
-                resolved = json_output.get("result", output)
-            except json.JSONDecodeError:
-                # Not JSON, use raw output
-                resolved = output
+                error = (result.stderr or result.stdout).decode(errors="replace")
+                return None, f"Claude returned error: {error}"
 
             # Clean up the output (remove any markdown code blocks if present)
-            resolved = resolved.strip()
-            if resolved.startswith("```") and resolved.endswith("```"):
-                # Remove code block markers
-                lines = resolved.split("\n")
-                if len(lines) > 2:
-                    resolved = "\n".join(lines[1:-1])
-
-            return resolved, None
+            return _strip_code_fence(_claude_result(result.stdout)), None
 
         except subprocess.TimeoutExpired:
             return None, f"AI resolution timed out after {self.timeout}s"
@@ -257,15 +449,24 @@ OUTPUT the resolved file content below (no markdown code blocks, no explanations
 class FullFileAIMerge(MergeStrategy):
     """Tier 3: AI regenerates entire conflicted files."""
 
-    def __init__(self, claude_path: str = "claude", timeout: int = 300):
+    def __init__(
+        self, claude_path: str = "claude", timeout: int = 300, persistent_sessions: bool = False
+    ):
         """Initialize with Claude Code configuration.
 
         Args:
             claude_path: Path to claude CLI (default: "claude")
             timeout: Timeout in seconds for AI regeneration (default: 300)
+            persistent_sessions: Reuse one Claude process per worker thread across
+                the conflicted files of a merge instead of spawning one per file
         """
         self.claude_path = claude_path
+        # Resolved against PATH once, so each spawn execs it directly; when it
+        # is not found, the name is kept and the spawn reports the error
+        self._claude_executable = shutil.which(claude_path) or claude_path
         self.timeout = timeout
+        self.persistent_sessions = persistent_sessions
+        self._sessions: _MergeSessions | None = None
 
     def merge(self, repo: Repo, source_branch: str, target_branch: str) -> tuple[bool, str]:
         """Use AI to regenerate conflicted files from scratch.
@@ -277,7 +478,7 @@ class FullFileAIMerge(MergeStrategy):
         """
         # Checkout target branch
         try:
-            repo.git.checkout(target_branch)
+            _checkout(repo, target_branch)
         except Exception as e:
             return False, f"Failed to checkout {target_branch}: {e}"
 
@@ -290,11 +491,7 @@ class FullFileAIMerge(MergeStrategy):
 
         # Get list of conflicted files
         try:
-            status = repo.git.status("--porcelain")
-            conflicted_files = []
-            for line in status.split("\n"):
-                if line.startswith("UU "):  # Both modified (conflict)
-                    conflicted_files.append(line[3:].strip())
+            conflicted_files = _conflicted_files(repo)
         except Exception as e:
             repo.git.merge("--abort")
             return False, f"Failed to get conflict status: {e}"
@@ -308,36 +505,52 @@ class FullFileAIMerge(MergeStrategy):
                 repo.git.merge("--abort")
                 return False, f"Failed to commit: {e}"
 
-        # Regenerate each conflicted file using AI
-        working_dir = Path(repo.working_dir)
-        regenerated_count = 0
-        failed_files = []
-
-        for file_path in conflicted_files:
-            # Get both versions of the file
-            source_content = self._get_file_from_branch(repo, source_branch, file_path)
-            target_content = self._get_file_from_branch(repo, target_branch, file_path)
-
-            if source_content is None and target_content is None:
-                failed_files.append(f"{file_path}: Could not read from either branch")
-                continue
-
-            # Regenerate the file using AI
-            full_path = working_dir / file_path
-            success, error = self._regenerate_file(
-                full_path, file_path, source_content, target_content,
-                source_branch, target_branch
+        # Read both versions of every file up front, on this thread: the reads
+        # share one persistent git cat-file process, which is not thread-safe
+        versions = {
+            file_path: (
+                self._get_file_from_branch(repo, source_branch, file_path),
+                self._get_file_from_branch(repo, target_branch, file_path),
             )
+            for file_path in conflicted_files
+        }
 
-            if success:
-                # Stage the regenerated file
-                try:
-                    repo.git.add(file_path)
-                    regenerated_count += 1
-                except Exception as e:
-                    failed_files.append(f"{file_path}: Failed to stage - {e}")
-            else:
-                failed_files.append(f"{file_path}: {error}")
+        # Regenerate each conflicted file using AI, several at a time
+        working_dir = Path(repo.working_dir)
+        workers = min(len(conflicted_files), _AI_MERGE_WORKERS)
+        if self.persistent_sessions:
+            self._sessions = _MergeSessions(self._claude_executable, working_dir)
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(
+                    executor.map(
+                        lambda file_path: self._regenerate_conflicted_file(
+                            working_dir, file_path, *versions[file_path],
+                            source_branch, target_branch
+                        ),
+                        conflicted_files,
+                    )
+                )
+        finally:
+            if self._sessions is not None:
+                self._sessions.close()
+                self._sessions = None
+
+        failed_files = [
+            f"{file_path}: {error}"
+            for file_path, (success, error) in zip(conflicted_files, results, strict=True)
+            if not success
+        ]
+
+        # Stage every regenerated file with a single git add, on this thread (the
+        # index is not safe to update concurrently). Any failure aborts the
+        # merge below, so nothing is staged in that case.
+        regenerated_count = len(conflicted_files)
+        if not failed_files:
+            try:
+                repo.git.add("--", *conflicted_files)
+            except Exception as e:
+                failed_files.append(f"Failed to stage regenerated files - {e}")
 
         # If any files failed to regenerate, abort
         if failed_files:
@@ -358,9 +571,43 @@ class FullFileAIMerge(MergeStrategy):
                 pass
             return False, f"Failed to commit after regeneration: {e}"
 
+    def _regenerate_conflicted_file(
+        self,
+        working_dir: Path,
+        file_path: str,
+        source_content: str | None,
+        target_content: str | None,
+        source_branch: str,
+        target_branch: str,
+    ) -> tuple[bool, str]:
+        """Regenerate a conflicted file from both branch versions using AI.
+
+        Args:
+            working_dir: Repository working directory
+            file_path: Path to file relative to repo root
+            source_content: Content from source branch (or None)
+            target_content: Content from target branch (or None)
+            source_branch: Name of source branch
+            target_branch: Name of target branch
+
+        Returns:
+            (success, error_message) tuple
+        """
+        if source_content is None and target_content is None:
+            return False, "Could not read from either branch"
+
+        return self._regenerate_file(
+            working_dir / file_path, file_path, source_content, target_content,
+            source_branch, target_branch
+        )
+
     def _get_file_from_branch(self, repo: Repo, branch: str, file_path: str) -> str | None:
         """Get file content from a specific branch.
 
+        Reads through GitPython's persistent ``git cat-file --batch`` process,
+        so every lookup after the first costs a pipe round trip rather than a
+        new git process. Not safe to call from several threads at once.
+
         Args:
             repo: Git repository
             branch: Branch name
@@ -370,9 +617,10 @@ class FullFileAIMerge(MergeStrategy):
             File content or None if file doesn't exist in branch
         """
         try:
-            return repo.git.show(f"{branch}:{file_path}")
+            _, _, _, data = repo.git.get_object_data(f"{branch}:{file_path}")
         except Exception:
             return None
+        return data.decode("utf-8", errors="replace")
 
     def _regenerate_file(
         self,
@@ -400,7 +648,7 @@ class FullFileAIMerge(MergeStrategy):
         if source_content is None and target_content is not None:
             # File only exists in target, keep target version
             try:
-                full_path.write_text(target_content)
+                _write_if_changed(full_path, target_content)
                 return True, ""
             except Exception as e:
                 return False, f"Failed to write file: {e}"
@@ -408,7 +656,7 @@ class FullFileAIMerge(MergeStrategy):
         if target_content is None and source_content is not None:
             # File only exists in source, use source version
             try:
-                full_path.write_text(source_content)
+                _write_if_changed(full_path, source_content)
                 return True, ""
             except Exception as e:
                 return False, f"Failed to write file: {e}"
@@ -444,12 +692,12 @@ OUTPUT the merged file content below (no markdown code blocks, no explanations):
         # Run Claude to regenerate
         merged_content, error = self._run_claude_regeneration(prompt, full_path.parent)
 
-        if error:
-            return False, error
+        if error or merged_content is None:
+            return False, error or "Claude returned no merged content"
 
         # Write merged content
         try:
-            full_path.write_text(merged_content)
+            _write_if_changed(full_path, merged_content)
             return True, ""
         except Exception as e:
             return False, f"Failed to write merged file: {e}"
@@ -464,45 +712,35 @@ OUTPUT the merged file content below (no markdown code blocks, no explanations):
         Returns:
             (merged_content, error) tuple - one will be None
         """
+        if self._sessions is not None:
+            return self._sessions.request(prompt, self.timeout)
+
+        # The prompt embeds whole files, so it goes through stdin rather than
+        # argv, which would copy it into the command line and cap its size
         cmd = [
-            self.claude_path,
-            "-p", prompt,
+            self._claude_executable,
+            "-p",
             "--output-format", "json",
             "--allowedTools", "",  # No tools needed, just text output
         ]
 
         try:
+            # Output stays bytes: it is parsed without first being decoded
+            # into a str copy of the whole response
             result = subprocess.run(
                 cmd,
+                input=prompt.encode(),
                 cwd=working_dir,
                 capture_output=True,
-                text=True,
                 timeout=self.timeout,
-                env=os.environ.copy(),
             )
 
             if result.returncode != 0:
-                return None, f"Claude returned error: {result.stderr or result.stdout}"
-
-            # Parse JSON output
-            output = result.stdout
-            try:
-                json_output = json.loads(output)
-                merged = json_output.get("result", output)
-            except json.JSONDecodeError:
-                # Not JSON, use raw output
-                merged = output
+                error = (result.stderr or result.stdout).decode(errors="replace")
+                return None, f"Claude returned error: {error}"
 
             # Clean up the output (remove any markdown code blocks if present)
-            merged = merged.strip()
-            if merged.startswith("```") and merged.endswith("```"):
-                # Remove code block markers
-                lines = merged.split("\n")
-                if len(lines) > 2:
-                    # Check if first line has a language identifier
-                    merged = "\n".join(lines[1:-1])
-
-            return merged, None
+            return _strip_code_fence(_claude_result(result.stdout)), None
 
         except subprocess.TimeoutExpired:
             return None, f"AI regeneration timed out after {self.timeout}s"
@@ -515,23 +753,47 @@ OUTPUT the merged file content below (no markdown code blocks, no explanations):
 class MergeOrchestrator:
     """Orchestrates merge operations with 3-tier strategy."""
 
-    def __init__(self, repo_path: Path, claude_path: str = "claude", timeout: int = 300):
+    def __init__(
+        self,
+        repo_path: Path,
+        claude_path: str = "claude",
+        timeout: int = 300,
+        persistent_sessions: bool = False,
+    ):
         """Initialize merge orchestrator.
 
         Args:
             repo_path: Path to the git repository
             claude_path: Path to claude CLI (default: "claude")
             timeout: Timeout in seconds for AI operations (default: 300)
+            persistent_sessions: Let the AI tiers reuse Claude processes across
+                the conflicted files of a merge
         """
-        self.repo = Repo(repo_path)
+        self._repo_path = repo_path
         self.claude_path = claude_path
         self.timeout = timeout
         self.strategies = [
             ("Auto-merge", GitAutoMerge()),
-            ("AI conflict resolution", ConflictOnlyAIMerge(claude_path, timeout)),
-            ("AI file regeneration", FullFileAIMerge(claude_path, timeout)),
+            (
+                "AI conflict resolution",
+                ConflictOnlyAIMerge(claude_path, timeout, persistent_sessions),
+            ),
+            (
+                "AI file regeneration",
+                FullFileAIMerge(claude_path, timeout, persistent_sessions),
+            ),
         ]
 
+    @functools.cached_property
+    def repo(self) -> Repo:
+        """The repository, opened on first use rather than at construction."""
+        return Repo(self._repo_path)
+
+    @functools.cached_property
+    def _merge_head_path(self) -> Path:
+        """MERGE_HEAD in the real git dir (in a linked worktree .git is a file)."""
+        return Path(self.repo.git_dir) / "MERGE_HEAD"
+
     def merge_task(self, task_id: str, target_branch: str = "main") -> tuple[bool, str]:
         """
         Merge a task branch into target using 3-tier strategy.
@@ -546,13 +808,22 @@ class MergeOrchestrator:
         source_branch = f"task/{task_id}"
 
         # Verify source branch exists
-        try:
-            self.repo.git.rev_parse("--verify", source_branch)
-        except Exception:
+        if not _branch_exists(self.repo, source_branch):
             return False, f"Source branch not found: {source_branch}"
 
+        # A merge known to conflict skips the auto-merge tier, saving its
+        # checkout, merge and abort
+        conflicts = _predict_conflicts(self.repo, source_branch, target_branch)
+
         # Try each strategy in order
         for strategy_name, strategy in self.strategies:
+            if (
+                conflicts
+                and isinstance(strategy, GitAutoMerge)
+                and strategy is not self.strategies[-1][1]
+            ):
+                continue
+
             success, message = strategy.merge(self.repo, source_branch, target_branch)
 
             if success:
@@ -587,8 +858,7 @@ class MergeOrchestrator:
         """Get current merge status."""
         try:
             # Check if merge is in progress
-            merge_head_path = Path(self.repo.working_dir) / ".git" / "MERGE_HEAD"
-            in_progress = merge_head_path.exists()
+            in_progress = self._merge_head_path.exists()
 
             return {
                 "in_progress": in_progress,
@@ -11,6 +11,7 @@ from __future__ import annotations
 import logging
 import re
 import subprocess
+import time
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
@@ -28,6 +29,23 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Built-in completion promise and verification method per agent type, used
+# when agent_defaults does not override them
+_DEFAULT_PROMISES: dict[str, str] = {
+    "coder": "IMPLEMENTATION_COMPLETE",
+    "reviewer": "REVIEW_PASSED",
+    "tester": "TESTS_PASSED",
+    "qa": "QA_PASSED",
+    "architect": "DESIGN_COMPLETE",
+}
+_DEFAULT_VERIFICATION_METHODS: dict[str, VerificationMethod] = {
+    "coder": VerificationMethod.EXTERNAL,
+    "reviewer": VerificationMethod.SEMANTIC,
+    "tester": VerificationMethod.EXTERNAL,
+    "qa": VerificationMethod.MULTI_STAGE,
+    "architect": VerificationMethod.STRING_MATCH,
+}
+
 
 # =============================================================================
 # Ralph Loop Configuration and State
@@ -59,10 +77,9 @@ class RalphLoopConfig:
         Returns:
             Max iterations (agent-specific or global default)
         """
-        if agent_type in self.agent_defaults:
-            return self.agent_defaults[agent_type].get(
-                "max_iterations", self.max_iterations
-            )
+        defaults = self.agent_defaults.get(agent_type)
+        if defaults is not None:
+            return defaults.get("max_iterations", self.max_iterations)
         return self.max_iterations
 
     def get_default_promise_for_agent(self, agent_type: str) -> str:
@@ -74,18 +91,11 @@ class RalphLoopConfig:
         Returns:
             Default promise text
         """
-        default_promises = {
-            "coder": "IMPLEMENTATION_COMPLETE",
-            "reviewer": "REVIEW_PASSED",
-            "tester": "TESTS_PASSED",
-            "qa": "QA_PASSED",
-            "architect": "DESIGN_COMPLETE",
-        }
-        if agent_type in self.agent_defaults:
-            return self.agent_defaults[agent_type].get(
-                "promise", default_promises.get(agent_type, "STAGE_COMPLETE")
-            )
-        return default_promises.get(agent_type, "STAGE_COMPLETE")
+        default = _DEFAULT_PROMISES.get(agent_type, "STAGE_COMPLETE")
+        defaults = self.agent_defaults.get(agent_type)
+        if defaults is not None:
+            return defaults.get("promise", default)
+        return default
 
     def get_default_verification_for_agent(
         self, agent_type: str
@@ -98,21 +108,15 @@ class RalphLoopConfig:
         Returns:
             Default verification method
         """
-        default_methods = {
-            "coder": VerificationMethod.EXTERNAL,
-            "reviewer": VerificationMethod.SEMANTIC,
-            "tester": VerificationMethod.EXTERNAL,
-            "qa": VerificationMethod.MULTI_STAGE,
-            "architect": VerificationMethod.STRING_MATCH,
-        }
-        if agent_type in self.agent_defaults:
-            method_str = self.agent_defaults[agent_type].get("verification")
+        defaults = self.agent_defaults.get(agent_type)
+        if defaults is not None:
+            method_str = defaults.get("verification")
             if method_str:
                 try:
                     return VerificationMethod(method_str)
                 except ValueError:
                     pass
-        return default_methods.get(agent_type, self.default_verification)
+        return _DEFAULT_VERIFICATION_METHODS.get(agent_type, self.default_verification)
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> RalphLoopConfig:
@@ -176,6 +180,14 @@ class RalphLoopState:
     completion_criteria: CompletionCriteria
     started_at: datetime
     verification_results: list[dict[str, Any]] = field(default_factory=list)
+    # time.monotonic() value matching started_at, set once in __post_init__
+    _started_monotonic: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Anchor started_at to the monotonic clock."""
+        self._started_monotonic = time.monotonic() - (
+            datetime.now() - self.started_at
+        ).total_seconds()
 
     @property
     def is_at_limit(self) -> bool:
@@ -184,8 +196,12 @@ class RalphLoopState:
 
     @property
     def elapsed_seconds(self) -> float:
-        """Get elapsed time since loop started."""
-        return (datetime.now() - self.started_at).total_seconds()
+        """Get elapsed time since loop started.
+
+        Measured on the monotonic clock, so it is cheap to poll and does not
+        jump when the wall clock is adjusted.
+        """
+        return time.monotonic() - self._started_monotonic
 
     @property
     def last_verification(self) -> dict[str, Any] | None:
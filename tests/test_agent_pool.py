@@ -5,6 +5,7 @@ import pytest
 from claudecraft.orchestration.agent_pool import AgentPool, AgentSlot, AgentType
 from claudecraft.core.models import Task, TaskStatus
 from datetime import datetime
+from unittest.mock import patch
 
 
 def test_agent_pool_creation():
@@ -324,3 +325,162 @@ def test_dequeue_empty_queue():
 
     dequeued = pool.dequeue_task()
     assert dequeued is None
+
+
+def _make_task(task_id: str, priority: int = 1) -> Task:
+    """Build a minimal Task for pool tests."""
+    return Task(
+        id=task_id,
+        spec_id="spec-1",
+        title=f"Test {task_id}",
+        description="Test",
+        status=TaskStatus.TODO,
+        priority=priority,
+        dependencies=[],
+        assignee=None,
+        worktree=None,
+        metadata={},
+        iteration=0,
+        created_at=datetime.now(),
+        updated_at=datetime.now(),
+    )
+
+
+def test_pool_status_snapshot_cached_until_slot_changes():
+    """Test slot snapshots are reused until a slot is assigned or released."""
+    pool = AgentPool(max_agents=2)
+
+    first = pool.get_status()
+    assert pool.get_status()["slots"] is first["slots"]
+
+    pool.assign_task(_make_task("task-1"), AgentType.CODER, "/path")
+    assigned = pool.get_status()
+    assert assigned["slots"] is not first["slots"]
+    assert assigned["slots"][0]["task_id"] == "task-1"
+    assert assigned["active"] == 1
+
+    # Assigning a slot directly also invalidates the snapshot
+    pool.slots[1].assign("task-2", AgentType.TESTER, "/path2")
+    assert pool.get_status()["active"] == 2
+
+    pool.complete_task("task-1")
+    released = pool.get_status()
+    assert released["slots"][0]["status"] == "idle"
+    assert released["available"] == 1
+
+
+def test_slot_change_during_status_rebuild_is_not_lost():
+    """Test a slot changing while the snapshot is rebuilt invalidates it again."""
+    pool = AgentPool(max_agents=2)
+    count_active = pool.get_active_count
+
+    def assign_mid_rebuild() -> int:
+        pool.slots[1].assign("task-2", AgentType.TESTER, "/path2")
+        return count_active()
+
+    with patch.object(pool, "get_active_count", side_effect=assign_mid_rebuild):
+        pool.get_status()
+
+    status = pool.get_status()
+    assert status["active"] == 1
+    assert status["slots"][1]["task_id"] == "task-2"
+
+def test_status_waits_for_dispatch_in_progress():
+    """Test get_status blocks while another thread holds the pool lock."""
+    import threading
+
+    pool = AgentPool(max_agents=2)
+    statuses: list[dict] = []
+    reader = threading.Thread(target=lambda: statuses.append(pool.get_status()))
+
+    with pool._lock:
+        reader.start()
+        reader.join(timeout=0.1)
+        assert reader.is_alive()
+        pool.slots[0].assign("task-1", AgentType.CODER, "/path")
+
+    reader.join(timeout=5)
+    assert statuses[0]["active"] == 1
+
+def test_slot_indexes_follow_assign_and_release():
+    """Test idle and task lookups stay consistent through slot reuse."""
+    pool = AgentPool(max_agents=3)
+
+    pool.assign_task(_make_task("task-1"), AgentType.CODER, "/p1")
+    pool.assign_task(_make_task("task-2"), AgentType.CODER, "/p2")
+    assert pool.get_available_slot().slot_id == 3
+    assert pool.get_active_count() == 2
+
+    pool.fail_task("task-1")
+    assert pool.get_slot_by_task("task-1") is None
+    assert pool.get_available_slot().slot_id == 1
+
+    # Slot 1 is reused for a new task
+    slot = pool.assign_task(_make_task("task-3"), AgentType.TESTER, "/p3")
+    assert slot.slot_id == 1
+    assert pool.get_slot_by_task("task-3") is slot
+    assert pool.get_slot_by_task("task-2").slot_id == 2
+    assert pool.get_active_count() == 2
+
+
+def test_dequeue_by_priority_then_insertion_order():
+    """Test the queue yields highest priority first and is FIFO within a priority."""
+    pool = AgentPool(max_agents=1)
+    for task_id, priority in [("low", 1), ("high-a", 5), ("mid", 3), ("high-b", 5)]:
+        pool.queue_task(_make_task(task_id, priority=priority))
+
+    assert [t.id for t in pool.get_queued_tasks()] == ["high-a", "high-b", "mid", "low"]
+    assert pool.get_status()["queued"] == 4
+
+    dequeued = [pool.dequeue_task().id for _ in range(4)]
+    assert dequeued == ["high-a", "high-b", "mid", "low"]
+    assert pool.dequeue_task() is None
+
+
+def test_status_callbacks_run_off_the_dispatch_thread():
+    """Test callbacks receive every status change in order on the notifier thread."""
+    import threading
+
+    pool = AgentPool(max_agents=2)
+    received: list[tuple[int, str, str]] = []
+    threads: set[str] = set()
+
+    def callback(slot_id: int, task_id: str, status: str) -> None:
+        threads.add(threading.current_thread().name)
+        received.append((slot_id, task_id, status))
+
+    def failing_callback(slot_id: int, task_id: str, status: str) -> None:
+        raise RuntimeError("callback errors must not break the pool")
+
+    pool.register_status_callback(failing_callback)
+    pool.register_status_callback(callback)
+
+    pool.assign_task(_make_task("task-1"), AgentType.CODER, "/p1")
+    pool.complete_task("task-1")
+    pool.assign_task(_make_task("task-2"), AgentType.CODER, "/p2")
+    pool.fail_task("task-2")
+    pool.wait_for_notifications()
+
+    assert received == [
+        (1, "task-1", "assigned"),
+        (1, "task-1", "completed"),
+        (1, "task-2", "assigned"),
+        (1, "task-2", "failed"),
+    ]
+    assert threads == {"agent-pool-notifier"}
+
+
+def test_concurrent_assign_never_shares_a_slot():
+    """Test that threads racing to assign tasks each get a distinct slot."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    pool = AgentPool(max_agents=4)
+    tasks = [_make_task(f"task-{i}") for i in range(16)]
+
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        slots = list(executor.map(lambda t: pool.assign_task(t, AgentType.CODER, "/p"), tasks))
+
+    assigned = [slot for slot in slots if slot is not None]
+    assert len(assigned) == 4
+    assert len({slot.slot_id for slot in assigned}) == 4
+    assert pool.get_active_count() == 4
@@ -4,16 +4,19 @@ import json
 from datetime import datetime
 from io import StringIO
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 
 from claudecraft.cli import (
     _build_completion_spec,
     _parse_completion_spec_from_dict,
+    _print_json,
+    _sniff_subcommand,
     _validate_completion_criteria,
     cmd_agent_start,
     cmd_agent_stop,
+    cmd_execute,
     cmd_init,
     cmd_list_agents,
     cmd_list_specs,
@@ -981,6 +984,98 @@ class TestMain:
             result = main()
         assert result == 1
 
+    def test_print_json_uses_orjson_when_available(self, capsys):
+        """JSON output goes through orjson if installed, else the stdlib."""
+        fake_orjson = MagicMock()
+        fake_orjson.dumps.return_value = b'{\n  "a": 1\n}'
+        with patch("claudecraft.cli.orjson", fake_orjson):
+            _print_json({"a": 1})
+        fake_orjson.dumps.assert_called_once()
+
+        with patch("claudecraft.cli.orjson", None):
+            _print_json({"a": 1})
+
+        out = capsys.readouterr().out
+        assert out == '{\n  "a": 1\n}\n' * 2
+
+    def test_print_json_encodes_models_via_to_dict(self, capsys):
+        """Model objects can be passed straight to _print_json."""
+        now = datetime.now()
+        spec = Spec(
+            id="s1",
+            title="Spec",
+            status=SpecStatus.DRAFT,
+            source_type=None,
+            created_at=now,
+            updated_at=now,
+            metadata={},
+        )
+        with patch("claudecraft.cli.orjson", None):
+            _print_json({"specs": [spec]})
+        assert json.loads(capsys.readouterr().out) == {"specs": [spec.to_dict()]}
+
+        with patch("claudecraft.cli.orjson", None), pytest.raises(TypeError):
+            _print_json({"x": object()})
+
+    def test_sniff_subcommand(self):
+        """The first positional argument names the subcommand."""
+        assert _sniff_subcommand(["--json", "status"]) == "status"
+        assert _sniff_subcommand(["list-tasks", "--spec", "x"]) == "list-tasks"
+        assert _sniff_subcommand(["--json"]) is None
+
+    def test_main_builds_only_requested_subparser(self, cli_project):
+        """Only the parser for the command being run is constructed."""
+        with (
+            patch.dict(
+                "claudecraft.cli._SUBPARSER_BUILDERS",
+                {"memory-list": MagicMock(side_effect=AssertionError("built"))},
+            ),
+            patch("sys.argv", ["claudecraft", "status"]),
+        ):
+            assert main() == 0
+
+    def test_main_execute_passes_persistent_sessions(self, cli_project):
+        """execute --persistent-sessions reaches the handler."""
+        with (
+            patch("claudecraft.cli.cmd_execute", return_value=0) as mock_cmd,
+            patch("sys.argv", ["claudecraft", "execute", "--persistent-sessions"]),
+        ):
+            assert main() == 0
+        assert mock_cmd.call_args.args[4] is True
+
+    def test_execute_persistent_sessions_reach_pipeline_and_merge(self, cli_project):
+        """cmd_execute hands persistent_sessions to the pipeline and the merger."""
+        with (
+            patch("claudecraft.orchestration.execution.ExecutionPipeline") as pipeline_cls,
+            patch("claudecraft.orchestration.merge.MergeOrchestrator") as merge_cls,
+            patch("claudecraft.orchestration.worktree.WorktreeManager"),
+            patch("sys.stdout", new_callable=StringIO),
+        ):
+            cmd_execute(json_output=True, persistent_sessions=True)
+        assert pipeline_cls.call_args.kwargs["persistent_sessions"] is True
+        assert merge_cls.call_args.kwargs["persistent_sessions"] is True
+
+    def test_main_unknown_command_lists_all(self, cli_project, capsys):
+        """Unknown commands still get the full list of choices."""
+        with patch("sys.argv", ["claudecraft", "bogus"]), pytest.raises(SystemExit):
+            main()
+        assert "list-tasks" in capsys.readouterr().err
+
+    def test_main_list_tasks_status_parsed_to_enum(self, cli_project):
+        """list-tasks --status reaches the handler as a TaskStatus."""
+        with (
+            patch("claudecraft.cli.cmd_list_tasks", return_value=0) as mock_cmd,
+            patch("sys.argv", ["claudecraft", "list-tasks", "--status", "done"]),
+        ):
+            assert main() == 0
+        assert mock_cmd.call_args.args[1] is TaskStatus.DONE
+
+        with (
+            patch("sys.argv", ["claudecraft", "list-tasks", "--status", "bogus"]),
+            pytest.raises(SystemExit),
+        ):
+            main()
+
 
 class TestErrorHandling:
     """Tests for error handling in CLI commands."""
@@ -1,6 +1,8 @@
 """Tests for configuration management."""
 
+import os
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -31,6 +33,14 @@ class TestDeepMerge:
         result = _deep_merge(base, override)
         assert result == {"a": {"nested": True}}
 
+    def test_merge_leaves_base_untouched(self):
+        """Test that deeply nested overrides do not modify the base dict."""
+        base = {"a": {"b": {"c": 1, "d": 2}}, "e": 3}
+        override = {"a": {"b": {"c": 10}}}
+        result = _deep_merge(base, override)
+        assert result == {"a": {"b": {"c": 10, "d": 2}}, "e": 3}
+        assert base == {"a": {"b": {"c": 1, "d": 2}}, "e": 3}
+
 
 class TestFindProjectRoot:
     """Tests for find_project_root function."""
@@ -52,6 +62,15 @@ class TestFindProjectRoot:
         root = find_project_root(nested)
         assert root is None
 
+    def test_ignores_claudecraft_file(self, temp_dir):
+        """Test that a plain .claudecraft file is not treated as a project."""
+        (temp_dir / ".claudecraft").write_text("")
+        nested = temp_dir / "src"
+        nested.mkdir()
+
+        root = find_project_root(nested)
+        assert root is None
+
 
 class TestConfig:
     """Tests for Config class."""
@@ -96,6 +115,55 @@ class TestConfig:
         loaded = Config.load(temp_config.config_path)
         assert loaded.project_name == "modified-project"
 
+    def test_load_writes_and_reuses_cache(self, temp_config):
+        """Test that the parsed YAML is cached and reused until the file changes."""
+        config_path = temp_config.config_path
+        cache_path = config_path.parent / "state" / "config.cache.json"
+        assert cache_path.exists()
+        assert not config_path.with_suffix(".cache.json").exists()
+
+        with patch("claudecraft.core.config.yaml.load") as mock_load:
+            loaded = Config.load(temp_config.config_path)
+        mock_load.assert_not_called()
+        assert loaded.project_name == temp_config.project_name
+
+        temp_config._raw["project"]["name"] = "renamed-project"
+        temp_config.save()
+        assert Config.load(temp_config.config_path).project_name == "renamed-project"
+
+    def test_cache_follows_same_size_edit(self, temp_config):
+        """Test an edit that keeps the size and mtime still invalidates the cache."""
+        config_path = temp_config.config_path
+        st = config_path.stat()
+        content = config_path.read_text()
+        assert "test-project" in content
+        config_path.write_text(content.replace("test-project", "best-project"))
+        os.utime(config_path, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+        assert Config.load(config_path).project_name == "best-project"
+
+    def test_create_default_quotes_special_names(self, temp_dir):
+        """Test that names needing YAML quoting survive the round trip."""
+        for name in ["plain-name", "yes", "my project: v2"]:
+            config_path = temp_dir / name.replace(" ", "_").replace(":", "") / "config.yaml"
+            with patch("claudecraft.core.config.yaml.load") as mock_load:
+                config = Config.create_default(config_path, name)
+            mock_load.assert_not_called()
+            assert config.project_name == name
+
+            (config_path.parent / "state" / "config.cache.json").unlink()
+            assert Config.load(config_path).project_name == name
+
+    def test_defaults_not_mutated(self, temp_dir):
+        """Test that creating and editing configs leaves DEFAULT_CONFIG alone."""
+        config = Config.create_default(temp_dir / ".claudecraft" / "config.yaml", "named")
+        config._raw["agents"]["max_parallel"] = 99
+        config.bootstrap_commands.append("make")
+
+        assert DEFAULT_CONFIG["project"]["name"] == "unnamed-project"
+        assert DEFAULT_CONFIG["agents"]["max_parallel"] != 99
+        assert DEFAULT_CONFIG["execution"]["bootstrap"] == []
+
     def test_default_bootstrap_commands_empty(self, temp_config):
         """Test that bootstrap_commands defaults to empty list."""
         assert temp_config.bootstrap_commands == []
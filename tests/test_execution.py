@@ -1,6 +1,9 @@
 """Tests for execution pipeline."""
 
+import io
 import json
+import sys
+import textwrap
 from datetime import datetime
 from pathlib import Path
 from unittest.mock import MagicMock, patch
@@ -10,6 +13,7 @@ import pytest
 from claudecraft.core.models import (
     ActiveRalphLoop,
     CompletionCriteria,
+    ExecutionLog,
     Spec,
     SpecStatus,
     Task,
@@ -25,6 +29,7 @@ from claudecraft.orchestration.execution import (
     ExecutionPipeline,
     ExecutionResult,
     PipelineStage,
+    _LogWriter,
 )
 from claudecraft.orchestration.ralph import RalphLoop, RalphLoopConfig
 
@@ -81,6 +86,40 @@ def sample_task(project):
     return task
 
 
+class FakeClaudeProcess:
+    """A finished one-shot Claude CLI process replaying a run()-style result."""
+
+    def __init__(self, result, stderr):
+        self.stdout = io.StringIO(result.stdout)
+        self.returncode = result.returncode
+        stderr.write(result.stderr)
+
+    def poll(self):
+        return self.returncode
+
+    def wait(self, timeout=None):
+        return self.returncode
+
+    def terminate(self):
+        pass
+
+    kill = terminate
+
+
+def patch_claude(result=None, side_effect=None):
+    """Patch the Claude CLI spawn to replay run()-style results.
+
+    ``side_effect`` is called with the command and keyword arguments, as
+    ``subprocess.run`` used to be, and returns the result to replay.
+    """
+
+    def popen(cmd, **kwargs):
+        run_result = side_effect(cmd, **kwargs) if side_effect else result
+        return FakeClaudeProcess(run_result, kwargs["stderr"])
+
+    return patch("subprocess.Popen", side_effect=popen)
+
+
 def test_pipeline_creation(pipeline):
     """Test pipeline creation with default stages."""
     assert len(pipeline.pipeline) == 4
@@ -147,6 +186,16 @@ def test_extract_issues(pipeline):
     assert any("Issue:" in issue for issue in issues)
 
 
+def test_extract_issues_one_per_line_and_capped(pipeline):
+    """A line with several markers is reported once; at most 10 issues."""
+    output = "ERROR: bad FAIL: worse\n" + "\n".join(f"BUG: {i}" for i in range(15))
+
+    issues = pipeline._extract_issues(output)
+    assert len(issues) == 10
+    assert issues[0] == "ERROR: bad FAIL: worse"
+    assert issues[1] == "BUG: 0"
+
+
 def test_extract_issues_none(pipeline):
     """Test extracting issues from clean output."""
     output = "Everything is fine\nNo problems here"
@@ -281,6 +330,31 @@ class TestReadFile:
         content = pipeline._read_file(tmp_path / "nonexistent.md")
         assert content is None
 
+    def test_read_cached_until_modified(self, pipeline, tmp_path):
+        """Unchanged files are served from cache; modified ones are re-read."""
+        test_file = tmp_path / "spec.md"
+        test_file.write_text("v1")
+        assert pipeline._read_file(test_file) == "v1"
+
+        with patch.object(Path, "read_text") as mock_read:
+            assert pipeline._read_file(test_file) == "v1"
+            mock_read.assert_not_called()
+
+        test_file.write_text("version 2")
+        assert pipeline._read_file(test_file) == "version 2"
+
+    def test_memory_context_cached_per_revision(self, pipeline):
+        """Memory context is rebuilt only after the memory store changes."""
+        memory = pipeline.project.memory
+        with patch.object(memory, "get_context_for_spec", return_value="ctx") as mock_ctx:
+            pipeline._get_memory_context("spec-1")
+            pipeline._get_memory_context("spec-1")
+            assert mock_ctx.call_count == 1
+
+            memory.revision += 1
+            pipeline._get_memory_context("spec-1")
+            assert mock_ctx.call_count == 2
+
 
 class TestBuildAgentPrompt:
     """Tests for _build_agent_prompt method."""
@@ -343,6 +417,19 @@ class TestBuildAgentPrompt:
         assert "claudecraft list-tasks" not in prompt
 
 
+# An agent that names its sentinel while planning, then keeps working: text
+# and tool_use arrive as separate assistant events before the result
+SENTINEL_MID_TURN = """\
+def emit(**event):
+    print(json.dumps(dict(event, session_id="sess-1")), flush=True)
+
+text = {"type": "text", "text": "I will print IMPLEMENTATION COMPLETE when done."}
+emit(type="assistant", message={"content": [text]})
+emit(type="assistant", message={"content": [{"type": "tool_use", "name": "Edit"}]})
+time.sleep(0.2)
+emit(type="result", result="all done", is_error=False)
+"""
+
 class TestRunClaudeHeadless:
     """Tests for _run_claude_headless method."""
 
@@ -355,7 +442,7 @@ class TestRunClaudeHeadless:
         )
         mock_result.stderr = ""
 
-        with patch("subprocess.run", return_value=mock_result) as mock_run:
+        with patch_claude(mock_result) as mock_run:
             output, session_id, success = pipeline._run_claude_headless(
                 prompt="Test prompt",
                 working_dir=Path("/tmp"),
@@ -375,7 +462,7 @@ class TestRunClaudeHeadless:
         mock_result.stdout = "Done"
         mock_result.stderr = ""
 
-        with patch("subprocess.run", return_value=mock_result) as mock_run:
+        with patch_claude(mock_result) as mock_run:
             pipeline._run_claude_headless(
                 prompt="Test",
                 working_dir=Path("/tmp"),
@@ -388,6 +475,66 @@ class TestRunClaudeHeadless:
             assert "--model" in call_args
             assert "opus" in call_args
 
+    def test_run_limits_concurrent_processes(self, project, agent_pool):
+        """No more than max_claude_processes CLIs run at once."""
+        import threading
+        import time
+
+        pipeline = ExecutionPipeline(project, agent_pool, max_claude_processes=2)
+        running = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def mock_run(*args, **kwargs):
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            time.sleep(0.05)
+            with lock:
+                running -= 1
+            result = MagicMock()
+            result.returncode = 0
+            result.stdout = "Done"
+            result.stderr = ""
+            return result
+
+        def call():
+            pipeline._run_claude_headless(
+                prompt="Test",
+                working_dir=Path("/tmp"),
+                allowed_tools="Read",
+                agent_type=AgentType.CODER,
+            )
+
+        with patch_claude(side_effect=mock_run):
+            threads = [threading.Thread(target=call) for _ in range(5)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        assert peak == 2
+
+    def test_run_closes_stdin(self, pipeline):
+        """The CLI must not inherit an open stdin it would wait on."""
+        import subprocess
+
+        mock_result = MagicMock()
+        mock_result.returncode = 0
+        mock_result.stdout = "Done"
+        mock_result.stderr = ""
+
+        with patch_claude(mock_result) as mock_run:
+            pipeline._run_claude_headless(
+                prompt="Test",
+                working_dir=Path("/tmp"),
+                allowed_tools="Read",
+                agent_type=AgentType.CODER,
+            )
+
+            assert mock_run.call_args.kwargs["stdin"] is subprocess.DEVNULL
+
     def test_run_failure(self, pipeline):
         """Test failed Claude execution."""
         mock_result = MagicMock()
@@ -395,7 +542,7 @@ class TestRunClaudeHeadless:
         mock_result.stdout = "Error occurred"
         mock_result.stderr = "Something went wrong"
 
-        with patch("subprocess.run", return_value=mock_result):
+        with patch_claude(mock_result):
             output, session_id, success = pipeline._run_claude_headless(
                 prompt="Test",
                 working_dir=Path("/tmp"),
@@ -406,11 +553,57 @@ class TestRunClaudeHeadless:
             assert success is False
             assert "Something went wrong" in output
 
-    def test_run_timeout(self, pipeline):
+    def _fake_cli(self, tmp_path, body):
+        script = tmp_path / "fake_claude"
+        script.write_text(f"#!{sys.executable}\nimport json, time\n{body}")
+        script.chmod(0o755)
+        return str(script)
+
+    def test_run_timeout(self, project, agent_pool, tmp_path):
         """Test Claude execution timeout."""
-        import subprocess
+        claude = self._fake_cli(tmp_path, "time.sleep(30)\n")
+        pipeline = ExecutionPipeline(project, agent_pool, claude_path=claude, timeout=0.2)
+
+        output, session_id, success = pipeline._run_claude_headless(
+            prompt="Test",
+            working_dir=tmp_path,
+            allowed_tools="Read",
+            agent_type=AgentType.CODER,
+        )
 
-        with patch("subprocess.run", side_effect=subprocess.TimeoutExpired("claude", 600)):
+        assert success is False
+        assert "TIMEOUT" in output
+        assert session_id is None
+
+    def test_run_not_stopped_by_sentinel_mid_turn(self, project, agent_pool, tmp_path):
+        """A sentinel in text followed by a tool call does not end the run."""
+        claude = self._fake_cli(tmp_path, SENTINEL_MID_TURN)
+        pipeline = ExecutionPipeline(project, agent_pool, claude_path=claude, timeout=20)
+
+        output, session_id, success = pipeline._run_claude_headless(
+            prompt="Test",
+            working_dir=tmp_path,
+            allowed_tools="Read",
+            agent_type=AgentType.CODER,
+        )
+
+        assert success is True
+        assert output == "all done"
+        assert session_id == "sess-1"
+
+    def test_run_streams_stream_json(self, pipeline):
+        """The CLI is asked for stream-json and only the result event is kept."""
+        mock_result = MagicMock()
+        mock_result.returncode = 0
+        mock_result.stdout = (
+            json.dumps({"type": "system", "subtype": "init"})
+            + "\n"
+            + json.dumps({"type": "result", "result": "Done", "session_id": "sess-2"})
+            + "\n"
+        )
+        mock_result.stderr = ""
+
+        with patch_claude(mock_result) as mock_popen:
             output, session_id, success = pipeline._run_claude_headless(
                 prompt="Test",
                 working_dir=Path("/tmp"),
@@ -418,13 +611,13 @@ class TestRunClaudeHeadless:
                 agent_type=AgentType.CODER,
             )
 
-            assert success is False
-            assert "TIMEOUT" in output
-            assert session_id is None
+        cmd = mock_popen.call_args[0][0]
+        assert cmd[cmd.index("--output-format") + 1] == "stream-json"
+        assert (output, session_id, success) == ("Done", "sess-2", True)
 
     def test_run_claude_not_found(self, pipeline):
         """Test Claude CLI not found."""
-        with patch("subprocess.run", side_effect=FileNotFoundError()):
+        with patch("subprocess.Popen", side_effect=FileNotFoundError()):
             output, session_id, success = pipeline._run_claude_headless(
                 prompt="Test",
                 working_dir=Path("/tmp"),
@@ -443,7 +636,7 @@ class TestRunClaudeHeadless:
         mock_result.stdout = "Plain text output without JSON"
         mock_result.stderr = ""
 
-        with patch("subprocess.run", return_value=mock_result):
+        with patch_claude(mock_result):
             output, session_id, success = pipeline._run_claude_headless(
                 prompt="Test",
                 working_dir=Path("/tmp"),
@@ -456,6 +649,97 @@ class TestRunClaudeHeadless:
             assert session_id is None
 
 
+FAKE_CLAUDE = """\
+import json, os, sys
+
+for line in sys.stdin:
+    prompt = json.loads(line)["message"]["content"]
+    print(json.dumps({"type": "assistant", "message": prompt}), flush=True)
+    print(json.dumps({"type": "result", "result": f"{os.getpid()}:{prompt}",
+                      "session_id": "sess-1", "is_error": False}), flush=True)
+"""
+
+
+class TestPersistentSessions:
+    """Tests for running agents on pooled persistent Claude sessions."""
+
+    @pytest.fixture
+    def session_pipeline(self, project, agent_pool, tmp_path):
+        script = tmp_path / "fake_claude"
+        script.write_text(f"#!{sys.executable}\n{FAKE_CLAUDE}")
+        script.chmod(0o755)
+        pipeline = ExecutionPipeline(
+            project, agent_pool, claude_path=str(script), persistent_sessions=True
+        )
+        yield pipeline
+        pipeline._worker_pool.shutdown()
+
+    def _run(self, pipeline, prompt, working_dir, agent_type=AgentType.CODER):
+        return pipeline._run_claude_headless(
+            prompt=prompt,
+            working_dir=working_dir,
+            allowed_tools="Read",
+            agent_type=agent_type,
+        )
+
+    def test_session_reused_across_prompts(self, session_pipeline, tmp_path):
+        """Successive prompts for the same stage go to the same process."""
+        first, session_id, success = self._run(session_pipeline, "one", tmp_path)
+        second, _, _ = self._run(session_pipeline, "two", tmp_path)
+
+        assert success is True
+        assert session_id == "sess-1"
+        assert first.endswith(":one")
+        assert second.endswith(":two")
+        assert first.split(":")[0] == second.split(":")[0]
+
+    def test_sessions_not_shared_across_agents(self, session_pipeline, tmp_path):
+        """Different agent types get their own process."""
+        coder, _, _ = self._run(session_pipeline, "a", tmp_path, AgentType.CODER)
+        reviewer, _, _ = self._run(session_pipeline, "b", tmp_path, AgentType.REVIEWER)
+
+        assert coder.split(":")[0] != reviewer.split(":")[0]
+
+    def test_shutdown_by_worktree(self, session_pipeline, tmp_path):
+        """Shutting down a worktree's sessions forces a fresh process."""
+        first, _, _ = self._run(session_pipeline, "one", tmp_path)
+        session_pipeline._worker_pool.shutdown(str(tmp_path))
+        second, _, _ = self._run(session_pipeline, "two", tmp_path)
+
+        assert first.split(":")[0] != second.split(":")[0]
+
+    def test_not_stopped_by_sentinel_mid_turn(self, project, agent_pool, tmp_path):
+        """A sentinel in text followed by a tool call does not end the response."""
+        script = tmp_path / "slow_claude"
+        script.write_text(
+            f"#!{sys.executable}\nimport json, sys, time\n"
+            f"for line in sys.stdin:\n{textwrap.indent(SENTINEL_MID_TURN, '    ')}"
+        )
+        script.chmod(0o755)
+        pipeline = ExecutionPipeline(
+            project, agent_pool, claude_path=str(script), persistent_sessions=True
+        )
+
+        output, session_id, success = self._run(pipeline, "go", tmp_path)
+        again, _, _ = self._run(pipeline, "again", tmp_path)
+        pipeline._worker_pool.shutdown()
+
+        assert success is True
+        assert output == again == "all done"
+        assert session_id == "sess-1"
+
+    def test_claude_not_found(self, project, agent_pool, tmp_path):
+        """A missing CLI is reported the same way as in one-shot mode."""
+        pipeline = ExecutionPipeline(
+            project, agent_pool, claude_path=str(tmp_path / "missing"), persistent_sessions=True
+        )
+        output, session_id, success = self._run(pipeline, "x", tmp_path)
+
+        assert success is False
+        assert "not found" in output
+        assert session_id is None
+
+
 class TestExtractMemories:
     """Tests for _extract_memories method."""
 
@@ -488,7 +772,7 @@ class TestExecuteStage:
         mock_result.stdout = json.dumps({"result": "IMPLEMENTATION COMPLETE"})
         mock_result.stderr = ""
 
-        with patch("subprocess.run", return_value=mock_result):
+        with patch_claude(mock_result):
             result = pipeline._execute_stage(sample_task, stage, worktree_path, 1)
 
             assert result.success is True
@@ -505,7 +789,7 @@ class TestExecuteStage:
         mock_result.stdout = "REVIEW FAILED: Code quality issues"
         mock_result.stderr = ""
 
-        with patch("subprocess.run", return_value=mock_result):
+        with patch_claude(mock_result):
             result = pipeline._execute_stage(sample_task, stage, worktree_path, 1)
 
             assert result.success is False
@@ -528,7 +812,7 @@ class TestExecuteTask:
             result.stderr = ""
             return result
 
-        with patch("subprocess.run", side_effect=mock_run):
+        with patch_claude(side_effect=mock_run):
             success = pipeline.execute_task(sample_task, worktree_path)
 
         assert success is True
@@ -549,7 +833,7 @@ class TestExecuteTask:
             result.stderr = ""
             return result
 
-        with patch("subprocess.run", side_effect=mock_run):
+        with patch_claude(side_effect=mock_run):
             success = pipeline.execute_task(sample_task, worktree_path)
 
         assert success is False
@@ -592,7 +876,7 @@ class TestExecuteTask:
             result.stderr = ""
             return result
 
-        with patch("subprocess.run", side_effect=mock_run):
+        with patch_claude(side_effect=mock_run):
             pipeline.execute_task(sample_task, worktree_path)
 
         # Each stage should claim and release a slot
@@ -611,13 +895,77 @@ class TestExecuteTask:
             result.stderr = ""
             return result
 
-        with patch("subprocess.run", side_effect=mock_run):
+        with patch_claude(side_effect=mock_run):
             pipeline.execute_task(sample_task, worktree_path)
 
         # Check execution logs were created
         logs = pipeline.project.db.get_execution_logs(sample_task.id)
         assert len(logs) == 4  # One for each stage
 
+    def test_execute_task_writes_task_once_per_stage(self, pipeline, sample_task, tmp_path):
+        """Iteration bumps are persisted at stage boundaries, not per iteration."""
+        worktree_path = tmp_path / "worktree"
+        worktree_path.mkdir()
+
+        def mock_run(*args, **kwargs):
+            result = MagicMock()
+            result.returncode = 0
+            result.stdout = "PASS"
+            result.stderr = ""
+            return result
+
+        db = pipeline.project.db
+        with (
+            patch_claude(side_effect=mock_run),
+            patch.object(db, "update_task", wraps=db.update_task) as mock_update,
+        ):
+            pipeline.execute_task(sample_task, worktree_path)
+
+        # One status write per stage plus the final DONE write
+        assert mock_update.call_count == 5
+        stored = db.get_task(sample_task.id)
+        assert stored.iteration == 4
+        assert stored.status == TaskStatus.DONE
+
+
+class TestLogWriter:
+    """Tests for the background execution log writer."""
+
+    def _log(self, task_id="T-1"):
+        return ExecutionLog(
+            id=0,
+            task_id=task_id,
+            agent_type="coder",
+            action="run",
+            output="out",
+            success=True,
+            duration_ms=1,
+            created_at=datetime.now(),
+        )
+
+    def test_flush_writes_queued_entries(self, project):
+        writer = _LogWriter(project.db, max_wait=5)
+        for _ in range(3):
+            writer.put(self._log())
+
+        writer.flush()
+
+        assert len(project.db.get_execution_logs("T-1")) == 3
+
+    def test_flush_without_entries_is_noop(self, project):
+        writer = _LogWriter(project.db)
+        writer.flush()
+        assert project.db.get_execution_logs("T-1") == []
+
+    def test_full_queue_drops_entries(self, project):
+        writer = _LogWriter(project.db, max_queued=1)
+        with patch.object(writer, "_ensure_started"):
+            writer.put(self._log())
+            with patch("claudecraft.orchestration.execution.logger.warning") as mock_warning:
+                writer.put(self._log())
+
+        mock_warning.assert_called_once()
+
 
 class TestCheckStageSuccess:
     """Additional tests for _check_stage_success."""
@@ -649,6 +997,11 @@ class TestCheckStageSuccess:
         for output in failure_outputs:
             assert pipeline._check_stage_success(None, output) is False, f"Failed for: {output}"
 
+    def test_last_indicator_wins(self, pipeline):
+        """The final verdict decides when both kinds of indicator appear."""
+        assert pipeline._check_stage_success(None, "TESTS FAILED: 2\nFixed.\nTESTS PASSED") is True
+        assert pipeline._check_stage_success(None, "QA PASSED\nERROR: lint broke") is False
+
     def test_ambiguous_output_substantial(self, pipeline):
         """Test that substantial output without errors is considered success."""
         output = "x" * 200  # More than 100 chars, no 'error' word
@@ -895,7 +1248,7 @@ class TestExecuteStageWithRalph:
             result.stderr = ""
             return result
 
-        with patch("subprocess.run", side_effect=mock_run):
+        with patch_claude(side_effect=mock_run):
             result = pipeline.execute_stage_with_ralph(sample_task_with_spec, stage, worktree_path)
 
         assert result.success is True
@@ -919,11 +1272,42 @@ class TestExecuteStageWithRalph:
             result.stderr = ""
             return result
 
-        with patch("subprocess.run", side_effect=mock_run):
+        with patch_claude(side_effect=mock_run):
             result = pipeline.execute_stage_with_ralph(sample_task_with_spec, stage, worktree_path)
 
         assert result.success is False
         assert result.ralph_iterations == 2
+        assert result.output == "Still working on it..."
+        assert result.output_log.read_text().count("Still working on it...\n---\n") == 2
+
+    def test_base_prompt_built_once_per_stage(self, pipeline, sample_task_with_spec, tmp_path):
+        """The static base prompt is reused across Ralph iterations."""
+        stage = PipelineStage("Implementation", AgentType.CODER)
+        worktree_path = tmp_path / "worktree"
+        worktree_path.mkdir()
+        pipeline.ralph_config = RalphLoopConfig(enabled=True, max_iterations=3)
+
+        def mock_run(*args, **kwargs):
+            result = MagicMock()
+            result.returncode = 0
+            result.stdout = "Still working on it..."
+            result.stderr = ""
+            return result
+
+        with (
+            patch_claude(side_effect=mock_run) as mock_subprocess,
+            patch.object(
+                pipeline, "_build_agent_prompt", wraps=pipeline._build_agent_prompt
+            ) as mock_build,
+        ):
+            pipeline.execute_stage_with_ralph(sample_task_with_spec, stage, worktree_path)
+
+        assert mock_subprocess.call_count == 3
+        mock_build.assert_called_once()
+        prompt = mock_subprocess.call_args[0][0][2]
+        # Only the Ralph section reports the iteration
+        assert prompt.count("- **Iteration**:") == 1
+        assert "3/3" in prompt
 
     def test_execute_fallback_when_ralph_disabled(self, pipeline, sample_task_with_spec, tmp_path):
         """Test fallback to regular execution when Ralph disabled."""
@@ -940,7 +1324,7 @@ class TestExecuteStageWithRalph:
             result.stderr = ""
             return result
 
-        with patch("subprocess.run", side_effect=mock_run):
+        with patch_claude(side_effect=mock_run):
             result = pipeline.execute_stage_with_ralph(sample_task_with_spec, stage, worktree_path)
 
         # Should succeed via regular execution
@@ -964,7 +1348,7 @@ class TestExecuteStageWithRalph:
 
         with (
             patch.object(pipeline.project.db, "save_ralph_loop") as mock_save,
-            patch("subprocess.run", side_effect=mock_run),
+            patch_claude(side_effect=mock_run),
         ):
             result = pipeline.execute_stage_with_ralph(sample_task_with_spec, stage, worktree_path)
 
@@ -997,7 +1381,7 @@ class TestExecuteStageWithRalph:
 
         with (
             patch.object(pipeline.project.db, "get_ralph_loop", return_value=cancelled_loop),
-            patch("subprocess.run") as mock_run,
+            patch("subprocess.Popen") as mock_run,
         ):
             result = pipeline.execute_stage_with_ralph(sample_task_with_spec, stage, worktree_path)
 
@@ -1046,7 +1430,7 @@ class TestRalphPersistenceHelpers:
             result.stderr = ""
             return result
 
-        with patch("subprocess.run", side_effect=mock_run):
+        with patch_claude(side_effect=mock_run):
             result = pipeline.execute_stage_with_ralph(sample_task_with_spec, stage, worktree_path)
 
         assert result.success is True
@@ -1098,7 +1482,7 @@ class TestExecuteTaskWithRalph:
             result.stderr = ""
             return result
 
-        with patch("subprocess.run", side_effect=mock_run):
+        with patch_claude(side_effect=mock_run):
             success = pipeline.execute_task(sample_task_with_spec, worktree_path)
 
         assert success is True
@@ -1117,7 +1501,7 @@ class TestExecuteTaskWithRalph:
             result.stderr = ""
             return result
 
-        with patch("subprocess.run", side_effect=mock_run):
+        with patch_claude(side_effect=mock_run):
             # Disable Ralph via parameter
             success = pipeline.execute_task(sample_task_with_spec, worktree_path, use_ralph=False)
 
@@ -1141,7 +1525,7 @@ class TestExecuteTaskWithRalph:
 
         with (
             patch("claudecraft.orchestration.execution.logger.warning") as mock_warning,
-            patch("subprocess.run", side_effect=mock_run),
+            patch_claude(side_effect=mock_run),
         ):
             success = pipeline.execute_task(sample_task, worktree_path)
 
@@ -1166,7 +1550,7 @@ class TestExecuteTaskWithRalph:
             result.stderr = ""
             return result
 
-        with patch("subprocess.run", side_effect=mock_run):
+        with patch_claude(side_effect=mock_run):
             success = pipeline.execute_task(sample_task_with_spec, worktree_path)
 
         assert success is False
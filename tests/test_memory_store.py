@@ -23,7 +23,7 @@ def test_memory_store_creation(store, memory_dir):
     """Test memory store initialization."""
     assert store.memory_dir == memory_dir
     assert memory_dir.exists()
-    assert store.entities_file == memory_dir / "entities.json"
+    assert store.entities_file == memory_dir / "entities.jsonl"
 
 
 def test_entity_creation():
@@ -314,6 +314,19 @@ def test_get_context_for_spec(store):
     assert len(context) > 0
 
 
+def test_get_context_for_spec_ranks_spec_entities_first(store):
+    """Test spec entities come before general ones and other specs are excluded."""
+    store.add_memory("note", "general", "General note", relevance=5.0)
+    store.add_memory("note", "mine", "Spec note", spec_id="spec-1", relevance=1.0)
+    store.add_memory("note", "theirs", "Other spec note", spec_id="spec-2", relevance=9.0)
+
+    context = store.get_context_for_spec("spec-1")
+
+    assert context.index("Spec note") < context.index("General note")
+    assert "Other spec note" not in context
+    assert [e.name for e in store.get_entities_for_spec("spec-1")] == ["mine"]
+
+
 def test_get_context_empty_store(store):
     """Test getting context from empty store."""
     context = store.get_context_for_spec("spec-1")
@@ -359,6 +372,17 @@ def test_cleanup_old_entities(store):
     assert "old" not in store.entities
 
 
+def test_cleanup_without_stale_entities_does_not_rewrite(store):
+    """Test a cleanup that removes nothing leaves the log file alone."""
+    store.add_memory("file", "new.py", "New")
+    revision = store.revision
+    before = store.entities_file.stat().st_mtime_ns
+
+    assert store.cleanup_old_entities(days=90) == 0
+    assert store.revision == revision
+    assert store.entities_file.stat().st_mtime_ns == before
+
+
 def test_get_stats(store):
     """Test getting memory store statistics."""
     # Add entities
@@ -394,6 +418,29 @@ def test_get_stats(store):
     assert "newest_entity" in stats
 
 
+def test_get_stats_follows_cleanup(store):
+    """Test cached stats are refreshed after entities are removed."""
+    old_date = datetime.now() - timedelta(days=100)
+    store.entities["old"] = Entity(
+        id="old",
+        type="decision",
+        name="old",
+        description="Old",
+        context={},
+        created_at=old_date,
+        updated_at=old_date,
+    )
+    store._save()
+    store.add_memory("file", "new.py", "New")
+    assert store.get_stats()["oldest_entity"] == old_date.isoformat()
+
+    store.cleanup_old_entities(days=90)
+    stats = store.get_stats()
+
+    assert stats["by_type"] == {"file": 1}
+    assert stats["oldest_entity"] == stats["newest_entity"]
+
+
 def test_get_stats_empty_store(store):
     """Test getting stats from empty store."""
     stats = store.get_stats()
@@ -448,3 +495,142 @@ def test_entity_update(store):
     # Should be updated
     assert store.entities["test"].description == "Updated"
     assert store.entities["test"].updated_at > original_updated
+
+
+def test_add_appends_to_jsonl_log(store):
+    """Test each add appends a line and the last line for an id wins."""
+    entity = Entity(
+        id="test",
+        type="file",
+        name="test.py",
+        description="Original",
+        context={},
+        created_at=datetime.now(),
+        updated_at=datetime.now(),
+    )
+    store.add_entity(entity)
+    entity.description = "Updated"
+    store.add_entity(entity)
+
+    assert len(store.entities_file.read_text().splitlines()) == 2
+    assert MemoryStore(store.memory_dir).entities["test"].description == "Updated"
+
+    store.compact()
+    assert len(store.entities_file.read_text().splitlines()) == 1
+
+
+def test_extract_writes_once(store, monkeypatch):
+    """Test extraction persists all new entities with a single append."""
+    appends = []
+    original = store._append
+    monkeypatch.setattr(store, "_append", lambda entities: appends.append(1) or original(entities))
+
+    text = "See main.py and utils.py here\nDecision: use the repository layer for storage"
+    entities = store.extract_from_text(text, "test")
+
+    assert len(entities) >= 3
+    assert appends == [1]
+    assert len(MemoryStore(store.memory_dir).entities) == len(store.entities)
+
+
+def test_extract_skips_known_and_repeated_ids(store):
+    """Test only ids new to the store are returned, once each, in text order."""
+    store.extract_from_text("See main.py here", "first")
+
+    entities = store.extract_from_text("See main.py and app.py then app.py again", "second")
+
+    assert [e.id for e in entities] == ["file:app.py"]
+    assert store.entities["file:main.py"].description == "File referenced in first"
+
+
+def test_load_migrates_legacy_json(memory_dir):
+    """Test an entities.json array from older versions is imported as JSONL."""
+    import json
+
+    memory_dir.mkdir(parents=True)
+    legacy = {
+        "id": "legacy",
+        "type": "note",
+        "name": "Old note",
+        "description": "From entities.json",
+        "context": {},
+        "created_at": "2024-01-01T12:00:00",
+        "updated_at": "2024-01-01T12:00:00",
+        "relevance_score": 1.0,
+    }
+    (memory_dir / "entities.json").write_text(json.dumps([legacy]))
+
+    store = MemoryStore(memory_dir)
+
+    assert store.entities["legacy"].description == "From entities.json"
+    assert store.entities_file.exists()
+    assert "legacy" in MemoryStore(memory_dir).entities
+
+
+def test_load_skips_torn_line(store):
+    """Test a partial trailing line does not discard the rest of the log."""
+    store.add_memory("note", "Kept", "A note that was fully written")
+    with open(store.entities_file, "a") as f:
+        f.write('{"id": "torn", "ty')
+
+    assert len(MemoryStore(store.memory_dir).entities) == 1
+
+
+def test_load_large_log(store):
+    """Test a log above the mmap threshold loads every entity, torn tail included."""
+    from claudecraft.memory.store import _MMAP_THRESHOLD
+
+    store.add_entities(
+        Entity(
+            id=f"note:{i}",
+            type="note",
+            name=f"note {i}",
+            description="x" * 200,
+            context={},
+            created_at=datetime.now(),
+            updated_at=datetime.now(),
+        )
+        for i in range(500)
+    )
+    with open(store.entities_file, "a") as f:
+        f.write('{"id": "torn", "ty')
+    assert store.entities_file.stat().st_size > _MMAP_THRESHOLD
+
+    assert len(MemoryStore(store.memory_dir).entities) == 500
+
+
+def test_entity_ids_stable_across_processes(store):
+    """Test derived ids do not depend on the per-process hash seed."""
+    import os
+    import subprocess
+    import sys
+
+    entity = store.add_memory("decision", "Use JSONL", "Append-only memory log")
+    code = (
+        "from claudecraft.memory.store import MemoryStore; import sys; "
+        "print(MemoryStore(__import__('pathlib').Path(sys.argv[1]))"
+        ".add_memory('decision', 'Use JSONL', 'Append-only memory log').id)"
+    )
+    env = {**os.environ, "PYTHONHASHSEED": "12345"}
+    other = subprocess.run(
+        [sys.executable, "-c", code, str(store.memory_dir / "other")],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    assert other.stdout.strip() == entity.id
+
+
+def test_search_index_follows_updates(store):
+    """Test search sees entities added and changed after an earlier search."""
+    store.add_memory("note", "Alpha", "first note")
+    assert [e.name for e in store.search_entities(keyword="alpha")] == ["Alpha"]
+
+    beta = store.add_memory("note", "Beta", "second note")
+    assert len(store.search_entities(entity_type="note")) == 2
+
+    beta.description = "renamed alpha"
+    store.add_entity(beta)
+    assert {e.name for e in store.search_entities(keyword="alpha")} == {"Alpha", "Beta"}
+    assert store.search_entities(entity_type="missing") == []
@@ -5,6 +5,8 @@ import pytest
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 from git import Repo
+from git.cmd import Git
+from git.exc import GitCommandError, InvalidGitRepositoryError
 
 from claudecraft.orchestration.merge import (
     MergeOrchestrator,
@@ -12,6 +14,12 @@ from claudecraft.orchestration.merge import (
     GitAutoMerge,
     ConflictOnlyAIMerge,
     FullFileAIMerge,
+    _CONFLICT_MARKER_RE,
+    _branch_exists,
+    _checkout,
+    _conflicted_files,
+    _predict_conflicts,
+    _strip_code_fence,
 )
 
 
@@ -276,6 +284,24 @@ class TestConflictOnlyAIMerge:
         assert strategy.claude_path == "/custom/path"
         assert strategy.timeout == 600
 
+    def test_claude_path_resolved_once(self, tmp_path):
+        """Test the CLI is looked up on PATH at init and exec'd by absolute path."""
+        import shutil
+
+        strategy = ConflictOnlyAIMerge(claude_path="sh")
+        assert strategy.claude_path == "sh"
+        assert strategy._claude_executable == shutil.which("sh")
+
+        mock_result = MagicMock(
+            returncode=0, stdout=json.dumps({"result": "ok"}).encode(), stderr=b""
+        )
+        with patch("subprocess.run", return_value=mock_result) as mock_run:
+            strategy._run_claude_resolution("prompt", tmp_path)
+        assert mock_run.call_args.args[0][0] == shutil.which("sh")
+
+        missing = ConflictOnlyAIMerge(claude_path="no-such-claude-cli")
+        assert missing._claude_executable == "no-such-claude-cli"
+
     def test_resolve_file_no_conflict_markers(self, tmp_path):
         """Test resolving a file without conflict markers."""
         strategy = ConflictOnlyAIMerge()
@@ -306,8 +332,8 @@ def new_function():
 
         mock_result = MagicMock()
         mock_result.returncode = 0
-        mock_result.stdout = json.dumps({"result": resolved_content})
-        mock_result.stderr = ""
+        mock_result.stdout = json.dumps({"result": resolved_content}).encode()
+        mock_result.stderr = b""
 
         with patch("subprocess.run", return_value=mock_result):
             success, error = strategy._resolve_file_conflicts(test_file, "source", "target")
@@ -326,8 +352,8 @@ def new_function():
         # Mock Claude to return content with conflict markers
         mock_result = MagicMock()
         mock_result.returncode = 0
-        mock_result.stdout = json.dumps({"result": "<<<<<<< still has markers"})
-        mock_result.stderr = ""
+        mock_result.stdout = json.dumps({"result": "<<<<<<< still has markers"}).encode()
+        mock_result.stderr = b""
 
         with patch("subprocess.run", return_value=mock_result):
             success, error = strategy._resolve_file_conflicts(test_file, "source", "target")
@@ -341,14 +367,17 @@ def new_function():
 
         mock_result = MagicMock()
         mock_result.returncode = 0
-        mock_result.stdout = json.dumps({"result": "resolved content"})
-        mock_result.stderr = ""
+        mock_result.stdout = json.dumps({"result": "resolved content"}).encode()
+        mock_result.stderr = b""
 
-        with patch("subprocess.run", return_value=mock_result):
+        with patch("subprocess.run", return_value=mock_result) as mock_run:
             content, error = strategy._run_claude_resolution("prompt", tmp_path)
 
         assert content == "resolved content"
         assert error is None
+        # The prompt is piped through stdin, never placed on the command line
+        assert mock_run.call_args.kwargs["input"] == b"prompt"
+        assert "prompt" not in mock_run.call_args.args[0]
 
     def test_run_claude_resolution_timeout(self, tmp_path):
         """Test Claude resolution timeout."""
@@ -377,8 +406,8 @@ def new_function():
 
         mock_result = MagicMock()
         mock_result.returncode = 1
-        mock_result.stdout = ""
-        mock_result.stderr = "Error from Claude"
+        mock_result.stdout = b""
+        mock_result.stderr = b"Error from Claude"
 
         with patch("subprocess.run", return_value=mock_result):
             content, error = strategy._run_claude_resolution("prompt", tmp_path)
@@ -392,8 +421,8 @@ def new_function():
 
         mock_result = MagicMock()
         mock_result.returncode = 0
-        mock_result.stdout = "```python\ndef foo():\n    pass\n```"
-        mock_result.stderr = ""
+        mock_result.stdout = b"```python\ndef foo():\n    pass\n```"
+        mock_result.stderr = b""
 
         with patch("subprocess.run", return_value=mock_result):
             content, error = strategy._run_claude_resolution("prompt", tmp_path)
@@ -421,6 +450,18 @@ class TestFullFileAIMerge:
         assert content is not None
         assert "Test Repository" in content
 
+    def test_get_file_from_branch_reuses_git_process(self, git_repo):
+        """Test repeated lookups, misses included, do not spawn new git processes."""
+        repo = Repo(git_repo)
+        strategy = FullFileAIMerge()
+        assert strategy._get_file_from_branch(repo, "main", "README.md") is not None
+
+        with patch("git.cmd.Git.execute", side_effect=AssertionError("git spawned")):
+            assert strategy._get_file_from_branch(repo, "main", "missing.txt") is None
+            content = strategy._get_file_from_branch(repo, "main", "README.md")
+
+        assert content == "# Test Repository"
+
     def test_get_file_from_branch_nonexistent(self, git_repo):
         """Test getting nonexistent file."""
         repo = Repo(git_repo)
@@ -445,6 +486,26 @@ class TestFullFileAIMerge:
         assert success is True
         assert test_file.read_text() == "# Source content"
 
+    def test_regenerate_file_keeps_identical_file(self, tmp_path):
+        """Test a file already holding the kept version is not rewritten."""
+        import os
+
+        strategy = FullFileAIMerge()
+        test_file = tmp_path / "kept.py"
+        test_file.write_text("# Target content")
+        os.utime(test_file, ns=(1_000_000_000, 1_000_000_000))
+
+        success, _ = strategy._regenerate_file(
+            test_file, "kept.py",
+            source_content=None,
+            target_content="# Target content",
+            source_branch="source",
+            target_branch="target"
+        )
+
+        assert success is True
+        assert test_file.stat().st_mtime_ns == 1_000_000_000
+
     def test_regenerate_file_only_target(self, tmp_path):
         """Test regenerating file that only exists in target."""
         strategy = FullFileAIMerge()
@@ -470,8 +531,8 @@ class TestFullFileAIMerge:
 
         mock_result = MagicMock()
         mock_result.returncode = 0
-        mock_result.stdout = json.dumps({"result": merged_content})
-        mock_result.stderr = ""
+        mock_result.stdout = json.dumps({"result": merged_content}).encode()
+        mock_result.stderr = b""
 
         with patch("subprocess.run", return_value=mock_result):
             success, error = strategy._regenerate_file(
@@ -541,6 +602,13 @@ class TestMergeOrchestrator:
         assert orchestrator.claude_path == "/custom/claude"
         assert orchestrator.timeout == 600
 
+    def test_repo_opened_on_first_use(self, tmp_path):
+        """Test constructing the orchestrator does not open the repository."""
+        orchestrator = MergeOrchestrator(tmp_path)
+
+        with pytest.raises(InvalidGitRepositoryError):
+            _ = orchestrator.repo
+
     def test_merge_status_with_no_merge_in_progress(self, orchestrator):
         """Test merge status when no merge is in progress."""
         status = orchestrator.get_merge_status()
@@ -548,6 +616,20 @@ class TestMergeOrchestrator:
         assert status["in_progress"] is False
         assert "current_branch" in status
 
+    def test_merge_status_in_linked_worktree(self, git_repo, tmp_path):
+        """Test MERGE_HEAD is looked up in a worktree's own git dir."""
+        worktree = tmp_path / "wt"
+        Repo(git_repo).git.worktree("add", "-b", "task/wt", str(worktree))
+        orchestrator = MergeOrchestrator(worktree)
+        assert orchestrator.get_merge_status()["in_progress"] is False
+
+        head = Repo(worktree).head.commit.hexsha
+        (Path(Repo(worktree).git_dir) / "MERGE_HEAD").write_text(head + "\n")
+        status = orchestrator.get_merge_status()
+
+        assert status["in_progress"] is True
+        assert status["current_branch"] == "task/wt"
+
     def test_get_merge_status_error_handling(self, tmp_path):
         """Test merge status error handling with invalid repo."""
         # Create an invalid repo scenario by modifying after creation
@@ -560,3 +642,196 @@ class TestMergeOrchestrator:
         status = orchestrator.get_merge_status()
         # Either returns valid status or error dict
         assert isinstance(status, dict)
+
+
+def test_conflicted_files_lists_unmerged_paths(git_repo):
+    """Test unmerged paths come back verbatim, including spaces."""
+    repo = Repo(git_repo)
+    repo_path = git_repo
+    conflict_file = repo_path / "my notes.md"
+    conflict_file.write_text("base\n")
+    repo.index.add([str(conflict_file)])
+    repo.index.commit("Add notes")
+
+    repo.git.checkout("-b", "feature")
+    conflict_file.write_text("feature\n")
+    repo.index.add([str(conflict_file)])
+    repo.index.commit("Feature change")
+
+    repo.git.checkout("main")
+    conflict_file.write_text("main\n")
+    repo.index.add([str(conflict_file)])
+    repo.index.commit("Main change")
+
+    assert _conflicted_files(repo) == []
+    with pytest.raises(GitCommandError):
+        repo.git.merge("feature", "--no-ff")
+    try:
+        assert _conflicted_files(repo) == ["my notes.md"]
+    finally:
+        repo.git.merge("--abort")
+
+
+def test_branch_checks_do_not_spawn_git(git_repo):
+    """Test branch lookup and same-branch checkout read .git directly."""
+    repo = Repo(git_repo)
+    repo.git.branch("task/one")
+
+    with patch("git.cmd.Git.execute", side_effect=AssertionError("git spawned")):
+        assert _branch_exists(repo, "task/one")
+        assert not _branch_exists(repo, "task/missing")
+        _checkout(repo, "main")
+
+    _checkout(repo, "task/one")
+    assert repo.active_branch.name == "task/one"
+
+
+def test_conflict_only_merge_resolves_files_concurrently(git_repo):
+    """Test conflicted files are resolved in parallel and staged together."""
+    import threading
+
+    repo = Repo(git_repo)
+    names = ["a.txt", "b.txt"]
+    for name in names:
+        (git_repo / name).write_text("base\n")
+    repo.index.add(names)
+    repo.index.commit("Add files")
+
+    repo.git.checkout("-b", "feature")
+    for name in names:
+        (git_repo / name).write_text("feature\n")
+    repo.index.add(names)
+    repo.index.commit("Feature change")
+
+    repo.git.checkout("main")
+    for name in names:
+        (git_repo / name).write_text("main\n")
+    repo.index.add(names)
+    repo.index.commit("Main change")
+
+    # Both resolutions must be in flight at once to get past the barrier
+    barrier = threading.Barrier(len(names), timeout=5)
+
+    def resolve(full_path, source_branch, target_branch):
+        barrier.wait()
+        full_path.write_text("resolved\n")
+        return True, ""
+
+    # Record every git add command line
+    adds = []
+    real_execute = Git.execute
+
+    def execute(self, command, *args, **kwargs):
+        if command[1:2] == ["add"]:
+            adds.append(command[2:])
+        return real_execute(self, command, *args, **kwargs)
+
+    strategy = ConflictOnlyAIMerge()
+    with (
+        patch.object(strategy, "_resolve_file_conflicts", side_effect=resolve),
+        patch.object(Git, "execute", execute),
+    ):
+        success, message = strategy.merge(repo, "feature", "main")
+
+    assert success, message
+    assert all((git_repo / name).read_text() == "resolved\n" for name in names)
+    assert not repo.is_dirty()
+    # All resolved files are staged with one git process
+    assert adds == [["--", *names]]
+
+
+def test_conflict_marker_regex_matches_marker_lines_only():
+    """Test each git marker line is caught, but not marker text mid-line."""
+    assert _CONFLICT_MARKER_RE.search("a\n<<<<<<< HEAD\nb")
+    assert _CONFLICT_MARKER_RE.search("a\n=======\nb")
+    assert _CONFLICT_MARKER_RE.search("a\r\n=======\r\nb")
+    assert _CONFLICT_MARKER_RE.search("a\n>>>>>>> feature")
+    assert not _CONFLICT_MARKER_RE.search('SEPARATOR = "======="\n# <<<<<<< quoted')
+
+
+def test_strip_code_fence_unwraps_only_fenced_output():
+    """Test a fenced body is unwrapped and anything else is only trimmed."""
+    assert _strip_code_fence("\n```python\na = 1\n\nb = 2\n```\n") == "a = 1\n\nb = 2"
+    assert _strip_code_fence("```\n```") == "```\n```"
+    assert _strip_code_fence("  a = 1\n") == "a = 1"
+    assert _strip_code_fence("a = '```'\n```") == "a = '```'\n```"
+
+
+def test_merge_task_skips_auto_merge_when_conflicts_predicted(git_repo, orchestrator):
+    """Test a branch that merge-tree shows conflicting goes straight to tier 2."""
+    repo = Repo(git_repo)
+    readme = git_repo / "README.md"
+    repo.git.checkout("-b", "task/clash")
+    readme.write_text("task\n")
+    repo.index.add([str(readme)])
+    repo.index.commit("Task change")
+    repo.git.checkout("-b", "task/clean", "main")
+    (git_repo / "other.txt").write_text("other\n")
+    repo.index.add([str(git_repo / "other.txt")])
+    repo.index.commit("Clean change")
+    repo.git.checkout("main")
+    readme.write_text("main\n")
+    repo.index.add([str(readme)])
+    repo.index.commit("Main change")
+
+    assert _predict_conflicts(repo, "task/clash", "main") is True
+    assert _predict_conflicts(repo, "task/clean", "main") is False
+    assert _predict_conflicts(repo, "task/missing", "main") is None
+
+    auto, ai = MagicMock(), MagicMock()
+    ai.merge.return_value = (True, "resolved")
+    orchestrator.strategies = [("Auto-merge", GitAutoMerge()), ("AI", ai)]
+    with patch.object(GitAutoMerge, "merge", auto):
+        success, _ = orchestrator.merge_task("clash", "main")
+
+    assert success
+    auto.assert_not_called()
+    ai.merge.assert_called_once()
+
+
+def test_conflict_only_merge_persistent_session_spawns_once(git_repo, tmp_path):
+    """Test one Claude process serves every conflicted file of a merge.
+
+    Resolved content containing a stage sentinel must not end the session.
+    """
+    import stat
+    import sys
+
+    spawns = tmp_path / "spawns"
+    fake_claude = tmp_path / "claude"
+    fake_claude.write_text(
+        f"#!{sys.executable}\n"
+        "import json, sys\n"
+        f"open({str(spawns)!r}, 'a').write('x')\n"
+        "text = 'STATUS = \"TESTS PASSED\"'\n"
+        "message = {'content': [{'type': 'text', 'text': text}]}\n"
+        "for line in sys.stdin:\n"
+        "    print(json.dumps({'type': 'assistant', 'message': message}), flush=True)\n"
+        "    print(json.dumps({'type': 'result', 'result': text}), flush=True)\n"
+    )
+    fake_claude.chmod(fake_claude.stat().st_mode | stat.S_IXUSR)
+
+    repo = Repo(git_repo)
+    names = ["a.txt", "b.txt", "c.txt"]
+
+    def commit_all(text, message):
+        for name in names:
+            (git_repo / name).write_text(text)
+        repo.index.add(names)
+        repo.index.commit(message)
+
+    commit_all("base\n", "Add files")
+    repo.git.checkout("-b", "feature")
+    commit_all("feature\n", "Feature change")
+    repo.git.checkout("main")
+    commit_all("main\n", "Main change")
+
+    strategy = ConflictOnlyAIMerge(str(fake_claude), timeout=30, persistent_sessions=True)
+    with patch("claudecraft.orchestration.merge._AI_MERGE_WORKERS", 1):
+        success, message = strategy.merge(repo, "feature", "main")
+
+    assert success, message
+    assert all(
+        (git_repo / name).read_text() == 'STATUS = "TESTS PASSED"' for name in names
+    )
+    assert spawns.read_text() == "x"
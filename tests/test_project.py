@@ -112,3 +112,175 @@ class TestProject:
         assert "Custom Constitution" in constitution.read_text()
 
         project2.close()
+
+    def test_import_tasks_from_md(self, temp_project):
+        """Test importing tasks parses every field from tasks.md."""
+        spec_dir = temp_project.ensure_spec_dir("feature-001")
+        (spec_dir / "tasks.md").write_text(
+            "# Tasks\n\n"
+            "### Task: TASK-001\n"
+            "- **Title**: Set up models\n"
+            "- **Description**: Create the data models\n"
+            "- **Priority**: 8\n"
+            "- **Dependencies**: []\n"
+            "- **Assignee**: coder\n\n"
+            "### Task: TASK-002\n"
+            "- **Title**: Wire up API\n"
+            "- **Dependencies**: [TASK-001]\n"
+        )
+
+        assert temp_project.import_tasks_from_md("feature-001") == 2
+
+        first = temp_project.db.get_task("TASK-001", spec_id="feature-001")
+        assert first.title == "Set up models"
+        assert first.description == "Create the data models"
+        assert first.priority == 8
+        assert first.dependencies == []
+        assert first.assignee == "coder"
+
+        second = temp_project.db.get_task("TASK-002", spec_id="feature-001")
+        assert second.title == "Wire up API"
+        assert second.description == ""
+        assert second.priority == 5
+        assert second.dependencies == ["TASK-001"]
+        assert second.assignee is None
+
+        # Re-importing skips tasks that already exist
+        assert temp_project.import_tasks_from_md("feature-001") == 0
+
+    def test_scan_and_register_specs(self, temp_project):
+        """Test scanning registers only unregistered specs with a spec.md."""
+        spec_dir = temp_project.ensure_spec_dir("feature-001")
+        (spec_dir / "spec.md").write_text("# Login Flow\n\nDetails\n")
+        (spec_dir / "prd.md").write_text("PRD\n")
+        temp_project.ensure_spec_dir("feature-002")  # no spec.md
+
+        assert temp_project.scan_and_register_specs() == 1
+
+        spec = temp_project.db.get_spec("feature-001")
+        assert spec.title == "Login Flow"
+        assert spec.source_type == "prd"
+        assert temp_project.db.get_spec("feature-002") is None
+
+        # Already registered specs are skipped
+        assert temp_project.scan_and_register_specs() == 0
+
+    def test_update_templates_refreshes_modified_files(self, temp_dir):
+        """Test update_templates rewrites templates that differ from the package."""
+        Project.init(temp_dir).close()
+        hook = temp_dir / ".claude" / "hooks" / "scripts" / "stop-check.py"
+        original = hook.read_text()
+        hook.write_text("# locally modified\n")
+
+        Project.init(temp_dir).close()
+        assert hook.read_text() == "# locally modified\n"
+
+        Project.init(temp_dir, update_templates=True).close()
+        assert hook.read_text() == original
+
+
+def test_copy_template_file_applies_mode(temp_dir):
+    """Test the requested mode is set on fresh copies and on skipped ones."""
+    import os
+    import stat
+
+    from claudecraft.core.project import _copy_template_file
+
+    src = temp_dir / "hook.sh"
+    dst = temp_dir / "copy.sh"
+    src.write_text("#!/bin/sh\n")
+    src.chmod(0o644)
+
+    _copy_template_file(src, dst, dst_exists=False, mode=0o755)
+    assert stat.S_IMODE(os.stat(dst).st_mode) == 0o755
+
+    # Up to date, so not copied again, but the mode is still restored
+    dst.chmod(0o644)
+    _copy_template_file(src, dst, mode=0o755)
+    assert stat.S_IMODE(os.stat(dst).st_mode) == 0o755
+
+
+def test_walk_files_recurses_into_subdirectories(temp_dir):
+    """Test the template walker yields nested files but not directories."""
+    from claudecraft.core.project import _walk_files
+
+    (temp_dir / "a" / "b").mkdir(parents=True)
+    (temp_dir / "top.md").write_text("top")
+    (temp_dir / "a" / "b" / "nested.md").write_text("nested")
+
+    found = {Path(entry.path).relative_to(temp_dir).as_posix() for entry in _walk_files(temp_dir)}
+    assert found == {"top.md", "a/b/nested.md"}
+
+
+def test_template_category_matches_copied_files():
+    """Test which template paths are copied into .claude/."""
+    import os
+
+    from claudecraft.core.project import _template_category
+
+    def category(rel: str) -> str | None:
+        return _template_category(rel.replace("/", os.sep))
+
+    assert category("agents/claudecraft-coder.md") == "agents"
+    assert category("commands/claudecraft.plan.md") == "commands"
+    assert category("hooks/hooks.json") == "hooks"
+    assert category("hooks/scripts/stop-check.py") == "scripts"
+    assert category("skills/claudecraft/nested/SKILL.md") == "skills"
+    assert category("agents/notes.txt") is None
+    assert category("agents/.hidden.md") is None
+    assert category("agents/sub/deep.md") is None
+    assert category("hooks/scripts/readme.txt") is None
+    assert category("skills/other/SKILL.md") is None
+
+
+def test_make_dirs_creates_ancestors_and_leaves(temp_dir):
+    """Test listed ancestors are satisfied by their descendants' creation."""
+    from claudecraft.core.project import _make_dirs
+
+    _make_dirs([temp_dir / "a", temp_dir / "a" / "b" / "c", temp_dir / "d"])
+
+    assert (temp_dir / "a" / "b" / "c").is_dir()
+    assert (temp_dir / "d").is_dir()
+    # Existing directories are fine
+    _make_dirs([temp_dir / "a"])
+
+
+def test_clone_or_copy_makes_independent_copy(temp_dir):
+    """Test template copies keep mtime and never share the source inode."""
+    import os
+
+    from claudecraft.core.project import _clone_or_copy
+
+    src = temp_dir / "src.md"
+    dst = temp_dir / "dst.md"
+    src.write_text("template")
+    os.utime(src, (1_000_000, 1_000_000))
+
+    _clone_or_copy(src, dst)
+
+    assert dst.read_text() == "template"
+    assert int(dst.stat().st_mtime) == 1_000_000
+    dst.write_text("edited")
+    assert src.read_text() == "template"
+
+
+def test_clone_or_copy_stops_cloning_after_refusal(temp_dir, monkeypatch):
+    """Test an unsupported reflink is tried once, then plain copies are used."""
+    import errno
+    from unittest.mock import MagicMock
+
+    from claudecraft.core import project
+
+    ioctl = MagicMock(side_effect=OSError(errno.EOPNOTSUPP, "not supported"))
+    monkeypatch.setattr(project, "_FICLONE", 0x40049409)
+    monkeypatch.setattr(project, "_ioctl", ioctl)
+    monkeypatch.setattr(project, "_reflink_supported", True)
+
+    for name in ("a.md", "b.md"):
+        src = temp_dir / f"src-{name}"
+        src.write_text(f"template {name}")
+        project._clone_or_copy(src, temp_dir / name)
+        assert (temp_dir / name).read_text() == f"template {name}"
+
+    assert ioctl.call_count == 1
+    assert project._reflink_supported is False
@@ -832,6 +832,21 @@ class TestRalphLoopState:
         assert state.elapsed_seconds >= 0
         assert state.elapsed_seconds < 1
 
+    def test_elapsed_seconds_counts_from_past_start(self):
+        """Test a state created with an earlier started_at includes that time."""
+        from datetime import timedelta
+
+        state = self.create_state()
+        state = RalphLoopState(
+            task_id=state.task_id,
+            agent_type=state.agent_type,
+            iteration=0,
+            max_iterations=10,
+            completion_criteria=state.completion_criteria,
+            started_at=datetime.now() - timedelta(seconds=90),
+        )
+        assert 90 <= state.elapsed_seconds < 91
+
     def test_last_verification_empty(self):
         """Test last_verification when no results."""
         state = self.create_state()
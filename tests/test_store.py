@@ -163,6 +163,14 @@ class TestSpecCRUD:
     def test_list_specs_empty(self, temp_store: FileStore) -> None:
         assert temp_store.list_specs() == []
 
+    def test_list_spec_ids(self, temp_store: FileStore) -> None:
+        temp_store.create_spec(make_spec("spec-1"))
+        temp_store.create_spec(make_spec("spec-2"))
+        # A spec directory without meta.json is not registered
+        (temp_store.specs_dir / "spec-3").mkdir()
+
+        assert temp_store.list_spec_ids() == {"spec-1", "spec-2"}
+
 
 # ---------------------------------------------------------------------------
 # Task CRUD
@@ -190,6 +198,40 @@ class TestTaskCRUD:
         with pytest.raises(ValueError, match="already exists"):
             temp_store.create_task(make_task())
 
+    def test_create_tasks_batch(self, temp_store: FileStore) -> None:
+        temp_store.create_spec(make_spec("spec-1"))
+        temp_store.create_tasks(
+            [
+                make_task("t1", "spec-1", priority=3),
+                make_task("t2", "spec-1", status=TaskStatus.IMPLEMENTING),
+            ]
+        )
+
+        tasks = {t.id: t for t in temp_store.list_tasks("spec-1")}
+        assert set(tasks) == {"t1", "t2"}
+        assert tasks["t1"].priority == 3
+        assert tasks["t2"].status == TaskStatus.IMPLEMENTING
+
+    def test_create_tasks_rejects_duplicate_id(self, temp_store: FileStore) -> None:
+        temp_store.create_spec(make_spec())
+        temp_store.create_task(make_task("t1"))
+
+        with pytest.raises(ValueError, match="already exists"):
+            temp_store.create_tasks([make_task("t0"), make_task("t1")])
+
+        # Tasks written before the duplicate still get their runtime entry
+        assert temp_store.get_task("t0", spec_id="spec-1") is not None
+
+    def test_list_task_ids(self, temp_store: FileStore) -> None:
+        temp_store.create_spec(make_spec("spec-1"))
+        temp_store.create_spec(make_spec("spec-2"))
+        temp_store.create_task(make_task("t1", "spec-1"))
+        temp_store.create_task(make_task("t2", "spec-2"))
+
+        assert temp_store.list_task_ids("spec-1") == {"t1"}
+        assert temp_store.list_task_ids() == {"t1", "t2"}
+        assert temp_store.list_task_ids("missing") == set()
+
     def test_get_task_scans_all_specs(self, temp_store: FileStore) -> None:
         temp_store.create_spec(make_spec("spec-1"))
         temp_store.create_task(make_task("t1", "spec-1"))
@@ -217,6 +259,15 @@ class TestTaskCRUD:
         assert len(todo) == 1
         assert todo[0].id == "t1"
 
+    def test_count_tasks_by_status(self, temp_store: FileStore) -> None:
+        temp_store.create_spec(make_spec("spec-1"))
+        temp_store.create_spec(make_spec("spec-2"))
+        temp_store.create_task(make_task("t1", "spec-1", status=TaskStatus.TODO))
+        temp_store.create_task(make_task("t2", "spec-1", status=TaskStatus.DONE))
+        temp_store.create_task(make_task("t3", "spec-2", status=TaskStatus.DONE))
+
+        assert temp_store.count_tasks_by_status() == {"todo": 1, "done": 2}
+
     def test_update_task_status(self, temp_store: FileStore) -> None:
         temp_store.create_spec(make_spec("spec-1"))
         temp_store.create_task(make_task("t1", "spec-1"))
@@ -394,6 +445,34 @@ class TestExecutionLogs:
         assert len(temp_store.get_execution_logs("t1")) == 1
         assert len(temp_store.get_execution_logs("t2")) == 2
 
+    def test_delete_removes_ralph_output_logs(self, temp_store: FileStore) -> None:
+        ralph_log = temp_store.ralph_output_path("t1", "coder")
+        ralph_log.write_text("iteration output")
+        other_log = temp_store.ralph_output_path("t2", "coder")
+        other_log.write_text("other task")
+
+        temp_store.delete_execution_logs("t1")
+
+        assert not ralph_log.exists()
+        assert other_log.exists()
+
+    def test_append_logs_batch(self, temp_store: FileStore) -> None:
+        temp_store.append_execution_logs(
+            [
+                make_log(task_id="t1", agent_type="coder"),
+                make_log(task_id="t2"),
+                make_log(task_id="t1", agent_type="reviewer"),
+            ]
+        )
+
+        t1_logs = temp_store.get_execution_logs("t1")
+        assert [log.agent_type for log in t1_logs] == ["coder", "reviewer"]
+        assert len(temp_store.get_execution_logs("t2")) == 1
+
+    def test_append_logs_batch_empty(self, temp_store: FileStore) -> None:
+        temp_store.append_execution_logs([])
+        assert temp_store.get_execution_logs("t1") == []
+
 
 # ---------------------------------------------------------------------------
 # Agent Slots